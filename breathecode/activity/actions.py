@@ -0,0 +1,109 @@
+import json
+import logging
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import StudentActivity
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['sync_student_activities']
+
+# entities fetched from Google Cloud Datastore and saved together
+SYNC_BATCH_SIZE = 500
+
+# the workers can save an activity after a newer one was copied, this window is fetched again
+SYNC_LAG = timedelta(minutes=60)
+
+# it's held while the activities are copied, it expires by itself if the worker dies
+SYNC_LOCK_KEY = 'sync_student_activities__lock'
+SYNC_LOCK_TIMEOUT = 60 * 30
+
+
+def _get_student_activity(entity) -> StudentActivity:
+    data = entity.get('data')
+    if data is not None and not isinstance(data, str):
+        data = json.dumps(data)
+
+    day = entity.get('day')
+    try:
+        day = int(day) if day is not None else None
+
+    except (TypeError, ValueError):
+        day = None
+
+    return StudentActivity(datastore_key=str(entity.key.id_or_name),
+                           slug=entity.get('slug'),
+                           cohort=entity.get('cohort'),
+                           academy_id=entity.get('academy_id') or 0,
+                           user_id=entity.get('user_id'),
+                           email=entity.get('email'),
+                           day=day,
+                           data=data,
+                           user_agent=entity.get('user_agent'),
+                           created_at=entity['created_at'])
+
+
+def sync_student_activities(batch_size: int = SYNC_BATCH_SIZE, backfill: bool = False) -> int:
+    """
+    Copy the new entities `student_activity` of Google Cloud Datastore to `StudentActivity`.
+
+    It continues from the last activity copied minus `SYNC_LAG`, to include the activities that arrived
+    late, the entities fetched again are not saved twice. Without activities copied it starts `SYNC_LAG`
+    ago, `backfill` copies all of them instead, like the command `sync_activities`. Just one sync runs at a
+    time, the other ones return 0. It returns how many activities were copied.
+    """
+
+    if not cache.add(SYNC_LOCK_KEY, True, timeout=SYNC_LOCK_TIMEOUT):
+        logger.debug('The activities are being synced by other worker')
+        return 0
+
+    try:
+        return _sync_student_activities(batch_size, backfill)
+
+    finally:
+        cache.delete(SYNC_LOCK_KEY)
+
+
+def _sync_student_activities(batch_size: int, backfill: bool) -> int:
+    from breathecode.services.google_cloud import Datastore
+
+    last_created_at = StudentActivity.objects.order_by('-created_at').values_list('created_at',
+                                                                                  flat=True).first()
+
+    filters = []
+    if last_created_at is not None:
+        filters.append(('created_at', '>=', last_created_at - SYNC_LAG))
+
+    # the full scan is too long for the periodic task
+    elif not backfill:
+        filters.append(('created_at', '>=', timezone.now() - SYNC_LAG))
+
+    datastore = Datastore()
+    cursor = None
+    synced = 0
+
+    while True:
+        entities, cursor = datastore.fetch_page(limit=batch_size,
+                                                cursor=cursor,
+                                                order_by=['created_at'],
+                                                filters=filters,
+                                                kind='student_activity')
+
+        activities = [_get_student_activity(x) for x in entities]
+        saved = set(
+            StudentActivity.objects.filter(datastore_key__in=[x.datastore_key
+                                                              for x in activities]).values_list(
+                                                                  'datastore_key', flat=True))
+
+        activities = [x for x in activities if x.datastore_key not in saved]
+        StudentActivity.objects.bulk_create(activities, ignore_conflicts=True)
+        synced += len(activities)
+
+        if cursor is None:
+            break
+
+    logger.debug(f'{synced} activities were synced')
+    return synced
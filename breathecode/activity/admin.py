@@ -1,3 +1,10 @@
 from django.contrib import admin
+from .models import StudentActivity
 
-# Register your models here.
+
+@admin.register(StudentActivity)
+class StudentActivityAdmin(admin.ModelAdmin):
+    list_display = ('slug', 'user_id', 'email', 'cohort', 'academy_id', 'created_at')
+    list_filter = ['slug', 'academy_id']
+    search_fields = ['email', 'cohort', 'slug']
+    readonly_fields = ('datastore_key', 'synced_at')
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from ...actions import sync_student_activities
+
+
+class Command(BaseCommand):
+    help = ('Copy the new student activities of Google Cloud Datastore to the reports table, all of them the '
+            'first time')
+
+    def handle(self, *args, **options):
+        count = sync_student_activities(backfill=True)
+        print(f'{count} activities were synced')
@@ -0,0 +1,40 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentActivity',
+            fields=[
+                ('id',
+                 models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('datastore_key',
+                 models.CharField(help_text='Id or name of the entity', max_length=100, unique=True)),
+                ('slug', models.CharField(db_index=True, max_length=100)),
+                ('cohort', models.CharField(blank=True,
+                                            db_index=True,
+                                            default=None,
+                                            max_length=150,
+                                            null=True)),
+                ('academy_id', models.IntegerField(db_index=True, default=0)),
+                ('user_id', models.IntegerField(blank=True, db_index=True, default=None, null=True)),
+                ('email', models.CharField(blank=True, default=None, max_length=150, null=True)),
+                ('day', models.IntegerField(blank=True, default=None, null=True)),
+                ('data', models.TextField(blank=True, default=None, null=True)),
+                ('user_agent', models.CharField(blank=True, default=None, max_length=255, null=True)),
+                ('created_at', models.DateTimeField(db_index=True, help_text='When the activity happened')),
+                ('synced_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='studentactivity',
+            index=models.Index(fields=['academy_id', 'created_at'], name='activity_st_academy_8182aa_idx'),
+        ),
+    ]
@@ -21,3 +21,29 @@ class Activity(ndb.Model):
     @classmethod
     def _get_kind(cls):
         return 'student_activity'
+
+
+class StudentActivity(models.Model):
+    """Copy of an entity `student_activity` of Google Cloud Datastore, the reports read it"""
+
+    datastore_key = models.CharField(max_length=100, unique=True, help_text='Id or name of the entity')
+
+    slug = models.CharField(max_length=100, db_index=True)
+    cohort = models.CharField(max_length=150, default=None, null=True, blank=True, db_index=True)
+    academy_id = models.IntegerField(default=0, db_index=True)
+    user_id = models.IntegerField(default=None, null=True, blank=True, db_index=True)
+    email = models.CharField(max_length=150, default=None, null=True, blank=True)
+    day = models.IntegerField(default=None, null=True, blank=True)
+    data = models.TextField(default=None, null=True, blank=True)
+    user_agent = models.CharField(max_length=255, default=None, null=True, blank=True)
+
+    created_at = models.DateTimeField(db_index=True, help_text='When the activity happened')
+    synced_at = models.DateTimeField(auto_now_add=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['academy_id', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f'{self.slug} ({self.user_id})'
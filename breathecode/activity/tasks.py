@@ -0,0 +1,42 @@
+import logging
+from typing import Optional
+from celery import shared_task, Task
+from django.utils.dateparse import parse_datetime
+
+logger = logging.getLogger(__name__)
+
+
+class BaseTaskWithRetry(Task):
+    autoretry_for = (Exception, )
+    #                                           seconds
+    retry_kwargs = {'max_retries': 5, 'countdown': 60 * 5}
+    retry_backoff = True
+
+
+@shared_task(bind=True, base=BaseTaskWithRetry)
+def add_activities(self, activities: list[dict], names: Optional[list[str]] = None):
+    """
+    Save a batch of student activities in Google Cloud Datastore.
+
+    `names` are the names of the keys of the activities, the retries overwrite the activities saved
+    before the failure instead of duplicating them.
+    """
+
+    from breathecode.services.google_cloud import Datastore
+
+    logger.debug(f'Saving {len(activities)} activities')
+
+    # the dates are sent as strings to the worker
+    entities = [{**x, 'created_at': parse_datetime(x['created_at'])} for x in activities]
+
+    datastore = Datastore()
+    datastore.update_multi('student_activity', entities, names=names)
+
+
+@shared_task(bind=True, base=BaseTaskWithRetry)
+def sync_student_activities(self):
+    """Copy the new activities of Google Cloud Datastore to the reports table"""
+
+    from . import actions
+
+    actions.sync_student_activities()
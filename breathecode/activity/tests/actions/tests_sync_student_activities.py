@@ -0,0 +1,187 @@
+"""
+Test sync_student_activities
+"""
+from datetime import timedelta
+from unittest.mock import MagicMock, call, patch
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from breathecode.activity.actions import SYNC_LOCK_KEY, sync_student_activities
+from breathecode.services.google_cloud import Datastore
+from breathecode.tests.mocks import apply_google_cloud_datastore_client_mock
+
+from ..mixins import MediaTestCase
+
+UTC_NOW = timezone.now()
+
+
+class Entity(dict):
+
+    def __init__(self, key, **kwargs):
+        super().__init__(**kwargs)
+        self.key = MagicMock(id_or_name=key)
+
+
+def entity(key, created_at=UTC_NOW, **kwargs):
+    return Entity(key,
+                  slug='classroom_attendance',
+                  cohort='miami-downtown-pt-xx',
+                  academy_id=1,
+                  user_id=1,
+                  email='konan@naruto.io',
+                  day=13,
+                  data='{"day": 13}',
+                  user_agent='bc/test',
+                  created_at=created_at,
+                  **kwargs)
+
+
+def student_activity_serializer(key):
+    return {
+        'id': key,
+        'datastore_key': str(key),
+        'slug': 'classroom_attendance',
+        'cohort': 'miami-downtown-pt-xx',
+        'academy_id': 1,
+        'user_id': 1,
+        'email': 'konan@naruto.io',
+        'day': 13,
+        'data': '{"day": 13}',
+        'user_agent': 'bc/test',
+    }
+
+
+class SyncStudentActivitiesTestSuite(MediaTestCase):
+    """
+    🔽🔽🔽 Without activities synced
+    """
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'fetch_page',
+                  MagicMock(side_effect=[([entity(1), entity(2)], 'Y3Vyc29yLTE'), ([entity(3)], None)]))
+    def test_sync__all_the_pages(self):
+        self.assertEqual(sync_student_activities(batch_size=2, backfill=True), 3)
+
+        # synced_at is set by the database
+        self.assertEqual([{k: v
+                           for k, v in x.items() if k != 'synced_at'}
+                          for x in self.bc.database.list_of('activity.StudentActivity')],
+                         [student_activity_serializer(n) for n in range(1, 4)])
+        self.assertEqual(
+            [x.created_at for x in self.bc.database.list_of('activity.StudentActivity', dict=False)],
+            [UTC_NOW, UTC_NOW, UTC_NOW])
+
+        self.assertEqual(Datastore.fetch_page.call_args_list, [
+            call(limit=2, cursor=None, order_by=['created_at'], filters=[], kind='student_activity'),
+            call(limit=2, cursor='Y3Vyc29yLTE', order_by=['created_at'], filters=[], kind='student_activity'),
+        ])
+
+    def test_sync__all_the_pages__cursor_of_google_cloud_datastore(self):
+        fields = {k: v for k, v in entity(0).items()}
+        client = apply_google_cloud_datastore_client_mock('student_activity', [
+            [{
+                'id': 1,
+                **fields
+            }, {
+                'id': 2,
+                **fields
+            }],
+            [{
+                'id': 3,
+                **fields
+            }],
+        ])
+
+        with patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+                   MagicMock(return_value=client)):
+            self.assertEqual(sync_student_activities(batch_size=2, backfill=True), 3)
+
+        self.assertEqual([x['datastore_key'] for x in self.bc.database.list_of('activity.StudentActivity')],
+                         ['1', '2', '3'])
+
+        # the second page starts where the first one ended
+        self.assertEqual([
+            x.kwargs['request']['query'].start_cursor for x in client._datastore_api.run_query.call_args_list
+        ], [b'', b'cursor-1'])
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'fetch_page', MagicMock(side_effect=[([entity(1)], None)]))
+    @patch('django.utils.timezone.now', MagicMock(return_value=UTC_NOW))
+    def test_sync__without_backfill(self):
+        self.assertEqual(sync_student_activities(), 1)
+
+        # the periodic task does not scan all the activities
+        self.assertEqual(Datastore.fetch_page.call_args_list, [
+            call(limit=500,
+                 cursor=None,
+                 order_by=['created_at'],
+                 filters=[('created_at', '>=', UTC_NOW - timedelta(minutes=60))],
+                 kind='student_activity'),
+        ])
+
+    """
+    🔽🔽🔽 With activities synced
+    """
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'fetch_page', MagicMock(side_effect=[([entity(1), entity(2)], None)]))
+    def test_sync__from_the_last_activity(self):
+        yesterday = UTC_NOW - timedelta(days=1)
+        model = self.bc.database.create(student_activity={'datastore_key': '1', 'created_at': yesterday})
+
+        self.assertEqual(sync_student_activities(), 1)
+
+        self.assertEqual(self.bc.database.list_of('activity.StudentActivity')[1]['datastore_key'], '2')
+        self.assertEqual(self.bc.database.count('activity.StudentActivity'), 2)
+        self.assertEqual(Datastore.fetch_page.call_args_list, [
+            call(limit=500,
+                 cursor=None,
+                 order_by=['created_at'],
+                 filters=[('created_at', '>=', model.student_activity.created_at - timedelta(minutes=60))],
+                 kind='student_activity'),
+        ])
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'fetch_page', MagicMock())
+    def test_sync__activity_that_arrived_late(self):
+        model = self.bc.database.create(student_activity={'datastore_key': '1', 'created_at': UTC_NOW})
+
+        # it was created before the last activity copied but it was saved in Datastore after
+        late_activity = entity(2, created_at=UTC_NOW - timedelta(minutes=10))
+        Datastore.fetch_page.side_effect = [([late_activity, entity(1)], None)]
+
+        self.assertEqual(sync_student_activities(), 1)
+
+        self.assertEqual([(x.datastore_key, x.created_at)
+                          for x in self.bc.database.list_of('activity.StudentActivity', dict=False)],
+                         [('1', UTC_NOW), ('2', UTC_NOW - timedelta(minutes=10))])
+        self.assertEqual(Datastore.fetch_page.call_args_list, [
+            call(limit=500,
+                 cursor=None,
+                 order_by=['created_at'],
+                 filters=[('created_at', '>=', model.student_activity.created_at - timedelta(minutes=60))],
+                 kind='student_activity'),
+        ])
+
+    """
+    🔽🔽🔽 Lock
+    """
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'fetch_page', MagicMock(side_effect=[([entity(1)], None)]))
+    def test_sync__other_sync_running(self):
+        cache.add(SYNC_LOCK_KEY, True)
+
+        self.assertEqual(sync_student_activities(), 0)
+
+        self.assertEqual(self.bc.database.count('activity.StudentActivity'), 0)
+        self.assertEqual(Datastore.fetch_page.call_args_list, [])
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'fetch_page', MagicMock(side_effect=Exception('Datastore is down')))
+    def test_sync__lock_released_after_an_error(self):
+        with self.assertRaisesMessage(Exception, 'Datastore is down'):
+            sync_student_activities()
+
+        self.assertEqual(cache.get(SYNC_LOCK_KEY), None)
@@ -0,0 +1,72 @@
+"""
+Test add_activities
+"""
+from unittest.mock import MagicMock, call, patch
+
+from django.utils import timezone
+
+from breathecode.activity.tasks import add_activities
+from breathecode.services.google_cloud import Datastore
+
+from ..mixins import MediaTestCase
+
+
+class AddActivitiesTestSuite(MediaTestCase):
+    """
+    🔽🔽🔽 With activities
+    """
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'update_multi', MagicMock())
+    def test_add_activities(self):
+        now = timezone.now()
+        activities = [{
+            'slug': 'breathecode_login',
+            'user_agent': 'bc/test',
+            'created_at': now.isoformat(),
+            'user_id': n,
+            'email': f'konan{n}@naruto.io',
+            'academy_id': 0,
+        } for n in range(1, 4)]
+
+        add_activities.delay(activities, names=['uuid1', 'uuid2', 'uuid3'])
+
+        self.assertEqual(Datastore.update_multi.call_args_list, [
+            call('student_activity', [{
+                **x, 'created_at': now
+            } for x in activities],
+                 names=['uuid1', 'uuid2', 'uuid3']),
+        ])
+
+    """
+    🔽🔽🔽 Retries
+    """
+
+    @patch('breathecode.services.google_cloud.datastore.get_datastore_client', MagicMock())
+    @patch('breathecode.services.google_cloud.datastore._incr_counts', MagicMock())
+    def test_add_activities__the_second_chunk_fails(self):
+        from breathecode.services.google_cloud import datastore
+
+        client = datastore.get_datastore_client.return_value
+        client.key.side_effect = lambda kind, name=None: (kind, name)
+        client.put_multi.side_effect = [None, Exception('Deadline exceeded'), None, None]
+
+        now = timezone.now()
+        activities = [{
+            'slug': 'breathecode_login',
+            'user_agent': 'bc/test',
+            'created_at': now.isoformat(),
+            'user_id': n,
+            'email': f'konan{n}@naruto.io',
+            'academy_id': 0,
+        } for n in range(501)]
+        names = [f'uuid{n}' for n in range(501)]
+
+        add_activities.delay(activities, names=names)
+
+        chunks = [[x.key for x in args[0]] for args, _ in client.put_multi.call_args_list]
+        keys = [('student_activity', x) for x in names]
+
+        # the retry overwrites the first chunk instead of duplicating it
+        self.assertEqual(chunks, [keys[:500], keys[500:], keys[:500], keys[500:]])
+        self.assertEqual(datastore._incr_counts.call_count, 1)
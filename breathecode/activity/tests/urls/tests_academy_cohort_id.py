@@ -440,3 +440,99 @@ class MediaTestSuite(MediaTestCase):
         json = response.json()
         self.assertEqual(json, {'detail': 'user-not-exists', 'status_code': 400})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    """
+    🔽🔽🔽 Post
+    """
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'update_multi', MagicMock())
+    @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
+    def test_post__student_not_found(self):
+        cohort_users = [{'user_id': 1, 'role': 'TEACHER'}, {'user_id': 2, 'role': 'STUDENT'}]
+        model = self.bc.database.create(user=3,
+                                        cohort=1,
+                                        cohort_user=cohort_users,
+                                        profile_academy=1,
+                                        capability='classroom_activity',
+                                        role=1)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user[0])
+
+        url = reverse_lazy('activity:academy_cohort_id', kwargs={'cohort_id': 1})
+        data = [{
+            'user_id': n,
+            'slug': 'classroom_attendance',
+            'user_agent': 'bc/test',
+            'cohort': model.cohort.slug,
+            'day': 1,
+            'data': None,
+        } for n in [2, 3]]
+        response = self.client.post(url, data, format='json')
+
+        json = response.json()
+        expected = {'detail': 'not-found-in-cohort', 'status_code': 400}
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Datastore.update_multi.call_args_list, [])
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'update_multi', MagicMock())
+    @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
+    @patch('breathecode.activity.views.uuid4',
+           MagicMock(side_effect=[MagicMock(hex=f'uuid{n}') for n in range(3)]))
+    def test_post__many_students(self):
+        cohort_users = [{
+            'user_id': 1,
+            'role': 'TEACHER'
+        }] + [{
+            'user_id': n,
+            'role': 'STUDENT'
+        } for n in range(2, 5)]
+        model = self.bc.database.create(user=4,
+                                        cohort=1,
+                                        cohort_user=cohort_users,
+                                        profile_academy=1,
+                                        capability='classroom_activity',
+                                        role=1)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user[0])
+
+        url = reverse_lazy('activity:academy_cohort_id', kwargs={'cohort_id': 1})
+        data = [{
+            'user_id': n,
+            'slug': 'classroom_attendance',
+            'user_agent': 'bc/test',
+            'cohort': model.cohort.slug,
+            'day': 1,
+            'data': None,
+        } for n in range(2, 5)]
+
+        # the capability, the teacher, the students and the cohort, the students and the cohort are fetched
+        # once for the whole batch
+        response = self.bc.check.queries(4, lambda: self.client.post(url, data, format='json'))
+
+        json = response.json()
+        created_ats = [x.pop('created_at') for x in json]
+        expected = [{
+            'academy_id': 1,
+            'cohort': model.cohort.slug,
+            'data': None,
+            'day': 1,
+            'email': model.user[n - 1].email,
+            'slug': 'classroom_attendance',
+            'user_agent': 'bc/test',
+            'user_id': n,
+        } for n in range(2, 5)]
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Datastore.update_multi.call_args_list, [
+            call('student_activity', [{
+                **x, 'created_at': self.iso_to_datetime(created_at)
+            } for x, created_at in zip(expected, created_ats)],
+                 names=['uuid0', 'uuid1', 'uuid2']),
+        ])
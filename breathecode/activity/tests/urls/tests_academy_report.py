@@ -0,0 +1,179 @@
+"""
+Test /academy/report
+"""
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.urls.base import reverse_lazy
+from django.utils import timezone
+from rest_framework import status
+
+from breathecode.services.google_cloud import Datastore
+
+from ..mixins import MediaTestCase
+
+UTC_NOW = timezone.now()
+
+
+class MediaTestSuite(MediaTestCase):
+    """
+    🔽🔽🔽 Auth
+    """
+
+    def test_academy_report__without_auth(self):
+        url = reverse_lazy('activity:academy_report')
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_academy_report__without_capability(self):
+        model = self.bc.database.create(user=1)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('activity:academy_report')
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {
+            'detail': "You (user: 1) don't have this capability: read_activity for academy 1",
+            'status_code': 403,
+        }
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    """
+    🔽🔽🔽 Group by
+    """
+
+    @patch.object(Datastore, '__init__', MagicMock(side_effect=Exception('Datastore was used')))
+    def test_academy_report__by_date_and_slug(self):
+        student_activities = [
+            {
+                'slug': 'classroom_attendance',
+                'academy_id': 1,
+                'created_at': UTC_NOW,
+            },
+            {
+                'slug': 'classroom_attendance',
+                'academy_id': 1,
+                'created_at': UTC_NOW,
+            },
+            {
+                'slug': 'lesson_opened',
+                'academy_id': 1,
+                'created_at': UTC_NOW,
+            },
+            {
+                'slug': 'lesson_opened',
+                'academy_id': 1,
+                'created_at': UTC_NOW - timedelta(days=1),
+            },
+            {
+                'slug': 'lesson_opened',
+                'academy_id': 2,
+                'created_at': UTC_NOW,
+            },
+        ]
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        capability='read_activity',
+                                        role='potato',
+                                        student_activity=student_activities)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('activity:academy_report')
+        response = self.client.get(url)
+
+        json = response.json()
+        today = timezone.localtime(UTC_NOW).date()
+        yesterday = timezone.localtime(UTC_NOW - timedelta(days=1)).date()
+        expected = [
+            {
+                'created_at__date': yesterday.isoformat(),
+                'slug': 'lesson_opened',
+                'total': 1,
+            },
+            {
+                'created_at__date': today.isoformat(),
+                'slug': 'classroom_attendance',
+                'total': 2,
+            },
+            {
+                'created_at__date': today.isoformat(),
+                'slug': 'lesson_opened',
+                'total': 1,
+            },
+        ]
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_academy_report__by_cohort__filtered_by_slug(self):
+        student_activities = [
+            {
+                'slug': 'classroom_attendance',
+                'cohort': 'miami-downtown-pt-xx',
+                'academy_id': 1,
+            },
+            {
+                'slug': 'classroom_attendance',
+                'cohort': 'miami-downtown-pt-xx',
+                'academy_id': 1,
+            },
+            {
+                'slug': 'classroom_unattendance',
+                'cohort': 'miami-downtown-pt-xx',
+                'academy_id': 1,
+            },
+            {
+                'slug': 'classroom_attendance',
+                'cohort': 'miami-downtown-pt-xxi',
+                'academy_id': 1,
+            },
+        ]
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        capability='read_activity',
+                                        role='potato',
+                                        student_activity=student_activities)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('activity:academy_report') + '?by=cohort&slug=classroom_attendance'
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = [
+            {
+                'cohort': 'miami-downtown-pt-xx',
+                'total': 2,
+            },
+            {
+                'cohort': 'miami-downtown-pt-xxi',
+                'total': 1,
+            },
+        ]
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_academy_report__invalid_group(self):
+        model = self.bc.database.create(user=1, profile_academy=1, capability='read_activity', role='potato')
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('activity:academy_report') + '?by=email'
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {'detail': 'invalid-group', 'status_code': 400}
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,107 @@
+"""
+Test /academy/student/<student_id>
+"""
+from django.utils import timezone
+from datetime import timedelta
+from unittest.mock import MagicMock, call, patch
+
+from django.urls.base import reverse_lazy
+from rest_framework import status
+
+from breathecode.services.google_cloud import Datastore
+
+from ..mixins import MediaTestCase
+
+UTC_NOW = timezone.now()
+
+DATASTORE_SEED = [{
+    'academy_id': 1,
+    'cohort': 'miami-downtown-pt-xx',
+    'created_at': (UTC_NOW + timedelta(days=n)).isoformat() + 'Z',
+    'data': None,
+    'day': 13,
+    'email': 'konan@naruto.io',
+    'slug': 'classroom_attendance',
+    'user_agent': 'bc/test',
+    'user_id': 1,
+} for n in range(2)]
+
+
+class MediaTestSuite(MediaTestCase):
+    """
+    🔽🔽🔽 With cursor pagination
+    """
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'fetch_page',
+                  MagicMock(side_effect=lambda **kwargs: (list(DATASTORE_SEED), 'Y3Vyc29yLTE')))
+    @patch.object(Datastore, 'count', MagicMock(return_value=15))
+    @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
+    def test_with_cursor_pagination__first_page(self):
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        capability='read_activity',
+                                        role='potato',
+                                        cohort_user={'role': 'STUDENT'})
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('activity:academy_student_id', kwargs={'student_id': 1})
+        url += '?cursor=&limit=2&count=true'
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {
+            'count': 15,
+            'first': None,
+            'next': 'http://testserver/v1/activity/academy/student/1?count=true&cursor=Y3Vyc29yLTE&limit=2',
+            'previous': None,
+            'last': None,
+            'results': DATASTORE_SEED,
+        }
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Datastore.fetch_page.call_args_list, [
+            call(limit=2, cursor=None, order_by=['-created_at'], kind='student_activity', user_id=1),
+        ])
+        self.assertEqual(Datastore.count.call_args_list, [call(kind='student_activity', user_id=1)])
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'fetch_page',
+                  MagicMock(side_effect=lambda **kwargs: (list(DATASTORE_SEED), None)))
+    @patch.object(Datastore, 'count', MagicMock(return_value=15))
+    @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
+    def test_with_cursor_pagination__last_page(self):
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        capability='read_activity',
+                                        role='potato',
+                                        cohort_user={'role': 'STUDENT'})
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('activity:academy_student_id', kwargs={'student_id': 1
+                                                                  }) + '?limit=2&cursor=Y3Vyc29yLTE'
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {
+            'count': None,
+            'first': 'http://testserver/v1/activity/academy/student/1?cursor=&limit=2',
+            'next': None,
+            'previous': None,
+            'last': None,
+            'results': DATASTORE_SEED,
+        }
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Datastore.fetch_page.call_args_list, [
+            call(limit=2, cursor='Y3Vyc29yLTE', order_by=['-created_at'], kind='student_activity', user_id=1),
+        ])
+
+        # the count is only calculated with ?count=true
+        self.assertEqual(Datastore.count.call_args_list, [])
@@ -362,3 +362,130 @@ class MediaTestSuite(MediaTestCase):
         self.assertEqual(mock.fetch.call_args_list,
                          [call([FilterNode('cohort', '=', model.cohort.slug)], limit=5, offset=10)])
         self.assertEqual(mock.count.call_args_list, [call([FilterNode('cohort', '=', model.cohort.slug)])])
+
+    @patch.object(NDB, '__init__', new=ndb_init_mock)
+    @patch.object(NDB, 'fetch', new=ndb_fetch_mock([DATASTORE_PRIVATE_SEED]))
+    @patch.object(NDB, 'fetch_page', MagicMock())
+    @patch.object(NDB, 'count', new=ndb_count_mock(15))
+    def test_cohort_id__with_pagination__just_the_limit(self):
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        capability='read_activity',
+                                        role='potato',
+                                        cohort=1)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('activity:cohort_id', kwargs={'cohort_id': 1}) + '?limit=5'
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {
+            'count': 15,
+            'first': None,
+            'next': 'http://testserver/v1/activity/cohort/1?limit=5&offset=5',
+            'previous': None,
+            'last': 'http://testserver/v1/activity/cohort/1?limit=5&offset=10',
+            'results': [DATASTORE_PRIVATE_SEED]
+        }
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(NDB.fetch_page.call_args_list, [])
+
+    """
+    🔽🔽🔽 With cursor pagination
+    """
+
+    @patch.object(NDB, '__init__', new=ndb_init_mock)
+    @patch.object(NDB, 'fetch_page', MagicMock(return_value=([DATASTORE_PRIVATE_SEED], 'Y3Vyc29yLTE')))
+    @patch.object(NDB, 'count', new=ndb_count_mock(15))
+    def test_cohort_id__with_cursor_pagination__first_page(self):
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        capability='read_activity',
+                                        role='potato',
+                                        cohort=1)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('activity:cohort_id', kwargs={'cohort_id': 1})
+        url += '?limit=5&paginate=cursor&count=true'
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {
+            'count': 15,
+            'first': None,
+            'next':
+            'http://testserver/v1/activity/cohort/1?count=true&cursor=Y3Vyc29yLTE&limit=5&paginate=cursor',
+            'previous': None,
+            'last': None,
+            'results': [DATASTORE_PRIVATE_SEED]
+        }
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(NDB.fetch_page.call_args_list,
+                         [call([FilterNode('cohort', '=', model.cohort.slug)], 5, None)])
+        self.assertEqual(NDB.count.call_args_list, [call([FilterNode('cohort', '=', model.cohort.slug)])])
+
+    @patch.object(NDB, '__init__', new=ndb_init_mock)
+    @patch.object(NDB, 'fetch_page', MagicMock(return_value=([DATASTORE_PRIVATE_SEED], None)))
+    @patch.object(NDB, 'count', new=ndb_count_mock(15))
+    def test_cohort_id__with_cursor_pagination__last_page(self):
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        capability='read_activity',
+                                        role='potato',
+                                        cohort=1)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('activity:cohort_id', kwargs={'cohort_id': 1}) + '?limit=5&cursor=Y3Vyc29yLTE'
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {
+            'count': None,
+            'first': 'http://testserver/v1/activity/cohort/1?cursor=&limit=5',
+            'next': None,
+            'previous': None,
+            'last': None,
+            'results': [DATASTORE_PRIVATE_SEED]
+        }
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.headers['Link'],
+                         '<http://testserver/v1/activity/cohort/1?cursor=&limit=5>; rel="first"')
+        self.assertEqual(NDB.fetch_page.call_args_list,
+                         [call([FilterNode('cohort', '=', model.cohort.slug)], 5, 'Y3Vyc29yLTE')])
+
+        # the count is only calculated with ?count=true
+        self.assertEqual(NDB.count.call_args_list, [])
+
+    @patch.object(NDB, '__init__', new=ndb_init_mock)
+    @patch.object(NDB, 'fetch_page', MagicMock(side_effect=ValueError('Invalid cursor')))
+    @patch.object(NDB, 'count', new=ndb_count_mock(15))
+    def test_cohort_id__with_cursor_pagination__invalid_cursor(self):
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        capability='read_activity',
+                                        role='potato',
+                                        cohort=1)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('activity:cohort_id', kwargs={'cohort_id': 1}) + '?limit=5&cursor=potato'
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {'detail': 'invalid-cursor', 'status_code': 400}
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
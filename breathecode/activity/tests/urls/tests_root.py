@@ -63,12 +63,12 @@ def datastore_fetch_mock(first_fetch=[], second_fetch=[]):
     return MagicMock(side_effect=fetch)
 
 
-def datastore_update_mock():
+def datastore_update_multi_mock():
 
-    def update(key: str, data: dict):
+    def update_multi(key: str, data: list[dict], names=None):
         pass
 
-    return MagicMock(side_effect=update)
+    return MagicMock(side_effect=update_multi)
 
 
 class MediaTestSuite(MediaTestCase):
@@ -691,10 +691,10 @@ class MediaTestSuite(MediaTestCase):
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'update', new=datastore_update_mock())
+    @patch.object(Datastore, 'update_multi', new=datastore_update_multi_mock())
     def test_user_id__post__missing_slug(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.update.call_args_list = []
+        mock.update_multi.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -711,13 +711,13 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.update.call_args_list, [])
+        self.assertEqual(mock.update_multi.call_args_list, [])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'update', new=datastore_update_mock())
+    @patch.object(Datastore, 'update_multi', new=datastore_update_multi_mock())
     def test_user_id__post__missing_user_agent(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.update.call_args_list = []
+        mock.update_multi.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -734,17 +734,17 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.update.call_args_list, [])
+        self.assertEqual(mock.update_multi.call_args_list, [])
 
     """
     🔽🔽🔽 Post bad slug
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'update', new=datastore_update_mock())
+    @patch.object(Datastore, 'update_multi', new=datastore_update_multi_mock())
     def test_user_id__post__with_bad_slug(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.update.call_args_list = []
+        mock.update_multi.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -763,17 +763,18 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.update.call_args_list, [])
+        self.assertEqual(mock.update_multi.call_args_list, [])
 
     """
     🔽🔽🔽 Post with public slug
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'update', new=datastore_update_mock())
+    @patch.object(Datastore, 'update_multi', new=datastore_update_multi_mock())
+    @patch('breathecode.activity.views.uuid4', MagicMock(return_value=MagicMock(hex='a1b2c3')))
     def test_user_id__post__with_public_slug(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.update.call_args_list = []
+        mock.update_multi.call_args_list = []
 
         self.headers(academy=1)
         model = self.generate_models(authenticate=True,
@@ -804,17 +805,18 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(mock.update.call_args_list, [
+        self.assertEqual(mock.update_multi.call_args_list, [
             call(
                 'student_activity',
-                {
+                [{
                     'slug': 'breathecode_login',
                     'user_agent': 'bc/test',
                     'created_at': self.iso_to_datetime(created_at),
                     'user_id': 1,
                     'email': model.user.email,
                     'academy_id': 0,
-                },
+                }],
+                names=['a1b2c3'],
             ),
         ])
 
@@ -823,10 +825,10 @@ class MediaTestSuite(MediaTestCase):
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'update', new=datastore_update_mock())
+    @patch.object(Datastore, 'update_multi', new=datastore_update_multi_mock())
     def test_user_id__post__missing_cohort(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.update.call_args_list = []
+        mock.update_multi.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -845,17 +847,17 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.update.call_args_list, [])
+        self.assertEqual(mock.update_multi.call_args_list, [])
 
     """
     🔽🔽🔽 Post with private slug without cohort
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'update', new=datastore_update_mock())
+    @patch.object(Datastore, 'update_multi', new=datastore_update_multi_mock())
     def test_user_id__post__with_private_slug__slug_require_a_cohort(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.update.call_args_list = []
+        mock.update_multi.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -875,17 +877,17 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.update.call_args_list, [])
+        self.assertEqual(mock.update_multi.call_args_list, [])
 
     """
     🔽🔽🔽 Post with private slug without data
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'update', new=datastore_update_mock())
+    @patch.object(Datastore, 'update_multi', new=datastore_update_multi_mock())
     def test_user_id__post__with_private_slug__slug_require_a_data(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.update.call_args_list = []
+        mock.update_multi.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -906,17 +908,17 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.update.call_args_list, [])
+        self.assertEqual(mock.update_multi.call_args_list, [])
 
     """
     🔽🔽🔽 Post with private slug bad cohort
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'update', new=datastore_update_mock())
+    @patch.object(Datastore, 'update_multi', new=datastore_update_multi_mock())
     def test_user_id__post__with_private_slug__cohort_not_exist(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.update.call_args_list = []
+        mock.update_multi.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -937,17 +939,17 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.update.call_args_list, [])
+        self.assertEqual(mock.update_multi.call_args_list, [])
 
     """
     🔽🔽🔽 Post with private slug field not allowed
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'update', new=datastore_update_mock())
+    @patch.object(Datastore, 'update_multi', new=datastore_update_multi_mock())
     def test_user_id__post__with_private_slug__field_not_allowed(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.update.call_args_list = []
+        mock.update_multi.call_args_list = []
 
         self.headers(academy=1)
         model = self.generate_models(authenticate=True,
@@ -970,17 +972,18 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.update.call_args_list, [])
+        self.assertEqual(mock.update_multi.call_args_list, [])
 
     """
     🔽🔽🔽 Post with private slug
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'update', new=datastore_update_mock())
+    @patch.object(Datastore, 'update_multi', new=datastore_update_multi_mock())
+    @patch('breathecode.activity.views.uuid4', MagicMock(return_value=MagicMock(hex='a1b2c3')))
     def test_user_id__post__with_private_slug__cohort_not_exist___(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.update.call_args_list = []
+        mock.update_multi.call_args_list = []
 
         self.headers(academy=1)
         model = self.generate_models(authenticate=True,
@@ -1014,10 +1017,10 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(mock.update.call_args_list, [
+        self.assertEqual(mock.update_multi.call_args_list, [
             call(
                 'student_activity',
-                {
+                [{
                     'cohort': model.cohort.slug,
                     'data': '{"name": "Freyja"}',
                     'user_agent': 'bc/test',
@@ -1026,6 +1029,7 @@ class MediaTestSuite(MediaTestCase):
                     'user_id': 1,
                     'email': model.user.email,
                     'academy_id': 1,
-                },
+                }],
+                names=['a1b2c3'],
             ),
         ])
@@ -1,5 +1,6 @@
 from django.urls import path
-from .views import ActivityCohortView, ActivityTypeView, ActivityMeView, ActivityClassroomView, StudentActivityView
+from .views import (ActivityCohortView, ActivityTypeView, ActivityMeView, ActivityClassroomView,
+                    StudentActivityView, ActivityReportView)
 
 app_name = 'activity'
 urlpatterns = [
@@ -8,5 +9,6 @@ urlpatterns = [
     path('type/<str:activity_slug>', ActivityTypeView.as_view(), name='type_slug'),
     path('academy/cohort/<str:cohort_id>', ActivityClassroomView.as_view(), name='academy_cohort_id'),
     path('academy/student/<str:student_id>', StudentActivityView.as_view(), name='academy_student_id'),
+    path('academy/report', ActivityReportView.as_view(), name='academy_report'),
     path('cohort/<str:cohort_id>', ActivityCohortView.as_view(), name='cohort_id')
 ]
@@ -1,18 +1,21 @@
-from breathecode.activity.models import Activity
+from breathecode.activity.models import Activity, StudentActivity
+from datetime import datetime
+from uuid import uuid4
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db.models import Count, Q
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from breathecode.admissions.models import Cohort, CohortUser
-from breathecode.utils import ValidationException, capable_of, HeaderLimitOffsetPagination
+from breathecode.utils import ValidationException, capable_of, HeaderLimitOffsetPagination, is_count_requested
 
+from . import tasks
 from .utils import (generate_created_at, validate_activity_fields, validate_activity_have_correct_data_field,
                     validate_if_activity_need_field_cohort, validate_if_activity_need_field_data,
                     validate_require_activity_fields)
 
-from google.cloud.ndb.query import OR
+from google.cloud.ndb.query import OR, DisjunctionNode
 
 # Create your views here.
 
@@ -38,6 +41,9 @@ ACTIVITIES = {
     'career_note': 'Notes related to the student career',
 }
 
+# fields that the activity reports can be grouped by
+ACTIVITY_REPORT_GROUPS = ['created_at__date', 'slug', 'cohort', 'user_id', 'day']
+
 ACTIVITY_PUBLIC_SLUGS = [
     'breathecode_login',
     'online_platform_registration',
@@ -178,6 +184,7 @@ class ActivityTypeView(APIView):
 
 
 class ActivityCohortView(ActivityViewMixin, HeaderLimitOffsetPagination):
+    cursor_pagination = True
 
     @capable_of('read_activity')
     def get(self, request, cohort_id=None, academy_id=None):
@@ -186,10 +193,19 @@ class ActivityCohortView(ActivityViewMixin, HeaderLimitOffsetPagination):
 
         self.filter_by_slugs()
         self.filter_by_cohort(academy_id, cohort_id)
+        client = NDB(Activity)
+
+        # the cursors can't be used with the queries that have OR
+        if self.is_paginated_by_cursor(request) and not any(
+                isinstance(x, DisjunctionNode) for x in self.queryargs):
+            page = self.paginate_by_fetch_page(
+                lambda limit, cursor: client.fetch_page(self.queryargs, limit, cursor), request)
+            count = client.count(self.queryargs) if is_count_requested(request) else None
+            return self.get_paginated_response(page, count)
+
         limit = self.get_limit_from_query()
         offset = self.get_offset_from_query()
 
-        client = NDB(Activity)
         data = client.fetch(self.queryargs, limit=limit, offset=offset)
         page = self.paginate_queryset(data, request)
 
@@ -289,18 +305,24 @@ class ActivityClassroomView(APIView, HeaderLimitOffsetPagination):
         if isinstance(data, list) == False:
             data = [data]
 
-        new_activities = []
-        for activity in data:
-            student_id = activity['user_id']
+        student_ids = [get_student_id(activity) for activity in data]
+
+        # the students of the whole batch are fetched at once
+        students = {
+            x.user.id: x.user
+            for x in CohortUser.objects.filter(
+                role='STUDENT', user__id__in=student_ids, cohort__id=cu.cohort_id).select_related('user')
+        }
+
+        activities = []
+        for student_id, activity in zip(student_ids, data):
             del activity['user_id']
-            cohort_user = CohortUser.objects.filter(role='STUDENT',
-                                                    user__id=student_id,
-                                                    cohort__id=cu.cohort.id).first()
-            if cohort_user is None:
+            if student_id not in students:
                 raise ValidationException('Student not found in this cohort', slug='not-found-in-cohort')
 
-            new_activities.append(add_student_activity(cohort_user.user, activity, academy_id))
+            activities.append((students[student_id], activity))
 
+        new_activities = add_student_activities(activities, academy_id)
         return Response(new_activities, status=status.HTTP_201_CREATED)
 
     @capable_of('classroom_activity')
@@ -375,8 +397,27 @@ class ActivityClassroomView(APIView, HeaderLimitOffsetPagination):
             return Response(page, status=status.HTTP_200_OK)
 
 
-def add_student_activity(user, data, academy_id):
-    from breathecode.services import Datastore
+def get_student_id(activity):
+    try:
+        return int(activity['user_id'])
+
+    except KeyError:
+        raise ValidationException('Missing user_id in the request', slug='missing-user-id')
+
+    except (TypeError, ValueError):
+        raise ValidationException('user_id is not a interger', slug='bad-user-id')
+
+
+def build_student_activity(user, data, academy_id, cohorts=None):
+    """
+    Validate an activity and get the fields of its entity.
+
+    `cohorts` keeps the cohorts already validated, the activities of a batch share it, so each cohort is
+    fetched once.
+    """
+
+    if cohorts is None:
+        cohorts = {}
 
     validate_activity_fields(data)
     validate_require_activity_fields(data)
@@ -392,17 +433,21 @@ def add_student_activity(user, data, academy_id):
     validate_activity_have_correct_data_field(data)
 
     if 'cohort' in data:
-        _query = Cohort.objects.filter(academy__id=academy_id)
-        if data['cohort'].isnumeric():
-            _query = _query.filter(id=data['cohort'])
-        else:
-            _query = _query.filter(slug=data['cohort'])
+        key = (int(academy_id), data['cohort'])
+        if key not in cohorts:
+            _query = Cohort.objects.filter(academy__id=academy_id)
+            if data['cohort'].isnumeric():
+                _query = _query.filter(id=data['cohort'])
+            else:
+                _query = _query.filter(slug=data['cohort'])
+
+            cohorts[key] = _query.exists()
 
-        if not _query.exists():
+        if not cohorts[key]:
             raise ValidationException(f"Cohort {str(data['cohort'])} doesn't exist in this academy",
                                       slug='cohort-not-exists')
 
-    fields = {
+    return {
         **data,
         'created_at': generate_created_at(),
         'slug': slug,
@@ -411,13 +456,33 @@ def add_student_activity(user, data, academy_id):
         'academy_id': int(academy_id),
     }
 
-    datastore = Datastore()
-    datastore.update('student_activity', fields)
 
-    return fields
+def add_student_activities(activities, academy_id):
+    """
+    Validate a batch of activities, a list of `(user, data)`, and queue them to be saved.
+
+    The whole batch is validated before anything is queued, then the entities are saved with `put_multi`
+    by a worker, the request does not wait for Google Cloud Datastore.
+    """
+
+    cohorts = {}
+    new_activities = [build_student_activity(user, data, academy_id, cohorts) for user, data in activities]
+
+    if new_activities:
+        # the names are generated here, so the retries of the task do not duplicate the activities
+        names = [uuid4().hex for _ in new_activities]
+        payload = [{**x, 'created_at': x['created_at'].isoformat()} for x in new_activities]
+        tasks.add_activities.delay(payload, names=names)
+
+    return new_activities
+
+
+def add_student_activity(user, data, academy_id):
+    return add_student_activities([(user, data)], academy_id)[0]
 
 
 class StudentActivityView(APIView, HeaderLimitOffsetPagination):
+    cursor_pagination = True
 
     @capable_of('read_activity')
     def get(self, request, student_id=None, academy_id=None):
@@ -457,6 +522,14 @@ class StudentActivityView(APIView, HeaderLimitOffsetPagination):
         datastore = Datastore()
         #academy_iter = datastore.fetch(**kwargs, academy_id=int(academy_id))
 
+        if self.is_paginated_by_cursor(request):
+            # the order of the query keeps the rows sorted across the pages
+            page = self.paginate_by_fetch_page(
+                lambda limit, cursor: datastore.fetch_page(
+                    limit=limit, cursor=cursor, order_by=['-created_at'], **kwargs), request)
+            count = datastore.count(**kwargs) if is_count_requested(request) else None
+            return self.get_paginated_response(page, count)
+
         limit = request.GET.get('limit')
         offset = request.GET.get('offset')
 
@@ -487,15 +560,11 @@ class StudentActivityView(APIView, HeaderLimitOffsetPagination):
     @capable_of('crud_activity')
     def post(self, request, student_id=None, academy_id=None):
 
-        user = User.objects.filter(id=student_id)
-
         data = request.data
         if isinstance(data, list) == False:
             data = [data]
 
-        new_activities = []
         for activity in data:
-
             if 'cohort' not in activity:
                 raise ValidationException(
                     'Every activity specified for each student must have a cohort (slug)',
@@ -503,14 +572,74 @@ class StudentActivityView(APIView, HeaderLimitOffsetPagination):
             elif activity['cohort'].isnumeric():
                 raise ValidationException('Cohort must be a slug, not a numeric ID', slug='invalid-cohort')
 
-            student_id = activity['user_id']
+        student_ids = [get_student_id(activity) for activity in data]
+
+        # the students of the whole batch are fetched at once
+        students = {
+            (x.user.id, x.cohort.slug): x.user
+            for x in CohortUser.objects.filter(
+                role='STUDENT', user__id__in=student_ids,
+                cohort__slug__in=[x['cohort'] for x in data]).select_related('user', 'cohort')
+        }
+
+        activities = []
+        for student_id, activity in zip(student_ids, data):
             del activity['user_id']
-            cohort_user = CohortUser.objects.filter(role='STUDENT',
-                                                    user__id=student_id,
-                                                    cohort__slug=activity['cohort']).first()
-            if cohort_user is None:
+            if (student_id, activity['cohort']) not in students:
                 raise ValidationException('Student not found in this cohort', slug='not-found-in-cohort')
 
-            new_activities.append(add_student_activity(cohort_user.user, activity, academy_id))
+            activities.append((students[(student_id, activity['cohort'])], activity))
 
+        new_activities = add_student_activities(activities, academy_id)
         return Response(new_activities, status=status.HTTP_201_CREATED)
+
+
+class ActivityReportView(APIView):
+    """
+    Count the activities of the academy, they are read from the copy of Google Cloud Datastore that is
+    updated by `sync_student_activities`.
+    """
+
+    @capable_of('read_activity')
+    def get(self, request, academy_id=None):
+        items = StudentActivity.objects.filter(academy_id=academy_id)
+
+        group_by = [x for x in request.GET.get('by', 'created_at__date,slug').split(',') if x]
+        for group in group_by:
+            if group not in ACTIVITY_REPORT_GROUPS:
+                raise ValidationException(f'It can\'t be grouped by {group}', slug='invalid-group')
+
+        slugs = request.GET.get('slug')
+        if slugs:
+            items = items.filter(slug__in=slugs.split(','))
+
+        cohorts = request.GET.get('cohort')
+        if cohorts:
+            items = items.filter(cohort__in=cohorts.split(','))
+
+        user_ids = request.GET.get('user_id')
+        if user_ids:
+            try:
+                items = items.filter(user_id__in=[int(x) for x in user_ids.split(',')])
+
+            except ValueError:
+                raise ValidationException('user_id is not a interger', slug='bad-user-id')
+
+        email = request.GET.get('email')
+        if email:
+            items = items.filter(email=email)
+
+        try:
+            start = request.GET.get('start')
+            if start:
+                items = items.filter(created_at__date__gte=datetime.strptime(start, '%Y-%m-%d').date())
+
+            end = request.GET.get('end')
+            if end:
+                items = items.filter(created_at__date__lte=datetime.strptime(end, '%Y-%m-%d').date())
+
+        except ValueError:
+            raise ValidationException('The dates must be in the format YYYY-MM-DD', slug='bad-date-format')
+
+        items = items.values(*group_by).annotate(total=Count('id')).order_by(*group_by)
+        return Response(items)
@@ -119,7 +119,7 @@ class GetSyllabusScheduleSerializer(serpy.Serializer):
 class GetSmallSyllabusScheduleSerializer(serpy.Serializer):
     id = serpy.Field()
     name = serpy.Field()
-    syllabus = serpy.MethodField()
+    syllabus = SerpyExtensions.MethodField(select_related=['syllabus'])
 
     def get_syllabus(self, obj):
         return obj.syllabus.id if obj.syllabus else None
@@ -184,15 +184,15 @@ class SyllabusVersionSmallSerializer(serpy.Serializer):
     # Use a Field subclass like IntField if you need more validation.
     version = serpy.Field()
     status = serpy.Field()
-    slug = serpy.MethodField()
-    name = serpy.MethodField()
-    syllabus = serpy.MethodField()
-    duration_in_hours = serpy.MethodField()
-    duration_in_days = serpy.MethodField()
-    week_hours = serpy.MethodField()
-    github_url = serpy.MethodField()
-    logo = serpy.MethodField()
-    private = serpy.MethodField()
+    slug = SerpyExtensions.MethodField(select_related=['syllabus'])
+    name = SerpyExtensions.MethodField(select_related=['syllabus'])
+    syllabus = SerpyExtensions.MethodField(select_related=['syllabus'])
+    duration_in_hours = SerpyExtensions.MethodField(select_related=['syllabus'])
+    duration_in_days = SerpyExtensions.MethodField(select_related=['syllabus'])
+    week_hours = SerpyExtensions.MethodField(select_related=['syllabus'])
+    github_url = SerpyExtensions.MethodField(select_related=['syllabus'])
+    logo = SerpyExtensions.MethodField(select_related=['syllabus'])
+    private = SerpyExtensions.MethodField(select_related=['syllabus'])
 
     def get_slug(self, obj):
         return obj.syllabus.slug if obj.syllabus else None
@@ -308,10 +308,10 @@ class GetCohortSerializer(serpy.Serializer):
     schedule = GetSmallSyllabusScheduleSerializer(required=False)
     syllabus_version = SyllabusVersionSmallSerializer(required=False)
     academy = GetAcademySerializer()
-    timeslots = serpy.MethodField()
+    timeslots = SerpyExtensions.MethodField(prefetch_related=['cohorttimeslot_set'])
 
     def get_timeslots(self, obj):
-        timeslots = CohortTimeSlot.objects.filter(cohort__id=obj.id)
+        timeslots = obj.cohorttimeslot_set.all()
         return SmallCohortTimeSlotSerializer(timeslots, many=True).data
 
 
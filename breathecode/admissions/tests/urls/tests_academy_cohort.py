@@ -5,6 +5,7 @@ import re
 from unittest.mock import MagicMock, call, patch
 from django.utils import timezone
 from breathecode.admissions.caches import CohortCache
+from breathecode.admissions.serializers import GetCohortSerializer
 from breathecode.services import datetime_to_iso_format
 from random import choice
 from datetime import datetime, timedelta
@@ -1734,6 +1735,57 @@ class AcademyCohortTestSuite(AdmissionsTestCase):
             self.assertEqual(cohort_saved.send.call_args_list,
                              [call(instance=model1.cohort, sender=model1.cohort.__class__, created=False)])
 
+    """
+    🔽🔽🔽 Queries
+    """
+
+    @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
+    def test_academy_cohort__get__queries__one_cohort(self):
+        """Test /cohort without auth"""
+        self.headers(academy=1)
+        url = reverse_lazy('admissions:academy_cohort')
+        model = self.bc.database.create(authenticate=True,
+                                        profile_academy=True,
+                                        capability='read_all_cohort',
+                                        role='potato',
+                                        cohort=1,
+                                        cohort_time_slot=1,
+                                        syllabus_version=1,
+                                        syllabus_schedule=1,
+                                        country=1,
+                                        city=1)
+
+        # the capabilities, the cohorts with its relations and the timeslots
+        response = self.bc.check.queries(3, lambda: self.client.get(url))
+        json = response.json()
+
+        self.assertEqual(len(json), 1)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
+    def test_academy_cohort__get__queries__three_cohorts(self):
+        """Test /cohort without auth"""
+        self.headers(academy=1)
+        url = reverse_lazy('admissions:academy_cohort')
+        cohort_time_slots = [{'cohort_id': n} for n in range(1, 4)]
+        model = self.bc.database.create(authenticate=True,
+                                        profile_academy=True,
+                                        capability='read_all_cohort',
+                                        role='potato',
+                                        cohort=3,
+                                        cohort_time_slot=cohort_time_slots,
+                                        syllabus_version=1,
+                                        syllabus_schedule=1,
+                                        country=1,
+                                        city=1)
+
+        # the same queries than with one cohort
+        response = self.bc.check.queries(3, lambda: self.client.get(url))
+        json = response.json()
+
+        self.assertEqual(len(json), 3)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
     @patch.object(APIViewExtensionHandlers, '_spy_extensions', MagicMock())
     def test_academy_cohort__spy_extensions(self):
@@ -1755,7 +1807,7 @@ class AcademyCohortTestSuite(AdmissionsTestCase):
         self.client.get(url)
 
         self.assertEqual(APIViewExtensionHandlers._spy_extensions.call_args_list, [
-            call(['CacheExtension', 'PaginationExtension', 'SortExtension']),
+            call(['CacheExtension', 'FieldsExtension', 'PaginationExtension', 'SortExtension']),
         ])
 
     @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
@@ -1779,5 +1831,5 @@ class AcademyCohortTestSuite(AdmissionsTestCase):
         self.client.get(url)
 
         self.assertEqual(APIViewExtensionHandlers._spy_extension_arguments.call_args_list, [
-            call(cache=CohortCache, sort='-kickoff_date', paginate=True),
+            call(cache=CohortCache, sort='-kickoff_date', paginate=True, serializer=GetCohortSerializer),
         ])
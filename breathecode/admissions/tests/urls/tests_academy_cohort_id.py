@@ -4,6 +4,7 @@ Test /cohort
 from datetime import timedelta
 from django.utils import timezone
 from breathecode.admissions.caches import CohortCache
+from breathecode.admissions.serializers import GetCohortSerializer
 from unittest.mock import MagicMock, call, patch
 from django.urls.base import reverse_lazy
 from rest_framework import status
@@ -1432,7 +1433,7 @@ class AcademyCohortIdTestSuite(AdmissionsTestCase):
         self.client.get(url)
 
         self.assertEqual(APIViewExtensionHandlers._spy_extensions.call_args_list, [
-            call(['CacheExtension', 'PaginationExtension', 'SortExtension']),
+            call(['CacheExtension', 'FieldsExtension', 'PaginationExtension', 'SortExtension']),
         ])
 
     @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
@@ -1458,5 +1459,5 @@ class AcademyCohortIdTestSuite(AdmissionsTestCase):
         self.client.get(url)
 
         self.assertEqual(APIViewExtensionHandlers._spy_extension_arguments.call_args_list, [
-            call(cache=CohortCache, sort='-kickoff_date', paginate=True),
+            call(cache=CohortCache, sort='-kickoff_date', paginate=True, serializer=GetCohortSerializer),
         ])
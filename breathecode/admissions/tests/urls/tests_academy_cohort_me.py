@@ -5,6 +5,7 @@ import re
 from unittest.mock import MagicMock, call, patch
 from django.utils import timezone
 from breathecode.admissions.caches import CohortCache
+from breathecode.admissions.serializers import GetCohortSerializer
 from datetime import timedelta
 from django.urls.base import reverse_lazy
 from rest_framework import status
@@ -842,7 +843,7 @@ class AcademyCohortTestSuite(AdmissionsTestCase):
         self.client.get(url)
 
         self.assertEqual(APIViewExtensionHandlers._spy_extensions.call_args_list, [
-            call(['CacheExtension', 'PaginationExtension', 'SortExtension']),
+            call(['CacheExtension', 'FieldsExtension', 'PaginationExtension', 'SortExtension']),
         ])
 
     @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
@@ -870,5 +871,9 @@ class AcademyCohortTestSuite(AdmissionsTestCase):
         self.client.get(url)
 
         self.assertEqual(APIViewExtensionHandlers._spy_extension_arguments.call_args_list, [
-            call(cache=CohortCache, cache_per_user=True, sort='-kickoff_date', paginate=True),
+            call(cache=CohortCache,
+                 cache_per_user=True,
+                 sort='-kickoff_date',
+                 paginate=True,
+                 serializer=GetCohortSerializer),
         ])
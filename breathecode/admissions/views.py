@@ -199,7 +199,7 @@ class CohortUserView(APIView, GenerateLookupsMixin):
 
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         items = CohortUser.objects.all()
 
@@ -748,7 +748,8 @@ class CohortMeView(APIView, GenerateLookupsMixin):
     extensions = APIViewExtensions(cache=CohortCache,
                                    cache_per_user=True,
                                    sort='-kickoff_date',
-                                   paginate=True)
+                                   paginate=True,
+                                   serializer=GetCohortSerializer)
 
     @capable_of('read_single_cohort')
     def get(self, request, cohort_id=None, academy_id=None):
@@ -756,7 +757,7 @@ class CohortMeView(APIView, GenerateLookupsMixin):
 
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         if cohort_id is not None:
             if cohort_id.isnumeric():
@@ -793,7 +794,7 @@ class CohortMeView(APIView, GenerateLookupsMixin):
             items = items.filter(Q(name__icontains=like) | Q(slug__icontains=like))
 
         items = handler.queryset(items)
-        serializer = GetCohortSerializer(items, many=True)
+        serializer = handler.fields.serializer(items, many=True)
 
         return handler.response(serializer.data)
 
@@ -803,7 +804,10 @@ class AcademyCohortView(APIView, GenerateLookupsMixin):
     List all snippets, or create a new snippet.
     """
     permission_classes = [IsAuthenticated]
-    extensions = APIViewExtensions(cache=CohortCache, sort='-kickoff_date', paginate=True)
+    extensions = APIViewExtensions(cache=CohortCache,
+                                   sort='-kickoff_date',
+                                   paginate=True,
+                                   serializer=GetCohortSerializer)
 
     @capable_of('read_all_cohort')
     def get(self, request, cohort_id=None, academy_id=None):
@@ -811,7 +815,7 @@ class AcademyCohortView(APIView, GenerateLookupsMixin):
 
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         if cohort_id is not None:
             item = None
@@ -823,7 +827,7 @@ class AcademyCohortView(APIView, GenerateLookupsMixin):
             if item is None:
                 return Response(status=status.HTTP_404_NOT_FOUND)
 
-            serializer = GetCohortSerializer(item, many=False)
+            serializer = handler.fields.serializer(item, many=False)
             return handler.response(serializer.data)
 
         items = Cohort.objects.filter(academy__id=academy_id)
@@ -852,7 +856,7 @@ class AcademyCohortView(APIView, GenerateLookupsMixin):
             items = items.filter(Q(name__icontains=like) | Q(slug__icontains=like))
 
         items = handler.queryset(items)
-        serializer = GetCohortSerializer(items, many=True)
+        serializer = handler.fields.serializer(items, many=True)
 
         return handler.response(serializer.data)
 
@@ -1363,7 +1367,7 @@ class PublicCohortUserView(APIView, GenerateLookupsMixin):
 
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         items = CohortUser.objects.all()
 
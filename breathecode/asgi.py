@@ -8,13 +8,16 @@ https://docs.djangoproject.com/en/3.0/howto/deployment/asgi/
 """
 
 import os
-from django.core.asgi import get_asgi_application
 import django
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'breathecode.settings')
 
-django.setup()
-app = get_asgi_application()
+django.setup(set_prefix=False)
+
+from breathecode.utils.streaming_response import ASGIHandler
+
+# it sends the streaming responses of the querysets without blocking the event loop
+app = ASGIHandler()
 
 from django.conf import settings
 import breathecode.settings as app_settings
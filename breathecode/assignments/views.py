@@ -239,14 +239,14 @@ class CohortTaskView(APIView, GenerateLookupsMixin):
     """
     List all snippets, or create a new snippet.
     """
-    extensions = APIViewExtensions(cache=TaskCache, sort='-created_at', paginate=True)
+    extensions = APIViewExtensions(cache=TaskCache, sort='-created_at', paginate='cursor')
 
     @capable_of('read_assignment')
     def get(self, request, cohort_id, academy_id):
         handler = self.extensions(request)
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         items = Task.objects.all()
         lookup = {}
@@ -1,10 +1,74 @@
 # authentication.py
 
+import hashlib
+from typing import Optional
 from rest_framework.authentication import TokenAuthentication
 from .models import Token
 from rest_framework.exceptions import AuthenticationFailed
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.utils import timezone
 
+# seconds that a verified token is reused without querying the database
+TOKEN_CACHE_TIMEOUT = 60
+
+# fields of the user cached with its token, the other ones, like the password, are deferred
+TOKEN_USER_FIELDS = ('id', 'username', 'email', 'first_name', 'last_name', 'is_active', 'is_staff',
+                     'is_superuser')
+
+
+def get_token_cache_key(key: str) -> str:
+    # the keys are credentials, they are not stored in plain text
+    return 'token__' + hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def forget_tokens(keys: list[str]) -> None:
+    """Remove some tokens from the cache of the authentication."""
+
+    cache.delete_many([get_token_cache_key(key) for key in keys])
+
+
+def get_cached_token(key: str) -> Optional[Token]:
+    """
+    Get a token with its user, the user is built with `TOKEN_USER_FIELDS`, its other fields are loaded when
+    they are used.
+    """
+
+    cache_key = get_token_cache_key(key)
+
+    data = cache.get(cache_key)
+    if data is not None and 'user' in data:
+        user = data.pop('user')
+        token = Token(key=key, **data)
+        # from_db expects the values in the order of the fields of the model
+        fields = [x.attname for x in User._meta.concrete_fields if x.attname in user]
+        token.user = User.from_db(User.objects.db, fields, [user[x] for x in fields])
+        return token
+
+    token = Token.objects.select_related('user').filter(key=key).first()
+    if token is None:
+        return None
+
+    timeout = TOKEN_CACHE_TIMEOUT
+
+    # it must not outlive the token
+    if token.expires_at is not None:
+        timeout = min(timeout, int((token.expires_at - timezone.now()).total_seconds()))
+
+    if timeout > 0:
+        data = {
+            'id': token.id,
+            'user_id': token.user_id,
+            'token_type': token.token_type,
+            'expires_at': token.expires_at,
+            'created': token.created,
+            'user': {x: getattr(token.user, x)
+                     for x in TOKEN_USER_FIELDS},
+        }
+        cache.set(cache_key, data, timeout=timeout)
+
+    return token
+
 
 class ExpiringTokenAuthentication(TokenAuthentication):
     '''
@@ -14,7 +78,7 @@ class ExpiringTokenAuthentication(TokenAuthentication):
     '''
 
     def authenticate_credentials(self, key, request=None):
-        token = Token.objects.select_related('user').filter(key=key).first()
+        token = get_cached_token(key)
         if token is None:
             raise AuthenticationFailed({'error': 'Invalid or Inactive Token', 'is_authenticated': False})
 
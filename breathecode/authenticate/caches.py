@@ -0,0 +1,16 @@
+from breathecode.utils import Cache
+from .models import Permission, ProfileAcademy
+
+
+class ProfileAcademyCache(Cache):
+    model = ProfileAcademy
+    depends = ['Role', 'Capability', 'Academy']
+    parents = []
+    local_max_entries = 1000
+
+
+class PermissionCache(Cache):
+    model = Permission
+    depends = ['Group']
+    parents = []
+    local_max_entries = 1000
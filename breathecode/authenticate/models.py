@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import Any
 from django.contrib.auth.models import User, Group, Permission
 from django.core.exceptions import MultipleObjectsReturned
@@ -295,19 +294,11 @@ class Token(rest_framework.authtoken.models.Token):
 
         super().save(*args, **kwargs)
 
-    @staticmethod
-    def delete_expired_tokens(utc_now: datetime = timezone.now()) -> None:
-        """Delete expired tokens"""
-        utc_now = timezone.now()
-        Token.objects.filter(expires_at__lt=utc_now).delete()
-
     @classmethod
     def get_or_create(cls, user, token_type: str, **kwargs: Any):
         utc_now = timezone.now()
         kwargs['token_type'] = token_type
 
-        cls.delete_expired_tokens(utc_now)
-
         if token_type not in TOKEN_TYPE:
             raise InvalidTokenType(f'Invalid token_type, correct values are {", ".join(TOKEN_TYPE)}')
 
@@ -328,14 +319,17 @@ class Token(rest_framework.authtoken.models.Token):
         token = None
         created = False
 
+        # the expired tokens are not deleted yet, they are not reused
+        tokens = Token.objects.filter(Q(expires_at__gt=utc_now) | Q(expires_at__isnull=True))
+
         try:
             if token_type == 'one_time':
                 raise TryToGetOrCreateAOneTimeToken()
 
-            token, created = Token.objects.get_or_create(user=user, **kwargs)
+            token, created = tokens.get_or_create(user=user, **kwargs)
 
         except MultipleObjectsReturned:
-            token = Token.objects.filter(user=user, **kwargs).first()
+            token = tokens.filter(user=user, **kwargs).first()
 
         except TryToGetOrCreateAOneTimeToken:
             created = True
@@ -346,9 +340,8 @@ class Token(rest_framework.authtoken.models.Token):
     @classmethod
     def get_valid(cls, token: str):
         utc_now = timezone.now()
-        cls.delete_expired_tokens(utc_now)
 
-        # find among any non-expired token
+        # find among any non-expired token, the expired ones are deleted by `clean_expired_tokens`
         return Token.objects.filter(key=token).filter(Q(expires_at__gt=utc_now)
                                                       | Q(expires_at__isnull=True)).first()
 
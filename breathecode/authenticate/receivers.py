@@ -4,7 +4,8 @@ from django.db.models.signals import post_save, post_delete
 from django.contrib.auth.models import User, Group
 from django.core.exceptions import ObjectDoesNotExist
 
-from breathecode.authenticate.models import ProfileAcademy
+from breathecode.authenticate.models import ProfileAcademy, Token
+from breathecode.authenticate.authentication import TOKEN_USER_FIELDS, forget_tokens
 from breathecode.mentorship.models import MentorProfile
 
 logger = logging.getLogger(__name__)
@@ -73,3 +74,19 @@ def unset_user_group(sender, instance, **kwargs):
 
     if should_be_deleted and groups and group:
         groups.remove(group)
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def forget_token(sender, instance, **kwargs):
+    forget_tokens([instance.key])
+
+
+@receiver(post_save, sender=User)
+def forget_tokens_of_user(sender, instance, update_fields=None, **kwargs):
+    # the tokens keep a copy of some fields of the user, the saves of other ones, like the last_login of each
+    # login, do not need to query the tokens
+    if update_fields is not None and not set(update_fields) & {*TOKEN_USER_FIELDS, 'password'}:
+        return
+
+    forget_tokens(Token.objects.filter(user=instance).values_list('key', flat=True))
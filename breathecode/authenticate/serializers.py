@@ -9,7 +9,7 @@ import breathecode.notify.actions as notify_actions
 from django.utils import timezone
 from django.contrib.auth.models import User
 from .models import CredentialsGithub, ProfileAcademy, Role, UserInvite, Profile, Token, GitpodUser
-from breathecode.utils import ValidationException
+from breathecode.utils import ValidationException, SerpyExtensions
 from breathecode.admissions.models import Academy, Cohort
 from rest_framework.exceptions import ValidationError
 from rest_framework import serializers
@@ -226,8 +226,8 @@ class UserSmallSerializer(serpy.Serializer):
     email = serpy.Field()
     first_name = serpy.Field()
     last_name = serpy.Field()
-    github = serpy.MethodField()
-    profile = serpy.MethodField()
+    github = SerpyExtensions.MethodField(select_related=['credentialsgithub'])
+    profile = SerpyExtensions.MethodField(select_related=['profile'])
 
     def get_github(self, obj):
         if not hasattr(obj, 'credentialsgithub'):
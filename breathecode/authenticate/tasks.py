@@ -2,7 +2,7 @@ import logging, os
 from celery import shared_task, Task
 from .models import UserInvite, Token
 from django.contrib.auth.models import User
-from .actions import set_gitpod_user_expiration
+from .actions import set_gitpod_user_expiration, delete_tokens
 from breathecode.notify import actions as notify_actions
 
 API_URL = os.getenv('API_URL', '')
@@ -23,6 +23,15 @@ def async_set_gitpod_user_expiration(gitpoduser_id):
     return set_gitpod_user_expiration(gitpoduser_id) is not None
 
 
+@shared_task
+def async_delete_expired_tokens():
+    """Purge the expired tokens, the authentication doesn't delete them anymore"""
+
+    count = delete_tokens()
+    logger.debug(f'{count} expired tokens were deleted')
+    return count
+
+
 @shared_task
 def async_accept_user_from_waiting_list(user_invite_id: int) -> None:
     logger.debug(f'Process to accept UserInvite {user_invite_id}')
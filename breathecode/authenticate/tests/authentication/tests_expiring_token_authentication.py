@@ -0,0 +1,100 @@
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+from django.core.cache import cache
+from breathecode.authenticate.authentication import (TOKEN_USER_FIELDS, ExpiringTokenAuthentication,
+                                                     get_token_cache_key)
+from ..mixins.new_auth_test_case import AuthTestCase
+
+
+class ExpiringTokenAuthenticationTestSuite(AuthTestCase):
+    """
+    🔽🔽🔽 Cache of the tokens
+    """
+
+    def test_authenticate_credentials__second_call_does_not_query_the_database(self):
+        model = self.bc.database.create(user=1, token=1)
+        authentication = ExpiringTokenAuthentication()
+
+        with self.assertNumQueries(1):
+            user, token = authentication.authenticate_credentials(model.token.key)
+
+        with self.assertNumQueries(0):
+            user, token = authentication.authenticate_credentials(model.token.key)
+            self.assertEqual(user, model.user)
+            self.assertEqual(user.id, model.user.id)
+            self.assertEqual(user.email, model.user.email)
+            self.assertTrue(user.is_active)
+
+        # the fields that are not cached are loaded when they are used
+        with self.assertNumQueries(1):
+            self.assertEqual(user.password, model.user.password)
+
+        self.assertEqual(token, model.token)
+        self.assertEqual(token.user, user)
+        self.assertEqual(token.expires_at, model.token.expires_at)
+
+    def test_authenticate_credentials__the_password_is_not_cached(self):
+        model = self.bc.database.create(user=1, token=1)
+        authentication = ExpiringTokenAuthentication()
+
+        authentication.authenticate_credentials(model.token.key)
+
+        self.assertEqual(
+            cache.get(get_token_cache_key(model.token.key)), {
+                'id': model.token.id,
+                'user_id': model.user.id,
+                'token_type': model.token.token_type,
+                'expires_at': model.token.expires_at,
+                'created': model.token.created,
+                'user': {x: getattr(model.user, x)
+                         for x in TOKEN_USER_FIELDS},
+            })
+
+    def test_authenticate_credentials__token_deleted(self):
+        model = self.bc.database.create(user=1, token=1)
+        authentication = ExpiringTokenAuthentication()
+
+        authentication.authenticate_credentials(model.token.key)
+        model.token.delete()
+
+        with self.assertRaisesMessage(AuthenticationFailed, 'Invalid or Inactive Token'):
+            authentication.authenticate_credentials(model.token.key)
+
+    def test_authenticate_credentials__user_deactivated(self):
+        model = self.bc.database.create(user=1, token=1)
+        authentication = ExpiringTokenAuthentication()
+
+        authentication.authenticate_credentials(model.token.key)
+
+        model.user.is_active = False
+        model.user.save()
+
+        with self.assertRaisesMessage(AuthenticationFailed, 'Invalid or inactive user'):
+            authentication.authenticate_credentials(model.token.key)
+
+    def test_authenticate_credentials__last_login_saved(self):
+        model = self.bc.database.create(user=1, token=1)
+        authentication = ExpiringTokenAuthentication()
+
+        authentication.authenticate_credentials(model.token.key)
+
+        # the tokens do not cache the last_login, they are not queried
+        model.user.last_login = timezone.now()
+        with self.assertNumQueries(1):
+            model.user.save(update_fields=['last_login'])
+
+        self.assertIsNotNone(cache.get(get_token_cache_key(model.token.key)))
+
+    def test_authenticate_credentials__token_expired_while_it_was_cached(self):
+        token = {'expires_at': timezone.now() + timedelta(minutes=5), 'token_type': 'temporal'}
+        model = self.bc.database.create(user=1, token=token)
+        authentication = ExpiringTokenAuthentication()
+
+        authentication.authenticate_credentials(model.token.key)
+
+        model.token.expires_at = timezone.now() - timedelta(seconds=1)
+        model.token.save()
+
+        with self.assertRaisesMessage(AuthenticationFailed, 'Token expired at'):
+            authentication.authenticate_credentials(model.token.key)
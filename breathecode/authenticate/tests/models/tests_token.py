@@ -349,9 +349,9 @@ class TokenTestSuite(AuthTestCase):
         end = timezone.now()
 
         db = self.all_token_dict()
-        created = db[0]['created']
-        expires_at = db[0]['expires_at']
-        token = db[0]['key']
+        created = db[1]['created']
+        expires_at = db[1]['expires_at']
+        token = db[1]['key']
 
         self.assertGreater(created, start)
         self.assertLess(created, end)
@@ -361,11 +361,19 @@ class TokenTestSuite(AuthTestCase):
         self.assertGreater(expires_at, end + timedelta(days=1) - timedelta(seconds=10))
         self.assertToken(token)
 
-        del db[0]['created']
-        del db[0]['expires_at']
-        del db[0]['key']
+        del db[1]['created']
+        del db[1]['expires_at']
+        del db[1]['key']
 
-        self.assertEqual(db, [{'id': 2, 'token_type': 'login', 'user_id': 1}])
+        # the expired token is deleted by a scheduled job
+        self.assertEqual(db, [
+            self.model_to_dict(model, 'token'),
+            {
+                'id': 2,
+                'token_type': 'login',
+                'user_id': 1
+            },
+        ])
 
     def test_get_or_create__token_type_temporal__token_exists(self):
         start = timezone.now()
@@ -377,9 +385,9 @@ class TokenTestSuite(AuthTestCase):
         end = timezone.now()
 
         db = self.all_token_dict()
-        created = db[0]['created']
-        expires_at = db[0]['expires_at']
-        token = db[0]['key']
+        created = db[1]['created']
+        expires_at = db[1]['expires_at']
+        token = db[1]['key']
 
         self.assertGreater(created, start)
         self.assertLess(created, end)
@@ -389,11 +397,19 @@ class TokenTestSuite(AuthTestCase):
         self.assertGreater(expires_at, end + timedelta(minutes=10) - timedelta(seconds=10))
         self.assertToken(token)
 
-        del db[0]['created']
-        del db[0]['expires_at']
-        del db[0]['key']
+        del db[1]['created']
+        del db[1]['expires_at']
+        del db[1]['key']
 
-        self.assertEqual(db, [{'id': 2, 'token_type': 'temporal', 'user_id': 1}])
+        # the expired token is deleted by a scheduled job
+        self.assertEqual(db, [
+            self.model_to_dict(model, 'token'),
+            {
+                'id': 2,
+                'token_type': 'temporal',
+                'user_id': 1
+            },
+        ])
 
     def test_get_or_create__token_type_one_time__token_exists(self):
         start = timezone.now()
@@ -465,9 +481,9 @@ class TokenTestSuite(AuthTestCase):
         end = timezone.now()
 
         db = self.all_token_dict()
-        created = db[0]['created']
-        expires_at = db[0]['expires_at']
-        token = db[0]['key']
+        created = db[2]['created']
+        expires_at = db[2]['expires_at']
+        token = db[2]['key']
 
         self.assertGreater(created, start)
         self.assertLess(created, end)
@@ -477,11 +493,20 @@ class TokenTestSuite(AuthTestCase):
         self.assertGreater(expires_at, end + timedelta(days=1) - timedelta(seconds=10))
         self.assertToken(token)
 
-        del db[0]['created']
-        del db[0]['expires_at']
-        del db[0]['key']
+        del db[2]['created']
+        del db[2]['expires_at']
+        del db[2]['key']
 
-        self.assertEqual(db, [{'id': 3, 'token_type': 'login', 'user_id': 1}])
+        # the expired tokens are deleted by a scheduled job
+        self.assertEqual(db, [
+            self.model_to_dict(models[0], 'token'),
+            self.model_to_dict(models[1], 'token'),
+            {
+                'id': 3,
+                'token_type': 'login',
+                'user_id': 1
+            },
+        ])
 
     def test_get_or_create__token_type_temporal__token_exists__token_expired(self):
         start = timezone.now()
@@ -496,9 +521,9 @@ class TokenTestSuite(AuthTestCase):
         end = timezone.now()
 
         db = self.all_token_dict()
-        created = db[0]['created']
-        expires_at = db[0]['expires_at']
-        token = db[0]['key']
+        created = db[2]['created']
+        expires_at = db[2]['expires_at']
+        token = db[2]['key']
 
         self.assertGreater(created, start)
         self.assertLess(created, end)
@@ -508,11 +533,20 @@ class TokenTestSuite(AuthTestCase):
         self.assertGreater(expires_at, end + timedelta(minutes=10) - timedelta(seconds=10))
         self.assertToken(token)
 
-        del db[0]['created']
-        del db[0]['expires_at']
-        del db[0]['key']
+        del db[2]['created']
+        del db[2]['expires_at']
+        del db[2]['key']
 
-        self.assertEqual(db, [{'id': 3, 'token_type': 'temporal', 'user_id': 1}])
+        # the expired tokens are deleted by a scheduled job
+        self.assertEqual(db, [
+            self.model_to_dict(models[0], 'token'),
+            self.model_to_dict(models[1], 'token'),
+            {
+                'id': 3,
+                'token_type': 'temporal',
+                'user_id': 1
+            },
+        ])
 
     """
     🔽🔽🔽 validate_and_destroy bad arguments
@@ -612,64 +646,3 @@ class TokenTestSuite(AuthTestCase):
 
         self.assertEqual(result, model.token)
         self.assertEqual(self.all_token_dict(), [self.model_to_dict(model, 'token')])
-
-    """
-    🔽🔽🔽 delete_expired_tokens Token not exists
-    """
-
-    def test_validate_and_destroy__token_not_exists(self):
-        result = Token.delete_expired_tokens()
-
-        self.assertEqual(result, None)
-        self.assertEqual(self.all_token_dict(), [])
-
-    def test_validate_and_destroy__token_not_exists__with_arg(self):
-        now = timezone.now()
-        result = Token.delete_expired_tokens(now)
-
-        self.assertEqual(result, None)
-        self.assertEqual(self.all_token_dict(), [])
-
-    """
-    🔽🔽🔽 delete_expired_tokens Token exists but are expired
-    """
-
-    def test_validate_and_destroy__token_exists_but_are_expired(self):
-        now = timezone.now()
-        token_kwargs = {'expires_at': now - timedelta(seconds=1)}
-        self.generate_models(token=True, token_kwargs=token_kwargs)
-        result = Token.delete_expired_tokens()
-
-        self.assertEqual(result, None)
-        self.assertEqual(self.all_token_dict(), [])
-
-    def test_validate_and_destroy__token_exists_but_are_expired__with_arg(self):
-        now = timezone.now()
-        token_kwargs = {'expires_at': now - timedelta(seconds=1)}
-        self.generate_models(token=True, token_kwargs=token_kwargs)
-        result = Token.delete_expired_tokens(now)
-
-        self.assertEqual(result, None)
-        self.assertEqual(self.all_token_dict(), [])
-
-    """
-    🔽🔽🔽 delete_expired_tokens Token exists and is valid
-    """
-
-    def test_validate_and_destroy__token_exists_and_is_valid(self):
-        now = timezone.now()
-        token_kwargs = {'expires_at': now + timedelta(minutes=1)}
-        model = self.generate_models(token=True, token_kwargs=token_kwargs)
-        result = Token.delete_expired_tokens()
-
-        self.assertEqual(result, None)
-        self.assertEqual(self.all_token_dict(), [self.model_to_dict(model, 'token')])
-
-    def test_validate_and_destroy__token_exists_and_is_valid__with_arg(self):
-        now = timezone.now()
-        token_kwargs = {'expires_at': now + timedelta(minutes=1)}
-        model = self.generate_models(token=True, token_kwargs=token_kwargs)
-        result = Token.delete_expired_tokens(now)
-
-        self.assertEqual(result, None)
-        self.assertEqual(self.all_token_dict(), [self.model_to_dict(model, 'token')])
@@ -0,0 +1,45 @@
+from datetime import timedelta
+from django.utils import timezone
+from breathecode.authenticate.tasks import async_delete_expired_tokens
+from ..mixins.new_auth_test_case import AuthTestCase
+
+
+class AsyncDeleteExpiredTokensTestSuite(AuthTestCase):
+    """
+    🔽🔽🔽 With zero Token
+    """
+
+    def test_with_zero_tokens(self):
+        result = async_delete_expired_tokens()
+
+        self.assertEqual(result, 0)
+        self.assertEqual(self.bc.database.list_of('authenticate.Token'), [])
+
+    """
+    🔽🔽🔽 With expired and valid Token
+    """
+
+    def test_with_expired_and_valid_tokens(self):
+        utc_now = timezone.now()
+        tokens = [
+            {
+                'token_type': 'login',
+                'expires_at': utc_now - timedelta(seconds=1),
+            },
+            {
+                'token_type': 'login',
+                'expires_at': utc_now + timedelta(minutes=1),
+            },
+            {
+                'token_type': 'permanent',
+            },
+        ]
+        model = self.bc.database.create(token=tokens)
+
+        result = async_delete_expired_tokens()
+
+        self.assertEqual(result, 1)
+        self.assertEqual(self.bc.database.list_of('authenticate.Token'), [
+            self.bc.format.to_dict(model.token[1]),
+            self.bc.format.to_dict(model.token[2]),
+        ])
@@ -220,7 +220,7 @@ class AuthenticateTestSuite(AuthTestCase):
 
         url = reverse_lazy('marketing:lead_all')
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
 
         self.assertDatetime(json[0]['created_at'])
         del json[0]['created_at']
@@ -302,7 +302,7 @@ class AuthenticateTestSuite(AuthTestCase):
 
         url = reverse_lazy('authenticate:user')
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
 
         self.assertEqual(json, [{
             'id': model['user'].id,
@@ -1,6 +1,7 @@
 """
 Test cases for /user
 """
+from json import loads
 from django.urls.base import reverse_lazy
 from rest_framework import status
 from ..mixins import AuthTestCase
@@ -30,7 +31,7 @@ class AuthenticateTestSuite(AuthTestCase):
 
         self.client.force_authenticate(user=self.user)
         response = self.client.get(url)
-        json = response.json()
+        json = loads(b''.join(response.streaming_content))
 
         self.assertEqual(json, [{
             'id': self.user.id,
@@ -51,13 +51,15 @@ from .actions import reset_password, resend_invite, generate_academy_token, upda
 from breathecode.admissions.models import Academy, CohortUser
 from breathecode.notify.models import SlackTeam
 from breathecode.utils import (capable_of, ValidationException, HeaderLimitOffsetPagination,
-                               GenerateLookupsMixin)
+                               GenerateLookupsMixin, get_csv_header, streaming_response)
 from breathecode.utils.views import private_view, render_message, set_query_parameter
 from breathecode.utils.find_by_full_name import query_like_by_full_name
 from breathecode.utils.views import set_query_parameter
 from .serializers import (
     GetProfileAcademySmallSerializer,
     GetProfileSerializer,
+    GetProfileSmallSerializer,
+    GithubSmallSerializer,
     ProfileSerializer,
     UserInviteSmallSerializer,
     UserInviteWaitingListSerializer,
@@ -705,8 +707,14 @@ def get_users(request):
 
     query = query.exclude(email__contains='@token.com')
     query = query.order_by('-date_joined')
-    users = UserSmallSerializer(query, many=True)
-    return Response(users.data)
+
+    # github and profile are method fields, their columns are not declared in the serializer
+    csv_header = get_csv_header(UserSmallSerializer,
+                                nested={
+                                    'github': GithubSmallSerializer,
+                                    'profile': GetProfileSmallSerializer,
+                                })
+    return streaming_response(request, query, UserSmallSerializer, csv_header=csv_header)
 
 
 @api_view(['GET'])
@@ -0,0 +1,8 @@
+"""
+Benchmarks of the hottest endpoints, they seed large datasets and compare the queries and the latency of
+each endpoint with the baselines of `baselines.json`.
+
+Run them with `pipenv run benchmark`, `pipenv run benchmark --update` stores the new baselines. The latency
+depends on the machine, so it's just compared with `pipenv run benchmark --duration`, against baselines
+measured in the same machine.
+"""
@@ -0,0 +1,45 @@
+"""
+Benchmarks of /v1/admissions
+"""
+from unittest.mock import MagicMock, patch
+from django.urls.base import reverse_lazy
+from .mixins import BenchmarkTestCase, DATASET_SIZE
+
+
+class AdmissionsBenchmarkSuite(BenchmarkTestCase):
+
+    @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
+    def test_academy_cohort(self):
+        cohort_time_slots = [{'cohort_id': n} for n in range(1, DATASET_SIZE + 1)]
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        role=1,
+                                        capability='read_all_cohort',
+                                        cohort=DATASET_SIZE,
+                                        cohort_time_slot=cohort_time_slots,
+                                        syllabus_version=1,
+                                        syllabus_schedule=1)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('admissions:academy_cohort') + '?limit=100'
+        self.benchmark('admissions:academy_cohort', lambda: self.client.get(url))
+
+    @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
+    def test_academy_cohort_me(self):
+        cohort_users = [{'cohort_id': n} for n in range(1, DATASET_SIZE + 1)]
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        role=1,
+                                        capability='read_single_cohort',
+                                        cohort=DATASET_SIZE,
+                                        cohort_user=cohort_users,
+                                        syllabus_version=1,
+                                        syllabus_schedule=1)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('admissions:academy_cohort_me') + '?limit=100'
+        self.benchmark('admissions:academy_cohort_me', lambda: self.client.get(url))
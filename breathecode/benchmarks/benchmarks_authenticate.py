@@ -0,0 +1,23 @@
+"""
+Benchmarks of /v1/auth
+"""
+from unittest.mock import MagicMock, patch
+from django.urls.base import reverse_lazy
+from .mixins import BenchmarkTestCase, DATASET_SIZE
+
+
+class AuthenticateBenchmarkSuite(BenchmarkTestCase):
+
+    @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
+    def test_user_me(self):
+        cohort_users = [{'cohort_id': n} for n in range(1, DATASET_SIZE + 1)]
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        role=1,
+                                        cohort=DATASET_SIZE,
+                                        cohort_user=cohort_users)
+
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('authenticate:user_me')
+        self.benchmark('authenticate:user_me', lambda: self.client.get(url))
@@ -0,0 +1,18 @@
+"""
+Benchmarks of /v1/events
+"""
+from unittest.mock import MagicMock, patch
+from django.urls.base import reverse_lazy
+from django.utils import timezone
+from .mixins import BenchmarkTestCase, DATASET_SIZE
+
+
+class EventsBenchmarkSuite(BenchmarkTestCase):
+
+    @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
+    def test_ical_cohorts(self):
+        cohort = {'ending_date': timezone.now(), 'never_ends': False, 'stage': 'STARTED'}
+        self.bc.database.create(academy=1, cohort=(DATASET_SIZE, cohort), cohort_time_slot=1)
+
+        url = reverse_lazy('events:ical_cohorts') + '?academy=1'
+        self.benchmark('events:ical_cohorts', lambda: self.client.get(url))
@@ -0,0 +1,31 @@
+"""
+Benchmarks of /v1/marketing
+"""
+from django.urls.base import reverse_lazy
+from .mixins import BenchmarkTestCase, DATASET_SIZE
+
+
+class MarketingBenchmarkSuite(BenchmarkTestCase):
+
+    def test_lead_all(self):
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        role=1,
+                                        capability='read_lead',
+                                        form_entry=DATASET_SIZE)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('marketing:lead_all')
+        self.benchmark('marketing:lead_all', lambda: self.client.get(url))
+
+    def test_report_lead(self):
+        model = self.bc.database.create(user=1, profile_academy=1, form_entry=DATASET_SIZE)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        # the reports by date use a function of PostgreSQL
+        url = reverse_lazy('marketing:report_lead') + '?by=location,course'
+        self.benchmark('marketing:report_lead', lambda: self.client.get(url))
@@ -0,0 +1,23 @@
+"""
+Benchmarks of /v1/mentorship
+"""
+from django.urls.base import reverse_lazy
+from .mixins import BenchmarkTestCase, DATASET_SIZE
+
+
+class MentorshipBenchmarkSuite(BenchmarkTestCase):
+
+    def test_academy_session(self):
+        model = self.bc.database.create(user=1,
+                                        profile_academy=1,
+                                        role=1,
+                                        capability='read_mentorship_session',
+                                        mentor_profile=1,
+                                        mentorship_service=1,
+                                        mentorship_session=DATASET_SIZE)
+
+        self.bc.request.set_headers(academy=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('mentorship:academy_session') + '?limit=100'
+        self.benchmark('mentorship:academy_session', lambda: self.client.get(url))
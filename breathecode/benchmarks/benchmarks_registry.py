@@ -0,0 +1,13 @@
+"""
+Benchmarks of /v1/registry
+"""
+from .mixins import BenchmarkTestCase, DATASET_SIZE
+
+
+class RegistryBenchmarkSuite(BenchmarkTestCase):
+
+    def test_asset(self):
+        self.bc.database.create(asset=DATASET_SIZE, academy=1)
+
+        url = '/v1/registry/asset?limit=100'
+        self.benchmark('registry:asset', lambda: self.client.get(url))
@@ -0,0 +1,4 @@
+"""
+Mixins
+"""
+from .benchmark_test_case import BenchmarkTestCase, DATASET_SIZE
@@ -0,0 +1,133 @@
+"""
+Test case that measures an endpoint and compares it with its baseline.
+"""
+import json, os, statistics, time
+from pathlib import Path
+from typing import Callable
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from breathecode.tests.mixins import (GenerateModelsMixin, CacheMixin, TokenMixin, GenerateQueriesMixin,
+                                      HeadersMixin, DatetimeMixin, BreathecodeMixin)
+from breathecode.utils.cache import clear_local_cache
+
+__all__ = ['BenchmarkTestCase', 'DATASET_SIZE']
+
+BASELINES_PATH = Path(__file__).resolve().parent.parent / 'baselines.json'
+
+# rows seeded of each model, the baselines were measured with this size
+DATASET_SIZE = 2000
+
+# requests measured for each benchmark, the latency is the median of them
+ROUNDS = int(os.getenv('BENCHMARK_ROUNDS', 5))
+
+# the latency depends on the machine, it's just compared with the baseline measured in the same machine
+CHECK_DURATION = os.getenv('BENCHMARK_DURATION') == 'TRUE'
+
+# the latency can be this times the baseline
+DURATION_TOLERANCE = float(os.getenv('BENCHMARK_DURATION_TOLERANCE', 3))
+
+# below this number of milliseconds the latency is just noise
+MIN_DURATION = 100
+
+# store the measures as the new baselines instead of comparing them
+UPDATE_BASELINES = os.getenv('BENCHMARK_UPDATE') == 'TRUE'
+
+
+def _load_baselines() -> dict[str, dict[str, int]]:
+    if not BASELINES_PATH.exists():
+        return {}
+
+    with open(BASELINES_PATH) as f:
+        return json.load(f)
+
+
+def _save_baseline(name: str, measure: dict[str, int]) -> None:
+    baselines = _load_baselines()
+    baselines[name] = measure
+
+    with open(BASELINES_PATH, 'w') as f:
+        json.dump(dict(sorted(baselines.items())), f, indent=4)
+        f.write('\n')
+
+
+class BenchmarkTestCase(APITestCase, GenerateModelsMixin, CacheMixin, TokenMixin, GenerateQueriesMixin,
+                        HeadersMixin, DatetimeMixin, BreathecodeMixin):
+    """Benchmarks with the same tools than the tests"""
+
+    def setUp(self):
+        self.generate_queries()
+        self.set_test_instance(self)
+
+    def _measure(self, callback: Callable):
+        # each round is a cold request
+        cache.clear()
+        clear_local_cache()
+
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            response = callback()
+
+            # the streaming responses are rendered while they are read
+            if response.streaming:
+                b''.join(response.streaming_content)
+
+            duration = time.perf_counter() - started
+
+        return response, len(context.captured_queries), duration
+
+    def benchmark(self, name: str, callback: Callable, rounds: int = ROUNDS):
+        """
+        Measure the queries and the latency of a request and compare them with the baseline of `name`.
+
+        The queries can't be more than the ones of the baseline, each round starts with the cache empty. The
+        latency is just compared with `BENCHMARK_DURATION=TRUE`, it can't be more than the one of the
+        baseline multiplied by `BENCHMARK_DURATION_TOLERANCE`, so the baselines must be measured in the same
+        machine, like `pipenv run benchmark --update` on the base branch and `pipenv run benchmark
+        --duration` on the branch.
+
+        Usage:
+
+        ```py
+        url = reverse_lazy('admissions:academy_cohort')
+        response = self.benchmark('admissions:academy_cohort', lambda: self.client.get(url))
+        ```
+        """
+
+        queries = []
+        durations = []
+
+        for _ in range(rounds):
+            response, num_queries, duration = self._measure(callback)
+            self.assertLess(response.status_code, 400, f'{name} returned {response.status_code}')
+
+            queries.append(num_queries)
+            durations.append(duration)
+
+        measure = {
+            'queries': max(queries),
+            'duration': round(statistics.median(durations) * 1000),
+        }
+
+        if UPDATE_BASELINES:
+            _save_baseline(name, measure)
+            return response
+
+        baseline = _load_baselines().get(name)
+        if baseline is None:
+            self.fail(f'{name} does not have a baseline, run `pipenv run benchmark --update`')
+
+        self.assertLessEqual(
+            measure['queries'], baseline['queries'],
+            f'{name} runs {measure["queries"]} queries, the baseline is {baseline["queries"]}')
+
+        if not CHECK_DURATION:
+            return response
+
+        max_duration = max(baseline['duration'] * DURATION_TOLERANCE, MIN_DURATION)
+        self.assertLessEqual(
+            measure['duration'], max_duration,
+            f'{name} takes {measure["duration"]}ms, the baseline is {baseline["duration"]}ms')
+
+        return response
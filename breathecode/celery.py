@@ -34,6 +34,18 @@ app.conf.update(BROKER_URL=REDIS_URL, CELERY_RESULT_BACKEND=REDIS_URL, namespace
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
 
+# tasks run by `celery beat`
+app.conf.beat_schedule = {
+    'sync-student-activities': {
+        'task': 'breathecode.activity.tasks.sync_student_activities',
+        'schedule': 60 * 5,
+    },
+    'delete-expired-tokens': {
+        'task': 'breathecode.authenticate.tasks.async_delete_expired_tokens',
+        'schedule': 60 * 60,
+    },
+}
+
 if bool(os.environ.get('CELERY_WORKER_RUNNING', False)) and REDIS_URL:
     from django.conf import settings
     import rollbar
@@ -1,9 +1,111 @@
-from breathecode.utils import CACHE_DESCRIPTORS
+import logging
+from urllib.parse import urlsplit
+from django.core.cache import cache
+from django.db import transaction
+from django.test import RequestFactory
+from django.urls import resolve, Resolver404
+from breathecode.utils import CACHE_DEPENDENCIES, CACHE_DESCRIPTORS, Cache, clear_cache_tree, get_cache_dependents
+from breathecode.utils.api_view_extensions.extensions.cache_extension import WARMING_HEADER
 
-__all__ = ['clean_cache']
+__all__ = ['clean_cache', 'get_warmable_caches', 'warm_cache']
 
+logger = logging.getLogger(__name__)
 
-def clean_cache(key):
-    if key in CACHE_DESCRIPTORS:
-        cache = CACHE_DESCRIPTORS[key]
-        cache.clear()
+# seconds to wait before warming, the invalidations of a mass update are grouped in one warming
+WARMING_DELAY = 30
+
+# fields of each model that the cached payloads include, the saves that don't change them keep the caches,
+# like the last_login written in each login, the other models invalidate them in each save
+CACHED_FIELDS = {
+    'User': {'id', 'email', 'first_name', 'last_name', 'date_joined'},
+}
+
+
+def get_warmable_caches(name: str) -> list[Cache]:
+    """Get the caches with warming enabled that are invalidated when `name` changes."""
+
+    names = get_cache_dependents(name)
+    return [x for x in CACHE_DESCRIPTORS.values() if x.warm_entries and x.model.__name__ in names]
+
+
+def schedule_cache_warming(name: str) -> None:
+    from . import tasks
+
+    if not get_warmable_caches(name):
+        return
+
+    if cache.add(f'{name}__warming', 1, timeout=WARMING_DELAY):
+        tasks.async_warm_cache.apply_async(args=(name, ), countdown=WARMING_DELAY)
+
+
+def get_cached_values(instance) -> dict:
+    """Get the values of the `CACHED_FIELDS` of an instance, the deferred fields are not loaded."""
+
+    fields = CACHED_FIELDS.get(type(instance).__name__, set())
+    return {x: instance.__dict__[x] for x in fields if x in instance.__dict__}
+
+
+def remember_cached_values(instance) -> None:
+    """Store the values of the `CACHED_FIELDS` of an instance, they are compared in its next save."""
+
+    instance._cached_values = get_cached_values(instance)
+
+
+def clean_cache(model, update_fields=None, instance=None, created=False):
+    name = model.__name__
+
+    # no cache includes data of this model
+    if name not in CACHE_DEPENDENCIES:
+        return
+
+    fields = CACHED_FIELDS.get(name)
+    if fields is not None and update_fields and not set(update_fields) & fields:
+        return
+
+    # a save without update_fields writes every field, the values that it had when it was loaded are compared
+    if (fields is not None and not update_fields and instance is not None and not created
+            and getattr(instance, '_cached_values', None) == get_cached_values(instance)):
+        return
+
+    clear_cache_tree(name)
+
+    # the workers must read the committed data
+    transaction.on_commit(lambda: schedule_cache_warming(name))
+
+
+def warm_cache(descriptor: Cache) -> int:
+    """Request again the most requested urls of a cache, it returns the number of urls warmed."""
+
+    factory = RequestFactory()
+    warmed = 0
+
+    for url in descriptor.get_hot_requests():
+        parsed = urlsplit(url)
+
+        try:
+            match = resolve(parsed.path)
+
+        except Resolver404:
+            descriptor.forget_request(url)
+            continue
+
+        request = factory.get(f'{parsed.path}?{parsed.query}',
+                              secure=parsed.scheme == 'https',
+                              HTTP_HOST=parsed.netloc,
+                              **{f'HTTP_{WARMING_HEADER.upper().replace("-", "_")}': '1'})
+
+        try:
+            response = match.func(request, *match.args, **match.kwargs)
+
+        except Exception as e:
+            logger.exception(f'Error warming {url}: {e}')
+            continue
+
+        # it requires authentication or it's not available anymore
+        if response.status_code >= 400:
+            descriptor.forget_request(url)
+            continue
+
+        warmed += 1
+
+    return warmed
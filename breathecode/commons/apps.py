@@ -6,4 +6,8 @@ class CommonsConfig(AppConfig):
     name = 'breathecode.commons'
 
     def ready(self):
+        from django.utils.module_loading import autodiscover_modules
         from . import receivers
+
+        # register every cache descriptor to build the dependency graph before the first signal
+        autodiscover_modules('caches')
@@ -0,0 +1,64 @@
+import copy
+import timeit
+from django.core.management.base import BaseCommand
+from breathecode.admissions.caches import CohortCache
+from breathecode.admissions.models import Cohort
+from breathecode.admissions.serializers import GetCohortSerializer
+from breathecode.registry.caches import AssetCache
+from breathecode.registry.models import Asset
+from breathecode.registry.serializers import AssetSerializer
+from breathecode.utils import CacheCodec, JsonCacheCodec, OrjsonCacheCodec
+from breathecode.utils.cache_codecs import orjson
+
+
+class Command(BaseCommand):
+    help = 'Compare the cache codecs with the AssetCache and CohortCache payloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=100, help='Number of rows of each payload')
+        parser.add_argument('--repeat', type=int, default=20, help='Number of runs of each measure')
+
+    def handle(self, *args, **options):
+        limit = options['limit']
+        repeat = options['repeat']
+
+        payloads = [
+            (AssetCache.__name__, AssetSerializer(Asset.objects.all()[0:limit], many=True).data),
+            (CohortCache.__name__, GetCohortSerializer(Cohort.objects.all()[0:limit], many=True).data),
+        ]
+
+        codecs = [
+            ('json', JsonCacheCodec(compress_min_size=None)),
+            ('json+zlib', JsonCacheCodec(compress_min_size=0)),
+        ]
+
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson is not installed, skipping its codec'))
+
+        else:
+            codecs += [
+                ('orjson', OrjsonCacheCodec(compress_min_size=None)),
+                ('orjson+zlib', OrjsonCacheCodec(compress_min_size=0)),
+            ]
+
+        for name, data in payloads:
+            if not data:
+                self.stdout.write(self.style.WARNING(f'{name}: there are no rows to serialize'))
+                continue
+
+            self.stdout.write(f'{name} ({len(data)} rows)')
+
+            for codec_name, codec in codecs:
+                encode, decode, size = self.measure(codec, data, repeat)
+                self.stdout.write(f'  {codec_name:<12} encode {encode:8.3f}ms  decode {decode:8.3f}ms  '
+                                  f'size {size / 1024:8.1f}KB')
+
+    def measure(self, codec: CacheCodec, data, repeat: int):
+        # the json codec transform the datetimes in place
+        copies = [copy.deepcopy(data) for _ in range(0, repeat)]
+
+        value = codec.encode(copy.deepcopy(data))
+        encode = timeit.timeit(lambda: codec.encode(copies.pop()), number=repeat)
+        decode = timeit.timeit(lambda: codec.decode(value), number=repeat)
+
+        return encode / repeat * 1000, decode / repeat * 1000, len(value)
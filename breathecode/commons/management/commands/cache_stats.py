@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from breathecode.utils import CACHE_DESCRIPTORS, get_cache_stats
+
+
+class Command(BaseCommand):
+    help = 'Show the hits, misses, sets, invalidations, evictions and bytes written of each cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Reset the counters after showing them')
+
+    def handle(self, *args, **options):
+        for stats in get_cache_stats():
+            lookups = stats['hits'] + stats['misses']
+            hit_rate = stats['hits'] / lookups * 100 if lookups else 0
+
+            self.stdout.write(
+                f'{stats["name"]:<20} hits {stats["hits"]:>8}  misses {stats["misses"]:>8}  '
+                f'hit rate {hit_rate:5.1f}%  sets {stats["sets"]:>8}  '
+                f'invalidations {stats["invalidations"]:>8}  evictions {stats["evictions"]:>8}  '
+                f'bytes {stats["bytes"] / 1024:10.1f}KB')
+
+        if options['reset']:
+            for descriptor in CACHE_DESCRIPTORS.values():
+                descriptor.reset_stats()
+
+            self.stdout.write(self.style.SUCCESS('The counters were reset'))
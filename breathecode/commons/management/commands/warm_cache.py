@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from breathecode.utils import CACHE_DESCRIPTORS
+from ...actions import warm_cache
+
+
+class Command(BaseCommand):
+    help = 'Request again the most requested urls of the caches with warming enabled'
+
+    def add_arguments(self, parser):
+        parser.add_argument('caches', nargs='*', type=str, help='Names of the caches, like AssetCache')
+
+    def handle(self, *args, **options):
+        descriptors = [x for x in CACHE_DESCRIPTORS.values() if x.warm_entries]
+
+        if options['caches']:
+            descriptors = [x for x in descriptors if type(x).__name__ in options['caches']]
+
+        for descriptor in descriptors:
+            warmed = warm_cache(descriptor)
+            self.stdout.write(f'{type(descriptor).__name__}: {warmed} urls warmed')
@@ -1,18 +1,34 @@
 import logging
 from django.dispatch import receiver
-from django.db.models.signals import post_save, post_delete
+from django.contrib.auth.models import User
+from django.db.models.signals import post_init, post_save, post_delete, m2m_changed
 import breathecode.commons.actions as actions
 
 logger = logging.getLogger(__name__)
 
 
+@receiver(post_init, sender=User)
+def remember_cached_values_after_init(sender, instance, **kwargs):
+    actions.remember_cached_values(instance)
+
+
 @receiver(post_save)
-def clean_cache_after_save(sender, **kwargs):
-    key = hash(sender)
-    actions.clean_cache(key)
+def clean_cache_after_save(sender, instance, created=False, update_fields=None, **kwargs):
+    actions.clean_cache(sender, update_fields=update_fields, instance=instance, created=created)
+
+    if sender.__name__ in actions.CACHED_FIELDS:
+        actions.remember_cached_values(instance)
 
 
 @receiver(post_delete)
 def clean_cache_after_delete(sender, **kwargs):
-    key = hash(sender)
-    actions.clean_cache(key)
+    actions.clean_cache(sender)
+
+
+@receiver(m2m_changed)
+def clean_cache_after_m2m_changed(sender, instance, action, model, **kwargs):
+    if action not in ['post_add', 'post_remove', 'post_clear']:
+        return
+
+    actions.clean_cache(type(instance))
+    actions.clean_cache(model)
@@ -0,0 +1,14 @@
+import logging
+from celery import shared_task
+from . import actions
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def async_warm_cache(name):
+    logger.info(f'Warming the caches invalidated by {name}')
+
+    for descriptor in actions.get_warmable_caches(name):
+        warmed = actions.warm_cache(descriptor)
+        logger.info(f'{type(descriptor).__name__}: {warmed} urls warmed')
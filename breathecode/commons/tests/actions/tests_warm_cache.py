@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock, call, patch
+from django.core.cache import cache
+from breathecode.commons import actions, tasks
+from breathecode.registry.caches import AssetCache
+from breathecode.registry.models import Asset
+from ..mixins import CommonsTestCase
+
+asset_cache = AssetCache()
+
+
+class WarmCacheTestSuite(CommonsTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.bc.cache.clear()
+
+    """
+    🔽🔽🔽 Record the requests
+    """
+
+    def test_record_request(self):
+        self.bc.database.create(asset=1)
+
+        self.client.get('/v1/registry/asset?limit=5')
+        self.client.get('/v1/registry/asset')
+        self.client.get('/v1/registry/asset?limit=5')
+
+        self.assertEqual(asset_cache.get_hot_requests(), [
+            'http://testserver/v1/registry/asset?limit=5',
+            'http://testserver/v1/registry/asset',
+        ])
+
+    def test_record_request__warming_is_not_counted(self):
+        self.bc.database.create(asset=1)
+
+        self.client.get('/v1/registry/asset', HTTP_X_CACHE_WARMING='1')
+
+        self.assertEqual(asset_cache.get_hot_requests(), [])
+
+    @patch.object(AssetCache, 'warm_entries', 1)
+    def test_record_request__redis(self):
+        redis = MagicMock()
+        redis.pipeline.return_value.execute.return_value = [3.0, 3]
+        redis.zrevrange.return_value = [b'http://testserver/v1/registry/asset']
+
+        with patch('breathecode.utils.cache._get_redis', MagicMock(return_value=redis)):
+            asset_cache.record_request('http://testserver/v1/registry/asset')
+            hot_requests = asset_cache.get_hot_requests()
+
+        key = cache.make_key('Asset__hot')
+        pipeline = redis.pipeline.return_value
+
+        self.assertEqual(hot_requests, ['http://testserver/v1/registry/asset'])
+        self.assertEqual(pipeline.zincrby.call_args_list,
+                         [call(key, 1, 'http://testserver/v1/registry/asset')])
+        self.assertEqual(redis.zremrangebyrank.call_args_list, [call(key, 0, -2)])
+        self.assertEqual(redis.zrevrange.call_args_list, [call(key, 0, 0)])
+
+    """
+    🔽🔽🔽 Warm
+    """
+
+    def test_warm_cache(self):
+        self.bc.database.create(asset=1)
+
+        self.client.get('/v1/registry/asset?limit=5')
+        asset_cache.clear()
+
+        self.assertEqual(asset_cache.get_response(limit='5'), None)
+        self.assertEqual(actions.warm_cache(asset_cache), 1)
+        self.assertNotEqual(asset_cache.get_response(limit='5'), None)
+        self.assertEqual(asset_cache.get_hot_requests(), ['http://testserver/v1/registry/asset?limit=5'])
+
+    def test_warm_cache__forget_the_unavailable_urls(self):
+        asset_cache.record_request('http://testserver/v1/registry/academy/asset')
+        asset_cache.record_request('http://testserver/v1/the-beans-should-not-have-sugar')
+
+        self.assertEqual(actions.warm_cache(asset_cache), 0)
+        self.assertEqual(asset_cache.get_hot_requests(), [])
+
+    """
+    🔽🔽🔽 Schedule
+    """
+
+    @patch('breathecode.commons.tasks.async_warm_cache.apply_async', MagicMock())
+    def test_clean_cache__schedule_the_warming_once(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            actions.clean_cache(Asset)
+            actions.clean_cache(Asset)
+
+        self.assertEqual(tasks.async_warm_cache.apply_async.call_args_list, [
+            call(args=('Asset', ), countdown=actions.WARMING_DELAY),
+        ])
+
+    @patch('breathecode.commons.tasks.async_warm_cache.apply_async', MagicMock())
+    def test_clean_cache__without_warmable_caches(self):
+        from breathecode.registry.models import AssetComment
+
+        with self.captureOnCommitCallbacks(execute=True):
+            actions.clean_cache(AssetComment)
+
+        self.assertEqual(tasks.async_warm_cache.apply_async.call_args_list, [])
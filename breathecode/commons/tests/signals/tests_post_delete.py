@@ -1,5 +1,4 @@
 import re
-import json
 from django.core.cache import cache
 from breathecode.admissions.caches import CohortCache
 from breathecode.events.caches import EventCache
@@ -29,24 +28,21 @@ class LeadTestSuite(CommonsTestCase):
 
             for expected in cases:
 
-                json_data = json.dumps(expected)
-
                 x = self.bc.database.create(**lookups)
 
-                cache.set(
-                    f'{model}__keys', f'["{model}__", "{model}__sort=slug&slug=100%2C101%2C110%2C111", '
-                    f'"{model}__id=1", "{model}__id=2"]')
+                descriptor = CACHE[model]
+                descriptor.set(expected)
+                descriptor.set(expected, sort='slug', slug='100,101,110,111')
+                descriptor.set(expected, id=1)
+                descriptor.set(expected, id=2)
 
-                cache.set(f'{model}__', json_data)
-                cache.set(f'{model}__sort=slug&slug=100%2C101%2C110%2C111', json_data)
-                cache.set(f'{model}__id=1', json_data)
-                cache.set(f'{model}__id=2', json_data)
+                generation = descriptor.generation()
 
                 getattr(x, attr).delete()
 
-                self.assertEqual(CACHE[model].keys(), [])
+                self.assertGreater(descriptor.generation(), generation)
 
-                self.assertEqual(cache.get(f'{model}__'), None)
-                self.assertEqual(cache.get(f'{model}__sort=slug&slug=100%2C101%2C110%2C111'), None)
-                self.assertEqual(cache.get(f'{model}__id=1'), None)
-                self.assertEqual(cache.get(f'{model}__id=2'), None)
+                self.assertEqual(descriptor.get(), None)
+                self.assertEqual(descriptor.get(sort='slug', slug='100,101,110,111'), None)
+                self.assertEqual(descriptor.get(id=1), None)
+                self.assertEqual(descriptor.get(id=2), None)
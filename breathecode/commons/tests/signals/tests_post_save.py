@@ -1,12 +1,14 @@
 import re
-import json
 from django.core.cache import cache
+from django.utils import timezone
 from breathecode.admissions.caches import CohortCache
 from breathecode.events.caches import EventCache
+from breathecode.registry.caches import AssetCommentCache
 from ..mixins import CommonsTestCase
 
 cohort_cache = CohortCache()
 event_cache = EventCache()
+asset_comment_cache = AssetCommentCache()
 
 CACHE = {'Cohort': CohortCache(), 'Event': EventCache()}
 
@@ -29,21 +31,122 @@ class LeadTestSuite(CommonsTestCase):
 
             for expected in cases:
 
-                json_data = json.dumps(expected)
-                cache.set(
-                    f'{model}__keys', f'["{model}__", "{model}__sort=slug&slug=100%2C101%2C110%2C111", '
-                    f'"{model}__id=1", "{model}__id=2"]')
+                descriptor = CACHE[model]
+                descriptor.set(expected)
+                descriptor.set(expected, sort='slug', slug='100,101,110,111')
+                descriptor.set(expected, id=1)
+                descriptor.set(expected, id=2)
 
-                cache.set(f'{model}__', json_data)
-                cache.set(f'{model}__sort=slug&slug=100%2C101%2C110%2C111', json_data)
-                cache.set(f'{model}__id=1', json_data)
-                cache.set(f'{model}__id=2', json_data)
+                generation = descriptor.generation()
 
                 self.bc.database.create(**lookups)
 
-                self.assertEqual(CACHE[model].keys(), [])
+                self.assertGreater(descriptor.generation(), generation)
 
-                self.assertEqual(cache.get(f'{model}__'), None)
-                self.assertEqual(cache.get(f'{model}__sort=slug&slug=100%2C101%2C110%2C111'), None)
-                self.assertEqual(cache.get(f'{model}__id=1'), None)
-                self.assertEqual(cache.get(f'{model}__id=2'), None)
+                self.assertEqual(descriptor.get(), None)
+                self.assertEqual(descriptor.get(sort='slug', slug='100,101,110,111'), None)
+                self.assertEqual(descriptor.get(id=1), None)
+                self.assertEqual(descriptor.get(id=2), None)
+
+    def test_post_save__dependency(self):
+        cache.clear()
+
+        cases = [[], [{'x': 1}], [{'x': 1}, {'x': 2}]]
+
+        for expected in cases:
+            cohort_cache.set(expected)
+            cohort_cache.set(expected, id=1)
+
+            generation = cohort_cache.generation()
+
+            self.bc.database.create(academy=1)
+
+            self.assertGreater(cohort_cache.generation(), generation)
+
+            self.assertEqual(cohort_cache.get(), None)
+            self.assertEqual(cohort_cache.get(id=1), None)
+
+    def test_post_save__transitive_dependency(self):
+        cache.clear()
+
+        cases = [[], [{'x': 1}], [{'x': 1}, {'x': 2}]]
+
+        for expected in cases:
+            asset_comment_cache.set(expected)
+            event_cache.set(expected)
+
+            asset_comment_generation = asset_comment_cache.generation()
+            event_generation = event_cache.generation()
+
+            self.bc.database.create(asset_technology=1)
+
+            self.assertGreater(asset_comment_cache.generation(), asset_comment_generation)
+            self.assertEqual(event_cache.generation(), event_generation)
+
+            self.assertEqual(asset_comment_cache.get(), None)
+            self.assertEqual(event_cache.get(), expected)
+
+    def test_post_save__user__last_login(self):
+        cache.clear()
+
+        model = self.bc.database.create(user=1)
+        event_cache.set([{'x': 1}])
+
+        generation = event_cache.generation()
+
+        # the last_login of each login is not included in the payloads
+        model.user.last_login = timezone.now()
+        model.user.save(update_fields=['last_login'])
+
+        self.assertEqual(event_cache.generation(), generation)
+        self.assertEqual(event_cache.get(), [{'x': 1}])
+
+        model.user.first_name = 'Konan'
+        model.user.save(update_fields=['first_name'])
+
+        self.assertGreater(event_cache.generation(), generation)
+        self.assertEqual(event_cache.get(), None)
+
+    def test_post_save__user__without_update_fields(self):
+        cache.clear()
+
+        model = self.bc.database.create(user=1)
+        event_cache.set([{'x': 1}])
+
+        generation = event_cache.generation()
+
+        # the fields that the payloads include did not change
+        model.user.last_login = timezone.now()
+        model.user.save()
+
+        self.assertEqual(event_cache.generation(), generation)
+        self.assertEqual(event_cache.get(), [{'x': 1}])
+
+        model.user.first_name = 'Konan'
+        model.user.save()
+
+        self.assertGreater(event_cache.generation(), generation)
+        self.assertEqual(event_cache.get(), None)
+
+    def test_post_save__user__loaded_from_the_database(self):
+        from django.contrib.auth.models import User
+
+        cache.clear()
+
+        self.bc.database.create(user=1)
+        event_cache.set([{'x': 1}])
+
+        generation = event_cache.generation()
+
+        user = User.objects.get(id=1)
+        user.is_staff = True
+        user.save()
+
+        self.assertEqual(event_cache.generation(), generation)
+
+        user = User.objects.get(id=1)
+        user.email = 'konan@naruto.io'
+        user.save()
+
+        self.assertGreater(event_cache.generation(), generation)
+        self.assertEqual(event_cache.get(), None)
@@ -2,6 +2,7 @@ from breathecode.events.actions import fix_datetime_weekday, update_timeslots_ou
 import os
 
 from django.contrib.auth.models import User
+from django.db.models import Prefetch
 from django.db.models.query_utils import Q
 from breathecode.authenticate.actions import server_id
 from breathecode.events.caches import EventCache
@@ -147,7 +148,7 @@ class AcademyEventView(APIView, GenerateLookupsMixin):
 
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         if event_id is not None:
             single_event = Event.objects.filter(id=event_id, academy__id=academy_id).first()
@@ -687,6 +688,11 @@ class ICalCohortsView(APIView):
             now = timezone.now()
             items = items.filter(kickoff_date__gte=now)
 
+        # the timeslots and the teacher of each cohort are loaded in one query for all of them
+        teachers = CohortUser.objects.filter(role='TEACHER').select_related('user').order_by('id')
+        items = items.select_related('academy').prefetch_related(
+            'cohorttimeslot_set', Prefetch('cohortuser_set', queryset=teachers, to_attr='teachers'))
+
         academies_repr = ical_academies_repr(ids=ids, slugs=slugs)
         key = server_id()
 
@@ -727,7 +733,7 @@ class ICalCohortsView(APIView):
             event.add('dtstart', item.kickoff_date)
 
             timeslots = update_timeslots_out_of_range(item.kickoff_date, item.ending_date,
-                                                      CohortTimeSlot.objects.filter(cohort__id=item.id))
+                                                      item.cohorttimeslot_set.all())
 
             first_timeslot = timeslots[0] if timeslots else None
             if first_timeslot:
@@ -775,7 +781,7 @@ class ICalCohortsView(APIView):
 
             event.add('dtstamp', item.created_at)
 
-            teacher = CohortUser.objects.filter(role='TEACHER', cohort__id=item.id).first()
+            teacher = item.teachers[0] if item.teachers else None
 
             if teacher:
                 organizer = vCalAddress(f'MAILTO:{teacher.user.email}')
@@ -1048,5 +1048,5 @@ class AnswerTestSuite(FeedbackTestCase):
         self.client.get(url)
 
         self.assertEqual(APIViewExtensionHandlers._spy_extension_arguments.call_args_list, [
-            call(sort='-created_at', paginate=True),
+            call(sort='-created_at', paginate='cursor'),
         ])
@@ -70,7 +70,7 @@ class GetAnswerView(APIView):
     List all snippets, or create a new snippet.
     """
 
-    extensions = APIViewExtensions(sort='-created_at', paginate=True)
+    extensions = APIViewExtensions(sort='-created_at', paginate='cursor')
 
     @capable_of('read_nps_answers')
     def get(self, request, format=None, academy_id=None):
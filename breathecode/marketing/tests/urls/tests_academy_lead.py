@@ -817,5 +817,5 @@ class CohortUserTestSuite(MarketingTestCase):
         self.client.get(url)
 
         self.assertEqual(APIViewExtensionHandlers._spy_extension_arguments.call_args_list, [
-            call(sort='-created_at', paginate=True),
+            call(sort='-created_at', paginate='cursor'),
         ])
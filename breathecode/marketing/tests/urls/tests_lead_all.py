@@ -75,7 +75,7 @@ class CohortUserTestSuite(MarketingTestCase):
         """Test /cohort/:id/user without auth"""
         url = reverse_lazy('marketing:lead_all')
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
         expected = {'detail': 'Authentication credentials were not provided.', 'status_code': 401}
 
         self.assertEqual(json, expected)
@@ -92,7 +92,7 @@ class CohortUserTestSuite(MarketingTestCase):
         model = self.generate_models(authenticate=True, form_entry=True)
 
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
 
         expected = []
 
@@ -117,7 +117,7 @@ class CohortUserTestSuite(MarketingTestCase):
                                      role='potato')
 
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
         expected = []
 
         self.assertEqual(json, expected)
@@ -143,7 +143,7 @@ class CohortUserTestSuite(MarketingTestCase):
                                      form_entry_kwargs=generate_form_entry_kwargs())
 
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
 
         self.assertDatetime(json[0]['created_at'])
         del json[0]['created_at']
@@ -195,7 +195,7 @@ class CohortUserTestSuite(MarketingTestCase):
                                      form_entry=True)
 
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
         expected = []
 
         self.assertEqual(json, expected)
@@ -218,7 +218,7 @@ class CohortUserTestSuite(MarketingTestCase):
 
         url = reverse_lazy('marketing:lead_all') + '?academy=freyja'
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
 
         self.assertDatetime(json[0]['created_at'])
         del json[0]['created_at']
@@ -274,7 +274,7 @@ class CohortUserTestSuite(MarketingTestCase):
         models.sort(key=lambda x: x.form_entry.created_at)
         url = reverse_lazy('marketing:lead_all') + '?academy=' + ','.join([x.academy.slug for x in models])
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
 
         self.assertDatetime(json[0]['created_at'])
         del json[0]['created_at']
@@ -331,7 +331,7 @@ class CohortUserTestSuite(MarketingTestCase):
                                      form_entry=True)
 
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
         expected = []
 
         self.assertEqual(json, expected)
@@ -353,7 +353,7 @@ class CohortUserTestSuite(MarketingTestCase):
 
         url = reverse_lazy('marketing:lead_all') + f'?start={query_date}'
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
 
         self.assertDatetime(json[0]['created_at'])
         del json[0]['created_at']
@@ -405,7 +405,7 @@ class CohortUserTestSuite(MarketingTestCase):
                                      form_entry=True)
 
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
         expected = []
 
         self.assertEqual(json, expected)
@@ -427,7 +427,7 @@ class CohortUserTestSuite(MarketingTestCase):
 
         url = reverse_lazy('marketing:lead_all') + f'?end={query_date}'
         response = self.client.get(url)
-        json = response.json()
+        json = self.bc.format.from_response(response)
 
         self.assertDatetime(json[0]['created_at'])
         del json[0]['created_at']
@@ -460,3 +460,31 @@ class CohortUserTestSuite(MarketingTestCase):
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(self.all_form_entry_dict(), [{**self.model_to_dict(model, 'form_entry')}])
+
+    """
+    🔽🔽🔽 CSV
+    """
+
+    @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
+    @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
+    @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
+    def test_lead_all__csv(self):
+        """Test /lead/all in csv"""
+        self.headers(academy=1)
+        model = self.generate_models(authenticate=True,
+                                     profile_academy=True,
+                                     capability='read_lead',
+                                     role='potato',
+                                     form_entry=2)
+
+        url = reverse_lazy('marketing:lead_all')
+        response = self.client.get(url, HTTP_ACCEPT='text/csv')
+        content = self.bc.format.from_response(response)
+        lines = content.split('\r\n')
+
+        self.assertEqual(lines[0].split(',')[0:4],
+                         ['academy.id', 'academy.name', 'academy.slug', 'client_comments'])
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.all_form_entry_dict(), self.bc.format.to_dict(model.form_entry))
@@ -14,7 +14,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.decorators import api_view, permission_classes
 from django.db.models import Count, F, Func, Value, CharField
 from breathecode.utils import (APIException, localize_query, capable_of, ValidationException,
-                               GenerateLookupsMixin, HeaderLimitOffsetPagination)
+                               GenerateLookupsMixin, HeaderLimitOffsetPagination, streaming_response)
 from breathecode.utils.api_view_extensions.api_view_extensions import APIViewExtensions
 from .serializers import (
     PostFormEntrySerializer,
@@ -320,8 +320,7 @@ def get_leads(request, id=None):
         items = items.filter(created_at__lte=end_date)
 
     items = items.order_by('created_at')
-    serializer = FormEntrySerializer(items, many=True)
-    return Response(serializer.data)
+    return streaming_response(request, items, FormEntrySerializer)
 
 
 @api_view(['GET'])
@@ -513,7 +512,7 @@ class AcademyLeadView(APIView, GenerateLookupsMixin):
     List all snippets, or create a new snippet.
     """
 
-    extensions = APIViewExtensions(sort='-created_at', paginate=True)
+    extensions = APIViewExtensions(sort='-created_at', paginate='cursor')
 
     @capable_of('read_lead')
     def get(self, request, academy_id=None):
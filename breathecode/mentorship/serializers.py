@@ -1,5 +1,5 @@
 import serpy
-from breathecode.utils import ValidationException
+from breathecode.utils import ValidationException, SerpyExtensions
 from .models import MentorshipSession, MentorshipService, MentorProfile, MentorshipBill
 import breathecode.mentorship.actions as actions
 from .actions import generate_mentor_bill
@@ -89,7 +89,7 @@ class GETMentorTinySerializer(serpy.Serializer):
     id = serpy.Field()
     slug = serpy.Field()
     user = GetUserSmallSerializer()
-    services = serpy.MethodField()
+    services = SerpyExtensions.MethodField(prefetch_related=['services'])
     status = serpy.Field()
     booking_url = serpy.Field()
 
@@ -6,6 +6,7 @@ import random
 from unittest.mock import MagicMock, call, patch
 from django.urls.base import reverse_lazy
 from rest_framework import status
+from breathecode.mentorship.serializers import GETSessionSmallSerializer
 
 from breathecode.utils.api_view_extensions.api_view_extension_handlers import APIViewExtensionHandlers
 from ..mixins import MentorshipTestCase
@@ -854,11 +855,11 @@ class AcademyServiceTestSuite(MentorshipTestCase):
         self.client.get(url)
 
         self.assertEqual(APIViewExtensionHandlers._spy_extensions.call_args_list, [
-            call(['PaginationExtension', 'SortExtension']),
+            call(['FieldsExtension', 'PaginationExtension', 'SortExtension']),
         ])
 
         self.assertEqual(APIViewExtensionHandlers._spy_extension_arguments.call_args_list, [
-            call(sort='-created_at', paginate=True),
+            call(sort='-created_at', paginate='cursor', serializer=GETSessionSmallSerializer),
         ])
 
     """
@@ -643,7 +643,9 @@ class MentorView(APIView, HeaderLimitOffsetPagination):
 
 
 class SessionView(APIView, HeaderLimitOffsetPagination):
-    extensions = APIViewExtensions(sort='-created_at', paginate=True)
+    extensions = APIViewExtensions(sort='-created_at',
+                                   paginate='cursor',
+                                   serializer=GETSessionSmallSerializer)
 
     @capable_of('read_mentorship_session')
     def get(self, request, session_id=None, academy_id=None):
@@ -689,7 +691,7 @@ class SessionView(APIView, HeaderLimitOffsetPagination):
 
         items = items.filter(**lookup)
         items = handler.queryset(items)
-        serializer = GETSessionSmallSerializer(items, many=True)
+        serializer = handler.fields.serializer(items, many=True)
 
         return handler.response(serializer.data)
 
@@ -2,7 +2,7 @@ import os, ast
 from django.contrib import admin
 from django import forms
 from django.utils import timezone
-from .models import Endpoint, Application, MonitorScript, CSVDownload
+from .models import Endpoint, Application, MonitorScript, CSVDownload, EndpointBudget
 from breathecode.notify.models import SlackChannel
 from django.utils.html import format_html
 
@@ -97,6 +97,14 @@ class EndpointAdmin(admin.ModelAdmin):
         return format_html(f"<span class='badge {colors[obj.status]}'>{obj.status}</span>")
 
 
+@admin.register(EndpointBudget)
+class EndpointBudgetAdmin(admin.ModelAdmin):
+    list_display = ('view', 'application', 'max_queries', 'max_duration', 'paused_until')
+    actions = [pause_for_one_day]
+    list_filter = ['application__title']
+    search_fields = ['view']
+
+
 def run_single_script(modeladmin, request, queryset):
     # stay this here for use the poor mocking system
     from .tasks import execute_scripts
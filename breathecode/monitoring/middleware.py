@@ -0,0 +1,103 @@
+"""
+Profiling of the requests, the samples and the budgets are managed by `breathecode.monitoring.profiling`.
+"""
+
+import random, time
+from contextlib import ExitStack
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from breathecode.utils.request_profile import (RequestProfile, get_request_profile, start_request_profile,
+                                               stop_request_profile, track_query)
+from .profiling import check_budget, get_budget, record_sample, should_alert
+from .tasks import notify_budget_exceeded
+
+__all__ = ['ProfilingMiddleware']
+
+
+def _track_query(execute, sql, params, many, context):
+    started = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+
+    finally:
+        track_query(time.perf_counter() - started)
+
+
+def _to_ms(seconds: float) -> int:
+    return round(seconds * 1000)
+
+
+class ProfilingMiddleware:
+    """
+    Record the queries, the database time, the cache hits and misses and the serialization time of each view.
+
+    `PROFILING_SAMPLE_RATE` is the fraction of the requests recorded, the middleware is disabled if it's 0.
+    Every request is checked against the budget of its view, the alerts are sent to the notification
+    channels of the application of the budget.
+    """
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_SAMPLE_RATE:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        token = start_request_profile(profile)
+        started = time.perf_counter()
+
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_track_query))
+
+                response = self.get_response(request)
+
+        finally:
+            stop_request_profile(token)
+
+        self._record(request, profile, time.perf_counter() - started)
+        return response
+
+    def process_template_response(self, request, response):
+        profile = get_request_profile()
+        if profile is None:
+            return response
+
+        # the response is rendered after this hook
+        started = time.perf_counter()
+
+        def measure(response):
+            profile.serialization_time += time.perf_counter() - started
+
+        response.add_post_render_callback(measure)
+        return response
+
+    def _record(self, request, profile: RequestProfile, duration: float) -> None:
+        # it was not resolved, like a 404
+        if request.resolver_match is None:
+            return
+
+        view = request.resolver_match.view_name
+        sample = {
+            'queries': profile.queries,
+            'db_time': _to_ms(profile.db_time),
+            'cache_hits': profile.cache_hits,
+            'cache_misses': profile.cache_misses,
+            'serialization_time': _to_ms(profile.serialization_time),
+            'duration': _to_ms(duration),
+        }
+
+        reasons = []
+        if budget := get_budget(view):
+            reasons = check_budget(budget, sample)
+
+        if reasons and should_alert(budget):
+            notify_budget_exceeded.delay(budget.id, view, reasons)
+
+        if random.random() < self.sample_rate:
+            record_sample(view, sample, over_budget=bool(reasons))
@@ -0,0 +1,46 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0015_alter_csvdownload_academy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EndpointBudget',
+            fields=[
+                ('id',
+                 models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('view',
+                 models.CharField(help_text='Name of the resolved view, like admissions:academy_cohort',
+                                  max_length=255,
+                                  unique=True)),
+                ('max_queries',
+                 models.IntegerField(blank=True,
+                                     default=None,
+                                     help_text='Leave blank to not check the queries',
+                                     null=True)),
+                ('max_duration',
+                 models.IntegerField(blank=True,
+                                     default=None,
+                                     help_text='In milliseconds, leave blank to not check the duration',
+                                     null=True)),
+                ('paused_until',
+                 models.DateTimeField(blank=True,
+                                      default=None,
+                                      help_text='if you want to stop the alerts for a period of time',
+                                      null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('application',
+                 models.ForeignKey(help_text='The alerts are sent to the channels of this application',
+                                   on_delete=django.db.models.deletion.CASCADE,
+                                   to='monitoring.application')),
+            ],
+        ),
+    ]
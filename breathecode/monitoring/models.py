@@ -3,7 +3,7 @@ from breathecode.admissions.models import Academy
 from breathecode.notify.models import SlackChannel
 from datetime import timedelta
 
-__all__ = ['Application', 'Endpoint', 'MonitorScript']
+__all__ = ['Application', 'Endpoint', 'MonitorScript', 'EndpointBudget']
 
 LOADING = 'LOADING'
 OPERATIONAL = 'OPERATIONAL'
@@ -128,6 +128,36 @@ class MonitorScript(models.Model):
         return f'{slug}({self.id})'
 
 
+class EndpointBudget(models.Model):
+
+    view = models.CharField(max_length=255,
+                            unique=True,
+                            help_text='Name of the resolved view, like admissions:academy_cohort')
+    max_queries = models.IntegerField(default=None,
+                                      null=True,
+                                      blank=True,
+                                      help_text='Leave blank to not check the queries')
+    max_duration = models.IntegerField(default=None,
+                                       null=True,
+                                       blank=True,
+                                       help_text='In milliseconds, leave blank to not check the duration')
+
+    application = models.ForeignKey(Application,
+                                    on_delete=models.CASCADE,
+                                    help_text='The alerts are sent to the channels of this application')
+
+    paused_until = models.DateTimeField(null=True,
+                                        blank=True,
+                                        default=None,
+                                        help_text='if you want to stop the alerts for a period of time')
+
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, editable=False)
+
+    def __str__(self):
+        return self.view
+
+
 LOADING = 'LOADING'
 ERROR = 'ERROR'
 DONE = 'DONE'
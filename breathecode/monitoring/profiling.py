@@ -0,0 +1,113 @@
+"""
+Samples of the queries, the cache usage and the times of each view, they are collected by
+`breathecode.monitoring.middleware.ProfilingMiddleware`.
+"""
+
+import time
+from typing import Optional
+from django.core.cache import cache
+from django.utils import timezone
+from breathecode.utils.cache import _incr, _sadd, _smembers
+from .models import EndpointBudget
+
+__all__ = [
+    'PROFILE_COUNTERS', 'record_sample', 'get_profile_stats', 'reset_profile_stats', 'get_budget',
+    'clear_budgets', 'check_budget', 'should_alert'
+]
+
+# the times are stored in milliseconds
+PROFILE_COUNTERS = [
+    'requests', 'queries', 'db_time', 'cache_hits', 'cache_misses', 'serialization_time', 'duration',
+    'over_budget'
+]
+
+VIEWS_KEY = 'profile__views'
+
+# seconds that the budgets are reused by each process
+BUDGETS_TIMEOUT = 60
+
+# seconds between two alerts of the same view
+ALERT_INTERVAL = 60 * 60
+
+# loaded at, view -> budget
+_budgets: tuple[Optional[float], dict[str, EndpointBudget]] = (None, {})
+
+
+def _profile_key(view: str, counter: str) -> str:
+    return f'profile__{view}__{counter}'
+
+
+def record_sample(view: str, sample: dict[str, int], over_budget: bool = False) -> None:
+    """Add a sample of a view to its counters, they are shared between processes."""
+
+    _sadd(VIEWS_KEY, view)
+
+    values = {**sample, 'requests': 1, 'over_budget': int(over_budget)}
+    for counter in PROFILE_COUNTERS:
+        if values.get(counter):
+            _incr(_profile_key(view, counter), values[counter])
+
+
+def get_profile_stats() -> list[dict]:
+    """Get the counters of every view sampled, sorted by the number of queries per request."""
+
+    views = _smembers(VIEWS_KEY)
+    keys = {_profile_key(view, counter): (view, counter) for view in views for counter in PROFILE_COUNTERS}
+    values = cache.get_many(list(keys))
+
+    stats = {view: {'view': view, **{counter: 0 for counter in PROFILE_COUNTERS}} for view in views}
+    for key, (view, counter) in keys.items():
+        stats[view][counter] = values.get(key, 0)
+
+    return sorted(stats.values(), key=lambda x: x['queries'] / (x['requests'] or 1), reverse=True)
+
+
+def reset_profile_stats() -> None:
+    views = _smembers(VIEWS_KEY)
+    cache.delete_many([_profile_key(view, counter) for view in views for counter in PROFILE_COUNTERS])
+    cache.delete(VIEWS_KEY)
+
+
+def get_budget(view: str) -> Optional[EndpointBudget]:
+    """Get the budget of a view, the budgets are loaded once every `BUDGETS_TIMEOUT` seconds."""
+
+    global _budgets
+
+    loaded_at, budgets = _budgets
+    now = time.monotonic()
+
+    if loaded_at is None or now - loaded_at >= BUDGETS_TIMEOUT:
+        budgets = {x.view: x for x in EndpointBudget.objects.all()}
+        _budgets = (now, budgets)
+
+    return budgets.get(view)
+
+
+def clear_budgets() -> None:
+    """Load the budgets again in the next request."""
+
+    global _budgets
+    _budgets = (None, {})
+
+
+def check_budget(budget: EndpointBudget, sample: dict[str, int]) -> list[str]:
+    """Get the reasons why a sample exceeded a budget, it's empty if it did not."""
+
+    reasons = []
+
+    if budget.max_queries is not None and sample['queries'] > budget.max_queries:
+        reasons.append(f'{sample["queries"]} queries, the budget is {budget.max_queries}')
+
+    if budget.max_duration is not None and sample['duration'] > budget.max_duration:
+        reasons.append(f'{sample["duration"]}ms, the budget is {budget.max_duration}ms')
+
+    return reasons
+
+
+def should_alert(budget: EndpointBudget) -> bool:
+    """Tell if the alert of a budget must be sent, just one is sent per view each `ALERT_INTERVAL` seconds."""
+
+    if budget.paused_until is not None and budget.paused_until > timezone.now():
+        return False
+
+    return cache.add(f'profile__{budget.view}__alert', 1, timeout=ALERT_INTERVAL)
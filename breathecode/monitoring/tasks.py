@@ -1,8 +1,9 @@
 from django.utils import timezone
 from celery import shared_task, Task
 from .actions import run_app_diagnostic, run_script, run_endpoint_diagnostic, download_csv
-from .models import Application, MonitorScript, Endpoint, CSVDownload
+from .models import Application, MonitorScript, Endpoint, CSVDownload, EndpointBudget
 from breathecode.notify.actions import send_email_message, send_slack_raw
+from breathecode.services.slack.actions.monitoring import render_budget_exceeded
 import logging
 
 # Get an instance of a logger
@@ -114,3 +115,31 @@ def execute_scripts(self, script_id):
 def async_download_csv(self, module, model_name, ids_to_download):
     logger.debug('Starting to download csv for ')
     return download_csv(module, model_name, ids_to_download)
+
+
+@shared_task(bind=True, base=BaseTaskWithRetry)
+def notify_budget_exceeded(self, budget_id, view, reasons):
+    logger.debug(f'Starting notify_budget_exceeded for {view}')
+    budget = EndpointBudget.objects.filter(id=budget_id).select_related('application').first()
+
+    if budget is None:
+        logger.error(f'EndpointBudget {budget_id} not found')
+        return False
+
+    app = budget.application
+    subject = f'The view {view} of the app {app.title} exceeded its budget'
+    details = '\n'.join(reasons)
+
+    if app.notify_email:
+        send_email_message('diagnostic', app.notify_email, {'subject': subject, 'details': details})
+
+    if (app.notify_slack_channel and app.academy and hasattr(app.academy, 'slackteam')
+            and hasattr(app.academy.slackteam.owner, 'credentialsslack')):
+        send_slack_raw('diagnostic', app.academy.slackteam.owner.credentialsslack.token,
+                       app.notify_slack_channel.slack_id, {
+                           'subject': subject,
+                           'details': details,
+                           'slack_payload': render_budget_exceeded(budget, reasons),
+                       })
+
+    return True
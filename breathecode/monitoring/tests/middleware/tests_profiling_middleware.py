@@ -0,0 +1,157 @@
+from unittest.mock import MagicMock, call, patch
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls.base import reverse_lazy
+from django.utils import timezone
+from breathecode.admissions.caches import CohortCache
+from breathecode.admissions.models import Cohort
+from breathecode.monitoring.middleware import ProfilingMiddleware
+from breathecode.monitoring.profiling import clear_budgets, get_profile_stats
+from ..mixins import MonitoringTestCase
+
+VIEW = 'admissions:academy_cohort'
+
+
+def get_response(request):
+    request.resolver_match = MagicMock(view_name=VIEW)
+
+    CohortCache().get(x=1)
+    list(Cohort.objects.all())
+
+    return HttpResponse('ok')
+
+
+def stats_of(view):
+    stats = [x for x in get_profile_stats() if x['view'] == view]
+    return stats[0] if stats else None
+
+
+class ProfilingMiddlewareTestSuite(MonitoringTestCase):
+
+    def setUp(self):
+        super().setUp()
+        clear_budgets()
+
+    """
+    🔽🔽🔽 Disabled
+    """
+
+    @override_settings(PROFILING_SAMPLE_RATE=0)
+    def test_profiling_middleware__disabled(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            ProfilingMiddleware(get_response)
+
+    """
+    🔽🔽🔽 Samples
+    """
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_profiling_middleware__records_the_sample(self):
+        middleware = ProfilingMiddleware(get_response)
+        request = RequestFactory().get('/v1/admissions/academy/cohort')
+
+        response = middleware(request)
+        stats = stats_of(VIEW)
+
+        self.assertEqual(response.content, b'ok')
+        self.assertEqual(stats['requests'], 1)
+        self.assertEqual(stats['queries'], 1)
+        self.assertEqual(stats['cache_hits'], 0)
+        self.assertEqual(stats['cache_misses'], 1)
+        self.assertEqual(stats['over_budget'], 0)
+        self.assertGreaterEqual(stats['duration'], stats['db_time'])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_profiling_middleware__without_view(self):
+        middleware = ProfilingMiddleware(lambda request: HttpResponse('not found', status=404))
+        request = RequestFactory().get('/they-killed-kenny')
+
+        middleware(request)
+
+        self.assertEqual(get_profile_stats(), [])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_profiling_middleware__through_the_client(self):
+        model = self.bc.database.create(user={'is_staff': True})
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('monitoring:profile')
+        self.client.get(url)
+        response = self.client.get(url)
+
+        json = response.json()
+        stats = [x for x in json if x['view'] == 'monitoring:profile'][0]
+
+        self.assertEqual(stats['requests'], 1)
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_profiling_middleware__redis__the_views_are_a_set(self):
+        redis = MagicMock()
+        redis.smembers.return_value = {VIEW.encode('utf-8')}
+
+        middleware = ProfilingMiddleware(get_response)
+        request = RequestFactory().get('/v1/admissions/academy/cohort')
+
+        with patch('breathecode.utils.cache._get_redis', MagicMock(return_value=redis)):
+            middleware(request)
+            stats = stats_of(VIEW)
+
+        key = cache.make_key('profile__views')
+
+        self.assertEqual(redis.sadd.call_args_list, [call(key, VIEW)])
+        self.assertEqual(redis.smembers.call_args_list, [call(key)])
+        self.assertEqual(stats['requests'], 1)
+
+    """
+    🔽🔽🔽 Budgets
+    """
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    @patch('breathecode.monitoring.tasks.notify_budget_exceeded.delay', MagicMock())
+    def test_profiling_middleware__within_the_budget(self):
+        from breathecode.monitoring.tasks import notify_budget_exceeded
+
+        self.bc.database.create(endpoint_budget={'view': VIEW, 'max_queries': 1})
+        middleware = ProfilingMiddleware(get_response)
+
+        middleware(RequestFactory().get('/v1/admissions/academy/cohort'))
+
+        self.assertEqual(stats_of(VIEW)['over_budget'], 0)
+        self.assertEqual(notify_budget_exceeded.delay.call_args_list, [])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    @patch('breathecode.monitoring.tasks.notify_budget_exceeded.delay', MagicMock())
+    def test_profiling_middleware__over_the_budget__one_alert_per_interval(self):
+        from breathecode.monitoring.tasks import notify_budget_exceeded
+
+        model = self.bc.database.create(endpoint_budget={'view': VIEW, 'max_queries': 0})
+        middleware = ProfilingMiddleware(get_response)
+
+        middleware(RequestFactory().get('/v1/admissions/academy/cohort'))
+        middleware(RequestFactory().get('/v1/admissions/academy/cohort'))
+
+        self.assertEqual(stats_of(VIEW)['over_budget'], 2)
+        self.assertEqual(notify_budget_exceeded.delay.call_args_list, [
+            call(model.endpoint_budget.id, VIEW, ['1 queries, the budget is 0']),
+        ])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    @patch('breathecode.monitoring.tasks.notify_budget_exceeded.delay', MagicMock())
+    def test_profiling_middleware__over_the_budget__paused(self):
+        from breathecode.monitoring.tasks import notify_budget_exceeded
+
+        endpoint_budget = {
+            'view': VIEW,
+            'max_queries': 0,
+            'paused_until': timezone.now() + timezone.timedelta(days=1),
+        }
+        self.bc.database.create(endpoint_budget=endpoint_budget)
+        middleware = ProfilingMiddleware(get_response)
+
+        middleware(RequestFactory().get('/v1/admissions/academy/cohort'))
+
+        self.assertEqual(stats_of(VIEW)['over_budget'], 1)
+        self.assertEqual(notify_budget_exceeded.delay.call_args_list, [])
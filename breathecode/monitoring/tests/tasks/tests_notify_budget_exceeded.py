@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock, call, patch
+from breathecode.monitoring.tasks import notify_budget_exceeded
+from ..mixins import MonitoringTestCase
+
+VIEW = 'admissions:academy_cohort'
+SUBJECT = f'The view {VIEW} of the app Kenny exceeded its budget'
+
+
+class NotifyBudgetExceededTestSuite(MonitoringTestCase):
+    """
+    🔽🔽🔽 Without EndpointBudget
+    """
+
+    @patch('logging.Logger.error', MagicMock())
+    @patch('breathecode.monitoring.tasks.send_email_message', MagicMock())
+    def test_notify_budget_exceeded__without_budget(self):
+        import logging
+        from breathecode.monitoring.tasks import send_email_message
+
+        notify_budget_exceeded.delay(1, VIEW, ['21 queries, the budget is 20'])
+
+        self.assertEqual(logging.Logger.error.call_args_list, [call('EndpointBudget 1 not found')])
+        self.assertEqual(send_email_message.call_args_list, [])
+
+    """
+    🔽🔽🔽 With EndpointBudget
+    """
+
+    @patch('breathecode.monitoring.tasks.send_email_message', MagicMock())
+    def test_notify_budget_exceeded__without_email(self):
+        from breathecode.monitoring.tasks import send_email_message
+
+        application = {'title': 'Kenny', 'notify_email': None}
+        model = self.bc.database.create(application=application, endpoint_budget={'view': VIEW})
+
+        notify_budget_exceeded.delay(model.endpoint_budget.id, VIEW, ['21 queries, the budget is 20'])
+
+        self.assertEqual(send_email_message.call_args_list, [])
+
+    @patch('breathecode.monitoring.tasks.send_email_message', MagicMock())
+    def test_notify_budget_exceeded__with_email(self):
+        from breathecode.monitoring.tasks import send_email_message
+
+        application = {'title': 'Kenny', 'notify_email': 'kenny@south.park'}
+        model = self.bc.database.create(application=application, endpoint_budget={'view': VIEW})
+
+        notify_budget_exceeded.delay(model.endpoint_budget.id, VIEW,
+                                     ['21 queries, the budget is 20', '501ms, the budget is 500ms'])
+
+        self.assertEqual(send_email_message.call_args_list, [
+            call('diagnostic', 'kenny@south.park', {
+                'subject': SUBJECT,
+                'details': '21 queries, the budget is 20\n501ms, the budget is 500ms',
+            }),
+        ])
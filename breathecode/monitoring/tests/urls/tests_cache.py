@@ -0,0 +1,61 @@
+from django.core.cache import cache
+from django.urls.base import reverse_lazy
+from breathecode.admissions.caches import CohortCache
+from breathecode.utils import get_cache_stats
+from ..mixins import MonitoringTestCase
+
+
+class CacheTestSuite(MonitoringTestCase):
+    """
+    🔽🔽🔽 Auth
+    """
+
+    def test_cache__without_auth(self):
+        url = reverse_lazy('monitoring:cache')
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {'detail': 'Authentication credentials were not provided.', 'status_code': 401}
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, 401)
+
+    def test_cache__without_staff(self):
+        model = self.bc.database.create(user=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('monitoring:cache')
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {'detail': 'You do not have permission to perform this action.', 'status_code': 403}
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, 403)
+
+    """
+    🔽🔽🔽 Get
+    """
+
+    def test_cache__with_staff(self):
+        cache.clear()
+
+        model = self.bc.database.create(user={'is_staff': True})
+        self.bc.request.authenticate(model.user)
+
+        CohortCache().get(x=1)
+        CohortCache().set([], x=1)
+        CohortCache().get(x=1)
+
+        url = reverse_lazy('monitoring:cache')
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = get_cache_stats()
+        stats = [x for x in json if x['name'] == 'CohortCache'][0]
+
+        self.assertEqual(json, expected)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['sets'], 1)
+        self.assertEqual(response.status_code, 200)
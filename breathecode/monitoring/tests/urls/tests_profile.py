@@ -0,0 +1,91 @@
+from django.urls.base import reverse_lazy
+from breathecode.monitoring.profiling import get_profile_stats, record_sample
+from ..mixins import MonitoringTestCase
+
+
+def sample(**kwargs):
+    return {
+        'queries': 0,
+        'db_time': 0,
+        'cache_hits': 0,
+        'cache_misses': 0,
+        'serialization_time': 0,
+        'duration': 0,
+        **kwargs,
+    }
+
+
+class ProfileTestSuite(MonitoringTestCase):
+    """
+    🔽🔽🔽 Auth
+    """
+
+    def test_profile__without_auth(self):
+        url = reverse_lazy('monitoring:profile')
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {'detail': 'Authentication credentials were not provided.', 'status_code': 401}
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, 401)
+
+    def test_profile__without_staff(self):
+        model = self.bc.database.create(user=1)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('monitoring:profile')
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {'detail': 'You do not have permission to perform this action.', 'status_code': 403}
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, 403)
+
+    """
+    🔽🔽🔽 Get
+    """
+
+    def test_profile__with_staff(self):
+        model = self.bc.database.create(user={'is_staff': True})
+        self.bc.request.authenticate(model.user)
+
+        record_sample('registry:asset', sample(queries=2, duration=10))
+        record_sample('admissions:academy_cohort',
+                      sample(queries=30, cache_misses=1, duration=90),
+                      over_budget=True)
+        record_sample('admissions:academy_cohort', sample(queries=10, cache_hits=1, duration=30))
+
+        url = reverse_lazy('monitoring:profile')
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = [
+            {
+                'view': 'admissions:academy_cohort',
+                'requests': 2,
+                'queries': 40,
+                'db_time': 0,
+                'cache_hits': 1,
+                'cache_misses': 1,
+                'serialization_time': 0,
+                'duration': 120,
+                'over_budget': 1,
+            },
+            {
+                'view': 'registry:asset',
+                'requests': 1,
+                'queries': 2,
+                'db_time': 0,
+                'cache_hits': 0,
+                'cache_misses': 0,
+                'serialization_time': 0,
+                'duration': 10,
+                'over_budget': 0,
+            },
+        ]
+
+        self.assertEqual(json, expected)
+        self.assertEqual(get_profile_stats(), expected)
+        self.assertEqual(response.status_code, 200)
@@ -1,11 +1,13 @@
 from django.contrib import admin
 from django.urls import path, include
-from .views import get_apps, get_endpoints, get_download
+from .views import get_apps, get_endpoints, get_download, get_caches, get_profiles
 
 app_name = 'monitoring'
 urlpatterns = [
     path('application', get_apps),
     path('endpoint', get_endpoints),
+    path('cache', get_caches, name='cache'),
+    path('profile', get_profiles, name='profile'),
     path('download', get_download),
     path('download/<int:download_id>', get_download),
 ]
@@ -3,13 +3,14 @@ from io import BytesIO, StringIO
 from django.shortcuts import render
 from django.utils import timezone
 from .models import Application, Endpoint, CSVDownload
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 from .serializers import CSVDownloadSmallSerializer
 from django.http import HttpResponseRedirect, HttpResponse
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.decorators import api_view, permission_classes
-from breathecode.utils import ValidationException
+from breathecode.utils import ValidationException, get_cache_stats
+from .profiling import get_profile_stats
 from rest_framework import status
 from django.http import StreamingHttpResponse
 
@@ -26,6 +27,18 @@ def get_apps(request):
     return Response([], status=status.HTTP_200_OK)
 
 
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def get_caches(request):
+    return Response(get_cache_stats(), status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def get_profiles(request):
+    return Response(get_profile_stats(), status=status.HTTP_200_OK)
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_download(request, download_id=None):
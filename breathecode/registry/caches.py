@@ -6,6 +6,7 @@ class AssetCache(Cache):
     model = Asset
     depends = ['User', 'AssetTechnology', 'AssetCategory', 'KeywordCluster', 'AssetKeyword', 'Assessment']
     parents = ['AssetAlias', 'AssetErrorLog']
+    warm_entries = 20
 
 
 class AssetCommentCache(Cache):
@@ -18,6 +19,7 @@ class TechnologyCache(Cache):
     model = AssetTechnology
     depends = []
     parents = []
+    local_max_entries = 100
 
 
 class KeywordCache(Cache):
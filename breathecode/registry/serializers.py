@@ -7,6 +7,7 @@ from rest_framework import status
 from rest_framework.exceptions import ValidationError
 import serpy
 from breathecode.utils.validation_exception import ValidationException
+from breathecode.utils.serpy_extensions import SerpyExtensions
 from django.utils import timezone
 
 
@@ -82,9 +83,9 @@ class AssetSerializer(serpy.Serializer):
     solution_video_url = serpy.Field()
     intro_video_url = serpy.Field()
 
-    translations = serpy.MethodField()
-    technologies = serpy.MethodField()
-    seo_keywords = serpy.MethodField()
+    translations = SerpyExtensions.MethodField(prefetch_related=['all_translations'])
+    technologies = SerpyExtensions.MethodField(prefetch_related=['technologies'])
+    seo_keywords = SerpyExtensions.MethodField(prefetch_related=['seo_keywords'])
 
     def get_translations(self, obj):
         result = {}
@@ -93,7 +94,8 @@ class AssetSerializer(serpy.Serializer):
         return result
 
     def get_technologies(self, obj):
-        _s = list(map(lambda t: t.slug, obj.technologies.filter(parent__isnull=True)))
+        # filtered in python to use the prefetched technologies
+        _s = [t.slug for t in obj.technologies.all() if t.parent_id is None]
         return _s
 
     def get_seo_keywords(self, obj):
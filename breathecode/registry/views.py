@@ -121,7 +121,7 @@ class AcademyTechnologyView(APIView, GenerateLookupsMixin):
         handler = self.extensions(request)
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         items = AssetTechnology.objects.all()
         lookup = {}
@@ -350,13 +350,17 @@ class AssetView(APIView, GenerateLookupsMixin):
     List all snippets, or create a new snippet.
     """
     permission_classes = [AllowAny]
-    extensions = APIViewExtensions(cache=AssetCache, sort='-created_at', paginate=True)
+    extensions = APIViewExtensions(cache=AssetCache,
+                                   cache_soft_ttl=60 * 5,
+                                   sort='-created_at',
+                                   paginate=True,
+                                   serializer=AssetSerializer)
 
     def get(self, request, asset_slug=None):
         handler = self.extensions(request)
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         if asset_slug is not None:
             asset = Asset.get_by_slug(asset_slug, request)
@@ -447,13 +451,12 @@ class AssetView(APIView, GenerateLookupsMixin):
         if need_translation == 'true':
             items = items.annotate(num_translations=Count('all_translations')).filter(num_translations__lte=1) \
 
+        if 'big' in self.request.GET:
+            handler.fields.use(AssetMidSerializer)
+
         items = items.filter(**lookup)
         items = handler.queryset(items)
-
-        if 'big' in self.request.GET:
-            serializer = AssetMidSerializer(items, many=True)
-        else:
-            serializer = AssetSerializer(items, many=True)
+        serializer = handler.fields.serializer(items, many=True)
 
         return handler.response(serializer.data)
 
@@ -491,7 +494,10 @@ class AcademyAssetView(APIView, GenerateLookupsMixin):
     """
     List all snippets, or create a new snippet.
     """
-    extensions = APIViewExtensions(cache=AssetCache, sort='-created_at', paginate=True)
+    extensions = APIViewExtensions(cache=AssetCache,
+                                   sort='-created_at',
+                                   paginate=True,
+                                   serializer=AcademyAssetSerializer)
 
     @capable_of('read_asset')
     def get(self, request, asset_slug=None, academy_id=None):
@@ -503,7 +509,7 @@ class AcademyAssetView(APIView, GenerateLookupsMixin):
         handler = self.extensions(request)
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         if asset_slug is not None:
             asset = Asset.get_by_slug(asset_slug, request)
@@ -609,7 +615,7 @@ class AcademyAssetView(APIView, GenerateLookupsMixin):
         items = items.filter(**lookup)
         items = handler.queryset(items)
 
-        serializer = AcademyAssetSerializer(items, many=True)
+        serializer = handler.fields.serializer(items, many=True)
 
         return handler.response(serializer.data)
 
@@ -665,7 +671,7 @@ class AcademyAssetCommentView(APIView, GenerateLookupsMixin):
         handler = self.extensions(request)
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         items = AssetComment.objects.filter(asset__academy__id=academy_id)
         lookup = {}
@@ -753,7 +759,7 @@ class AcademyKeywordView(APIView, GenerateLookupsMixin):
         handler = self.extensions(request)
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         items = AssetKeyword.objects.filter(academy__id=academy_id)
         lookup = {}
@@ -834,7 +840,7 @@ class AcademyKeywordClusterView(APIView, GenerateLookupsMixin):
         handler = self.extensions(request)
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         items = KeywordCluster.objects.filter(academy__id=academy_id)
         lookup = {}
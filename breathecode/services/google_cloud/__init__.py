@@ -7,3 +7,4 @@ from .function_v2 import *
 from .storage import *
 from .file import *
 from .credentials import *
+from .clients import *
@@ -0,0 +1,73 @@
+"""
+Google Cloud clients shared by the whole process
+"""
+import os
+import logging
+import threading
+from typing import Any, Callable
+
+import breathecode.services.google_cloud.credentials as credentials
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['get_client', 'get_datastore_client', 'get_ndb_client', 'get_storage_client', 'clear_clients']
+
+_clients: dict[str, Any] = {}
+_pid = os.getpid()
+_lock = threading.Lock()
+
+
+def clear_clients():
+    """Forget the clients, the next ones will be created again"""
+    global _pid
+
+    _clients.clear()
+    _pid = os.getpid()
+
+
+# the gRPC channels can't be used after a fork, like the one of the Celery prefork workers
+os.register_at_fork(after_in_child=clear_clients)
+
+
+def get_client(name: str, factory: Callable[[], Any]) -> Any:
+    """Get the client `name` of this process, it's created with `factory` the first time it's requested
+
+    Args:
+        name (str): Name of the client
+        factory (Callable): Function that builds the client
+
+    Returns:
+        Any: The client
+    """
+    if _pid != os.getpid():
+        clear_clients()
+
+    client = _clients.get(name)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(name)
+        if client is None:
+            credentials.resolve_credentials()
+            client = factory()
+            _clients[name] = client
+
+            logger.debug(f'Google Cloud client {name} created')
+
+    return client
+
+
+def get_datastore_client():
+    import google.cloud.datastore as datastore
+    return get_client('datastore', lambda: datastore.Client())
+
+
+def get_ndb_client():
+    from google.cloud import ndb
+    return get_client('ndb', lambda: ndb.Client())
+
+
+def get_storage_client():
+    import google.cloud.storage as storage
+    return get_client('storage', lambda: storage.Client())
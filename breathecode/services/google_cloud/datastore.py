@@ -1,21 +1,61 @@
+import base64
+import binascii
+import hashlib
 import logging
+from typing import Optional
 
 import google.cloud.datastore as datastore
+from django.core.cache import cache
+from breathecode.utils.cache import _sadd, _smembers
 
-from .credentials import resolve_credentials
+from .clients import get_datastore_client
 
 logger = logging.getLogger(__name__)
 
 __all__ = ['Datastore']
 
+# max number of entities written by one commit of Google Cloud Datastore
+PUT_MULTI_LIMIT = 500
+
+# seconds that a count is reused, the entities deleted or saved by other clients are counted after it expires
+COUNT_CACHE_TIMEOUT = 60 * 5
+
+
+def _count_fields_key(kind: str) -> str:
+    return f'datastore__{kind}__count_fields'
+
+
+def _count_key(kind: str, filters: dict) -> str:
+    fingerprint = hashlib.blake2b(repr(sorted(filters.items())).encode('utf-8'), digest_size=16).hexdigest()
+    return f'datastore__{kind}__count__{fingerprint}'
+
+
+def _incr_counts(kind: str, entities: list[dict]) -> None:
+    # the counts cached of the sets of fields that match each entity are incremented
+    count_fields = _smembers(_count_fields_key(kind))
+
+    for fields in [tuple(x.split(',')) if x else () for x in count_fields]:
+        deltas = {}
+        for entity in entities:
+            if all(field in entity for field in fields):
+                key = _count_key(kind, {field: entity[field] for field in fields})
+                deltas[key] = deltas.get(key, 0) + 1
+
+        for key, delta in deltas.items():
+            try:
+                cache.incr(key, delta)
+
+            # it was not cached
+            except ValueError:
+                pass
+
 
 class Datastore:
     """Google Cloud Storage"""
     client = None
 
     def __init__(self):
-        resolve_credentials()
-        self.client = datastore.Client()
+        self.client = get_datastore_client()
 
     def fetch(self, order_by=None, **kwargs):
         """Get Fetch object
@@ -48,6 +88,58 @@ class Datastore:
 
         return list(query.fetch(limit=limit, offset=offset))
 
+    def fetch_page(self, limit=100, cursor: Optional[str] = None, order_by=None, filters=None, **kwargs):
+        """Get a page of a query, it starts in `cursor`
+
+        The entities skipped by an offset are billed and read again in each page, a cursor is not.
+
+        Args:
+            limit: max number of entities of the page
+            cursor: cursor returned with the previous page
+            filters: other filters, like `[('created_at', '>=', date)]`
+            **kwargs: Arguments to Google Cloud Datastore
+
+        Returns:
+            tuple: the entities and the cursor of the next page, it's None in the last page
+
+        Raises:
+            ValueError: if the cursor is not valid
+        """
+        kind = kwargs.pop('kind')
+        query = self.client.query(kind=kind)
+
+        for key in kwargs:
+            query.add_filter(key, '=', kwargs[key])
+
+        for key, operator, value in filters or []:
+            query.add_filter(key, operator, value)
+
+        if order_by:
+            query.order = order_by
+
+        # the cursor is the urlsafe base64 token of the previous page, the client decodes it
+        start_cursor = None
+        if cursor:
+            start_cursor = cursor.encode('utf-8')
+
+            try:
+                base64.urlsafe_b64decode(start_cursor)
+
+            except binascii.Error:
+                raise ValueError('Invalid cursor')
+
+        iterator = query.fetch(limit=limit, start_cursor=start_cursor)
+        page = next(iterator.pages, None)
+        entities = list(page) if page is not None else []
+
+        # a batch could be shorter than the limit with more results left, the token is only missing when the
+        # query has no more results, the last page could be empty
+        next_cursor = None
+        if iterator.next_page_token:
+            next_cursor = iterator.next_page_token.decode('utf-8')
+
+        return entities, next_cursor
+
     def update(self, key: str, data: dict):
         """Get Fetch object
 
@@ -61,18 +153,64 @@ class Datastore:
         entity.update(data)
         self.client.put(entity)
 
-    def count(self, order_by=None, **kwargs):
+        _incr_counts(key, [data])
+
+    def update_multi(self, key: str, data: list[dict], names: Optional[list[str]] = None):
+        """Save many entities with `put_multi`, one request per `PUT_MULTI_LIMIT` entities
+
+        The entities with a name are overwritten if they are saved again, like in a retry after a failure, the
+        other ones get a new id each time.
+
+        Args:
+            key: kind of the entities
+            data: fields of each entity
+            names: names of the keys of the entities
         """
-        Count method for total entities on a query
+        entities = []
+        for i, fields in enumerate(data):
+            entity_key = self.client.key(key, names[i]) if names else self.client.key(key)
+            entity = datastore.Entity(entity_key)
+            entity.update(fields)
+            entities.append(entity)
+
+        for i in range(0, len(entities), PUT_MULTI_LIMIT):
+            self.client.put_multi(entities[i:i + PUT_MULTI_LIMIT])
+
+        # just once all the chunks were saved
+        _incr_counts(key, data)
 
+    def count(self, order_by=None, **kwargs):
+        """Count the entities of a query with a COUNT aggregation
+
+        The count is cached by `COUNT_CACHE_TIMEOUT` seconds, `update` and `update_multi` increment the
+        counts cached of the entities that they save. The entities deleted, overwritten or saved outside of
+        this class, like by the ndb models, are not reflected until the count expires.
+
+        Args:
+            **kwargs: Arguments to Google Cloud Datastore
+
+        Returns:
+            int: Number of entities
         """
 
         kind = kwargs.pop('kind')
+        key = _count_key(kind, kwargs)
+
+        count = cache.get(key)
+        if count is not None:
+            return count
+
         query = self.client.query(kind=kind)
 
-        for key in kwargs:
-            query.add_filter(key, '=', kwargs[key])
+        for field in kwargs:
+            query.add_filter(field, '=', kwargs[field])
+
+        aggregation_query = self.client.aggregation_query(query).count(alias='total')
+        count = sum(result.value for results in aggregation_query.fetch() for result in results)
+
+        cache.set(key, count, timeout=COUNT_CACHE_TIMEOUT)
 
-        query.keys_only()
+        # the writes must know which counts are cached
+        _sadd(_count_fields_key(kind), ','.join(sorted(kwargs)))
 
-        return len(list(query.fetch()))
+        return count
@@ -1,6 +1,6 @@
 import logging
 import google.cloud.storage as storage
-import breathecode.services.google_cloud.credentials as credentials
+from .clients import get_storage_client
 from .file import File
 
 logger = logging.getLogger(__name__)
@@ -13,9 +13,7 @@ class Storage:
     client: storage.Client
 
     def __init__(self) -> None:
-        # from google.cloud.storage import Client
-        credentials.resolve_credentials()
-        self.client = storage.Client()
+        self.client = get_storage_client()
 
     def file(self, bucket_name: str, file_name: str) -> File:
         """Get File object
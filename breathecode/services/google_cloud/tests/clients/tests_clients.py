@@ -0,0 +1,60 @@
+import os
+from unittest.mock import MagicMock, call, patch
+from django.test import SimpleTestCase
+from ...clients import get_client, clear_clients
+
+
+class ClientsTestSuite(SimpleTestCase):
+    """
+    🔽🔽🔽 Reused clients
+    """
+
+    @patch('breathecode.services.google_cloud.credentials.resolve_credentials', MagicMock())
+    def test_get_client__it_is_created_once(self):
+        from breathecode.services.google_cloud import credentials
+
+        factory = MagicMock(side_effect=lambda: object())
+
+        client1 = get_client('potato', factory)
+        client2 = get_client('potato', factory)
+
+        self.assertIs(client1, client2)
+        self.assertEqual(factory.call_args_list, [call()])
+        self.assertEqual(credentials.resolve_credentials.call_args_list, [call()])
+
+    @patch('breathecode.services.google_cloud.credentials.resolve_credentials', MagicMock())
+    def test_get_client__one_per_name(self):
+        factory = MagicMock(side_effect=lambda: object())
+
+        client1 = get_client('potato', factory)
+        client2 = get_client('tomato', factory)
+
+        self.assertIsNot(client1, client2)
+        self.assertEqual(factory.call_args_list, [call(), call()])
+
+    """
+    🔽🔽🔽 Cleared clients
+    """
+
+    @patch('breathecode.services.google_cloud.credentials.resolve_credentials', MagicMock())
+    def test_get_client__after_clear_clients(self):
+        factory = MagicMock(side_effect=lambda: object())
+
+        client1 = get_client('potato', factory)
+        clear_clients()
+        client2 = get_client('potato', factory)
+
+        self.assertIsNot(client1, client2)
+        self.assertEqual(factory.call_args_list, [call(), call()])
+
+    @patch('breathecode.services.google_cloud.credentials.resolve_credentials', MagicMock())
+    def test_get_client__in_a_forked_process(self):
+        factory = MagicMock(side_effect=lambda: object())
+
+        client1 = get_client('potato', factory)
+
+        with patch('os.getpid', MagicMock(return_value=os.getpid() + 1)):
+            client2 = get_client('potato', factory)
+
+        self.assertIsNot(client1, client2)
+        self.assertEqual(factory.call_args_list, [call(), call()])
@@ -0,0 +1,240 @@
+from unittest.mock import MagicMock, PropertyMock, call, patch
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from google.api_core.exceptions import FailedPrecondition
+from breathecode.tests.mocks import apply_google_cloud_datastore_client_mock
+from ...datastore import Datastore
+
+
+class AggregationResult:
+
+    def __init__(self, value):
+        self.alias = 'total'
+        self.value = value
+
+
+def client_mock(count=0):
+    client = MagicMock()
+    client.aggregation_query.return_value.count.return_value.fetch.return_value = [[AggregationResult(count)]]
+    return client
+
+
+class DatastoreTestSuite(SimpleTestCase):
+    """
+    🔽🔽🔽 Count
+    """
+
+    @patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+           MagicMock(return_value=client_mock(3)))
+    def test_count__with_aggregation(self):
+        datastore = Datastore()
+
+        self.assertEqual(datastore.count(kind='student_activity', slug='breathecode_login', user_id=1), 3)
+        self.assertEqual(datastore.client.query.call_args_list, [call(kind='student_activity')])
+        self.assertEqual(datastore.client.query.return_value.add_filter.call_args_list, [
+            call('slug', '=', 'breathecode_login'),
+            call('user_id', '=', 1),
+        ])
+        self.assertEqual(datastore.client.aggregation_query.call_args_list,
+                         [call(datastore.client.query.return_value)])
+        self.assertEqual(datastore.client.query.return_value.keys_only.call_args_list, [])
+
+    def test_count__aggregation_query_of_google_cloud_datastore(self):
+        client = apply_google_cloud_datastore_client_mock('student_activity', [], counts=[4])
+
+        with patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+                   MagicMock(return_value=client)):
+            datastore = Datastore()
+
+            self.assertEqual(datastore.count(kind='student_activity', user_id=1), 4)
+
+        calls = client._datastore_api.run_aggregation_query.call_args_list
+        self.assertEqual(len(calls), 1)
+
+        aggregation_query = calls[0].kwargs['request']['aggregation_query']
+        self.assertEqual([x.alias for x in aggregation_query.aggregations], ['total'])
+        self.assertEqual(aggregation_query.nested_query.kind[0].name, 'student_activity')
+        self.assertEqual(client._datastore_api.run_query.call_args_list, [])
+
+    @patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+           MagicMock(return_value=client_mock(3)))
+    def test_count__cached(self):
+        datastore = Datastore()
+
+        self.assertEqual(datastore.count(kind='student_activity', slug='breathecode_login', user_id=1), 3)
+        self.assertEqual(datastore.count(kind='student_activity', user_id=1, slug='breathecode_login'), 3)
+        self.assertEqual(datastore.client.aggregation_query.call_count, 1)
+
+    """
+    🔽🔽🔽 Writes
+    """
+
+    @patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+           MagicMock(return_value=client_mock()))
+    def test_update_multi__in_chunks(self):
+        datastore = Datastore()
+        datastore.update_multi('student_activity', [{'user_id': n} for n in range(1001)])
+
+        self.assertEqual([len(args[0]) for args, _ in datastore.client.put_multi.call_args_list],
+                         [500, 500, 1])
+
+    @patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+           MagicMock(return_value=client_mock(3)))
+    def test_update_multi__increment_the_counts(self):
+        datastore = Datastore()
+
+        datastore.count(kind='student_activity', user_id=1)
+        datastore.count(kind='student_activity', user_id=2)
+        datastore.count(kind='student_activity', slug='breathecode_login', user_id=1)
+
+        datastore.update_multi('student_activity', [
+            {
+                'slug': 'breathecode_login',
+                'user_id': 1
+            },
+            {
+                'slug': 'lesson_opened',
+                'user_id': 1
+            },
+        ])
+        datastore.update('student_activity', {'slug': 'breathecode_login', 'user_id': 1})
+
+        self.assertEqual(datastore.count(kind='student_activity', user_id=1), 6)
+        self.assertEqual(datastore.count(kind='student_activity', user_id=2), 3)
+        self.assertEqual(datastore.count(kind='student_activity', slug='breathecode_login', user_id=1), 5)
+        self.assertEqual(datastore.client.aggregation_query.call_count, 3)
+
+    @patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+           MagicMock(return_value=client_mock(3)))
+    def test_update_multi__redis__the_fields_are_a_set(self):
+        redis = MagicMock()
+        redis.smembers.return_value = {b'slug,user_id', b'user_id'}
+        datastore = Datastore()
+
+        with patch('breathecode.utils.cache._get_redis', MagicMock(return_value=redis)):
+            datastore.count(kind='student_activity', user_id=1)
+            datastore.count(kind='student_activity', slug='breathecode_login', user_id=1)
+            datastore.update('student_activity', {'slug': 'breathecode_login', 'user_id': 1})
+
+        key = cache.make_key('datastore__student_activity__count_fields')
+
+        self.assertEqual(redis.sadd.call_args_list, [call(key, 'user_id'), call(key, 'slug,user_id')])
+        self.assertEqual(redis.smembers.call_args_list, [call(key)])
+        self.assertEqual(datastore.count(kind='student_activity', user_id=1), 4)
+        self.assertEqual(datastore.count(kind='student_activity', slug='breathecode_login', user_id=1), 4)
+
+    """
+    🔽🔽🔽 Fetch page
+    """
+
+    @patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+           MagicMock(return_value=client_mock()))
+    def test_fetch_page__with_cursor(self):
+        datastore = Datastore()
+
+        iterator = datastore.client.query.return_value.fetch.return_value
+        iterator.pages = iter([[{'user_id': 1}, {'user_id': 2}]])
+        iterator.next_page_token = b'Y3Vyc29yLTI='
+
+        result = datastore.fetch_page(limit=2, cursor='Y3Vyc29yLTE=', kind='student_activity', user_id=1)
+
+        # the token is decoded by google-cloud-datastore
+        self.assertEqual(result, ([{'user_id': 1}, {'user_id': 2}], 'Y3Vyc29yLTI='))
+        self.assertEqual(datastore.client.query.return_value.fetch.call_args_list, [
+            call(limit=2, start_cursor=b'Y3Vyc29yLTE='),
+        ])
+
+    def test_fetch_page__the_cursor_of_the_next_page(self):
+        client = apply_google_cloud_datastore_client_mock('student_activity', [
+            [{
+                'id': 1,
+                'user_id': 1
+            }, {
+                'id': 2,
+                'user_id': 1
+            }],
+            [{
+                'id': 3,
+                'user_id': 1
+            }],
+        ])
+
+        with patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+                   MagicMock(return_value=client)):
+            datastore = Datastore()
+
+            entities1, cursor1 = datastore.fetch_page(limit=2, kind='student_activity')
+            entities2, cursor2 = datastore.fetch_page(limit=2, cursor=cursor1, kind='student_activity')
+
+        self.assertEqual([x.key.id for x in entities1], [1, 2])
+        self.assertEqual([x.key.id for x in entities2], [3])
+        self.assertEqual(cursor1, 'Y3Vyc29yLTE=')
+        self.assertEqual(cursor2, None)
+        self.assertEqual([
+            x.kwargs['request']['query'].start_cursor for x in client._datastore_api.run_query.call_args_list
+        ], [b'', b'cursor-1'])
+
+    def test_fetch_page__short_batch_with_more_results(self):
+        client = apply_google_cloud_datastore_client_mock('student_activity', [
+            [{
+                'id': 1,
+                'user_id': 1
+            }],
+            [{
+                'id': 2,
+                'user_id': 1
+            }, {
+                'id': 3,
+                'user_id': 1
+            }],
+        ])
+
+        with patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+                   MagicMock(return_value=client)):
+            datastore = Datastore()
+
+            entities1, cursor1 = datastore.fetch_page(limit=2, kind='student_activity')
+            entities2, cursor2 = datastore.fetch_page(limit=2, cursor=cursor1, kind='student_activity')
+
+        # the first batch was shorter than the limit but the query was not finished
+        self.assertEqual([x.key.id for x in entities1], [1])
+        self.assertEqual([x.key.id for x in entities2], [2, 3])
+        self.assertEqual(cursor1, 'Y3Vyc29yLTE=')
+        self.assertEqual(cursor2, None)
+
+    @patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+           MagicMock(return_value=client_mock()))
+    def test_fetch_page__last_page(self):
+        datastore = Datastore()
+
+        iterator = datastore.client.query.return_value.fetch.return_value
+        iterator.pages = iter([[{'user_id': 1}]])
+        iterator.next_page_token = None
+
+        result = datastore.fetch_page(limit=2, kind='student_activity', user_id=1)
+
+        self.assertEqual(result, ([{'user_id': 1}], None))
+
+    @patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+           MagicMock(return_value=client_mock()))
+    def test_fetch_page__query_error(self):
+        datastore = Datastore()
+
+        iterator = datastore.client.query.return_value.fetch.return_value
+        type(iterator).pages = PropertyMock(side_effect=FailedPrecondition('no matching index found'))
+
+        # it's not an invalid cursor, like a missing index
+        with self.assertRaises(FailedPrecondition):
+            datastore.fetch_page(limit=2, cursor='Y3Vyc29yLTE=', kind='student_activity', user_id=1)
+
+    def test_fetch_page__invalid_cursor(self):
+        client = apply_google_cloud_datastore_client_mock('student_activity', [[]])
+
+        with patch('breathecode.services.google_cloud.datastore.get_datastore_client',
+                   MagicMock(return_value=client)):
+            datastore = Datastore()
+
+            with self.assertRaisesMessage(ValueError, 'Invalid cursor'):
+                datastore.fetch_page(limit=2, cursor='a', kind='student_activity')
+
+        self.assertEqual(client._datastore_api.run_query.call_args_list, [])
@@ -112,3 +112,23 @@ def render_snooze_script(scripts):
             'emoji': True
         }
     }] + snooze_dates
+
+
+def render_budget_exceeded(budget, reasons):
+    return [{
+        'type': 'header',
+        'text': {
+            'type': 'plain_text',
+            'text': '🐢 Endpoint budget exceeded!',
+            'emoji': True
+        }
+    }, {
+        'type': 'section',
+        'text': {
+            'type':
+            'mrkdwn',
+            'text':
+            f'*App:* {budget.application.title} \n *View:* {budget.view} \n *Details:* \n ' +
+            '\n '.join(reasons),
+        },
+    }]
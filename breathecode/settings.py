@@ -71,6 +71,7 @@ INSTALLED_APPS = [
     'breathecode.career',
     'breathecode.commons',
     'breathecode.websocket',
+    'breathecode.activity',
     'explorer',
     'channels',
 ]
@@ -110,6 +111,7 @@ MIDDLEWARE = [
     # ⬆ This Rollbar should always be first please!
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'breathecode.monitoring.middleware.ProfilingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
 
@@ -326,6 +328,9 @@ elif not IS_REDIS_WITH_SSL:
 
 CACHE_MIDDLEWARE_SECONDS = 60 * int(os.getenv('CACHE_MIDDLEWARE_MINUTES', 120))
 
+# fraction of the requests whose queries and times are recorded, 0 disables the profiling middleware
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', 0))
+
 # Simplified static file serving.
 # https://warehouse.python.org/project/whitenoise/
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, TypeVar
 from rest_framework.test import APITestCase
 from django.db.models import Model
 from django.db.models.query import QuerySet
@@ -8,6 +8,8 @@ from ..token_mixin import TokenMixin
 
 __all__ = ['Check']
 
+T = TypeVar('T')
+
 
 class Check:
     """Mixin with the purpose of cover all the related with the custom asserts"""
@@ -181,3 +183,23 @@ class Check:
             self._parent.fail('The first argument is not a list')
 
         self._parent.assertEqual([x.pk for x in query], pks)
+
+    def queries(self, num: int, callback: Callable[[], T]) -> T:
+        """
+        Check the number of queries run by a callback, like a request to an endpoint, it returns its result.
+
+        Usage:
+
+        ```py
+        url = reverse_lazy('admissions:academy_cohort')
+
+        # pass because the endpoint run 3 queries
+        response = self.bc.check.queries(3, lambda: self.client.get(url))  # 🟢
+
+        # fail because the endpoint run 3 queries
+        response = self.bc.check.queries(2, lambda: self.client.get(url))  # 🔴
+        ```
+        """
+
+        with self._parent.assertNumQueries(num):
+            return callback()
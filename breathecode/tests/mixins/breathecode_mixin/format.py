@@ -1,9 +1,11 @@
 import base64
+import json
 import yaml
 import urllib.parse
 from typing import Any
 from rest_framework.test import APITestCase
 from django.db.models import Model
+from django.http.response import HttpResponseBase
 from django.db.models.query import QuerySet
 from ..models_mixin import ModelsMixin
 
@@ -215,3 +217,22 @@ class Format:
         """
 
         return s.decode(encode)
+
+    def from_response(self, response: HttpResponseBase) -> Any:
+        """
+        Get the content of a response, it also reads the streaming ones, the JSON ones are parsed.
+
+        Usage:
+
+        ```py
+        response = self.client.get(url)
+        json = self.bc.format.from_response(response)
+        ```
+        """
+
+        content = b''.join(response.streaming_content) if response.streaming else response.content
+
+        if response['Content-Type'].startswith('application/json'):
+            return json.loads(content)
+
+        return content.decode(ENCODE)
@@ -19,4 +19,7 @@ class CacheMixin():
         self.bc.cache.clear()
         ```
         """
+        from breathecode.utils.cache import clear_local_cache
+
         cache.clear()
+        clear_local_cache()
@@ -0,0 +1,26 @@
+"""
+Collections of mixins used to login in authorize microservice
+"""
+from breathecode.tests.mixins.models_mixin import ModelsMixin
+from .utils import is_valid, create_models
+
+
+class ActivityModelsMixin(ModelsMixin):
+
+    def generate_activity_models(self,
+                                 student_activity=False,
+                                 student_activity_kwargs={},
+                                 models={},
+                                 **kwargs):
+        """Generate models"""
+        models = models.copy()
+
+        if not 'student_activity' in models and is_valid(student_activity):
+            kargs = {}
+
+            models['student_activity'] = create_models(student_activity, 'activity.StudentActivity', **{
+                **kargs,
+                **student_activity_kwargs
+            })
+
+        return models
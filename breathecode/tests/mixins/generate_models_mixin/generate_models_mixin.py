@@ -20,6 +20,7 @@ from .mentorship_models_mixin import MentorshipModelsMixin
 from .career_models_mixin import CareerModelsMixin
 from .content_types_mixin import ContentTypesMixin
 from .registry_models_mixin import RegistryModelsMixin
+from .activity_models_mixin import ActivityModelsMixin
 
 __all__ = ['GenerateModelsMixin']
 
@@ -28,7 +29,7 @@ class GenerateModelsMixin(AuthMixin, AssignmentsModelsMixin, AdmissionsModelsMix
                           CertificateModelsMixin, FeedbackModelsMixin, NotifyModelsMixin, EventsModelsMixin,
                           AssessmentModelsMixin, FreelanceModelsMixin, MarketingModelsMixin,
                           MonitoringModelsMixin, MediaModelsMixin, MentorshipModelsMixin, CareerModelsMixin,
-                          ContentTypesMixin, RegistryModelsMixin):
+                          ContentTypesMixin, RegistryModelsMixin, ActivityModelsMixin):
 
     def __detect_invalid_arguments__(self, models={}, **kwargs):
         """check if one argument is invalid to prevent errors"""
@@ -106,6 +107,7 @@ class GenerateModelsMixin(AuthMixin, AssignmentsModelsMixin, AdmissionsModelsMix
             self.generate_monitoring_models,
             self.generate_certificate_models,
             self.generate_career_models,
+            self.generate_activity_models,
         )
 
         return fn(models=models, **kwargs)
@@ -14,6 +14,7 @@ class MonitoringModelsMixin(ModelsMixin):
                                    slack_channel=False,
                                    endpoint=False,
                                    monitor_script=False,
+                                   endpoint_budget=False,
                                    application_kwargs={},
                                    endpoint_kwargs={},
                                    monitor_script_kwargs={},
@@ -22,7 +23,8 @@ class MonitoringModelsMixin(ModelsMixin):
         """Generate models"""
         models = models.copy()
 
-        if not 'application' in models and (is_valid(application) or is_valid(monitor_script)):
+        if not 'application' in models and (is_valid(application) or is_valid(monitor_script)
+                                            or is_valid(endpoint_budget)):
             kargs = {}
 
             if 'academy' in models:
@@ -58,4 +60,12 @@ class MonitoringModelsMixin(ModelsMixin):
                 **monitor_script_kwargs
             })
 
+        if not 'endpoint_budget' in models and is_valid(endpoint_budget):
+            kargs = {}
+
+            if 'application' in models:
+                kargs['application'] = just_one(models['application'])
+
+            models['endpoint_budget'] = create_models(endpoint_budget, 'monitoring.EndpointBudget', **kargs)
+
         return models
@@ -2,6 +2,7 @@
 Mocks
 """
 from .google_cloud_storage import *
+from .google_cloud_datastore import *
 from .screenshotmachine import *
 from .celery import *
 from .django_contrib import *
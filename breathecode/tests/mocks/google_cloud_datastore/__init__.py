@@ -0,0 +1,77 @@
+"""
+Google Cloud Datastore Mocks
+"""
+from unittest.mock import MagicMock
+
+__all__ = ['apply_google_cloud_datastore_client_mock']
+
+PROJECT = 'the-beans-should-not-have-sugar'
+
+
+def _entity_result(kind: str, fields: dict):
+    from google.cloud.datastore import Entity, Key, helpers
+    from google.cloud.datastore_v1.types import query as query_pb2
+
+    fields = {**fields}
+    entity = Entity(Key(kind, fields.pop('id'), project=PROJECT))
+    entity.update(fields)
+
+    return query_pb2.EntityResult(entity=helpers.entity_to_protobuf(entity))
+
+
+def _run_query_response(kind: str, entities: list[dict], end_cursor: bytes, last: bool):
+    from google.cloud.datastore_v1.types import datastore as datastore_pb2
+    from google.cloud.datastore_v1.types import query as query_pb2
+
+    more_results = query_pb2.QueryResultBatch.MoreResultsType
+    return datastore_pb2.RunQueryResponse(batch=query_pb2.QueryResultBatch(
+        end_cursor=end_cursor,
+        more_results=more_results.NO_MORE_RESULTS if last else more_results.NOT_FINISHED,
+        entity_results=[_entity_result(kind, x) for x in entities],
+    ))
+
+
+def _run_aggregation_query_response(count: int):
+    from google.cloud.datastore_v1.types import aggregation_result as aggregation_result_pb2
+    from google.cloud.datastore_v1.types import datastore as datastore_pb2
+    from google.cloud.datastore_v1.types import entity as entity_pb2
+    from google.cloud.datastore_v1.types import query as query_pb2
+
+    more_results = query_pb2.QueryResultBatch.MoreResultsType
+    return datastore_pb2.RunAggregationQueryResponse(batch=aggregation_result_pb2.AggregationResultBatch(
+        more_results=more_results.NO_MORE_RESULTS,
+        aggregation_results=[
+            aggregation_result_pb2.AggregationResult(
+                aggregate_properties={'total': entity_pb2.Value(integer_value=count)}),
+        ],
+    ))
+
+
+def apply_google_cloud_datastore_client_mock(kind: str,
+                                             pages: list[list[dict]],
+                                             counts: list[int] = []) -> MagicMock:
+    """
+    Client whose queries are built and paginated by google-cloud-datastore, just the API is mocked.
+
+    Each page is a list of entities with the `id` of their key, the raw cursor after the page `n` is
+    `cursor-n`. The start cursors received are in `client._datastore_api.run_query.call_args_list`.
+
+    Each count is the result of an aggregation query, the queries received are in
+    `client._datastore_api.run_aggregation_query.call_args_list`.
+    """
+
+    from google.cloud.datastore.aggregation import AggregationQuery
+    from google.cloud.datastore.query import Query
+
+    client = MagicMock(project=PROJECT, namespace=None, database=None, current_transaction=None)
+    client.query.side_effect = lambda **kwargs: Query(client, **kwargs)
+    client.aggregation_query.side_effect = lambda query: AggregationQuery(client, query)
+    client._datastore_api.run_query.side_effect = [
+        _run_query_response(kind, entities, f'cursor-{n}'.encode('utf-8'), n == len(pages))
+        for n, entities in enumerate(pages, start=1)
+    ]
+    client._datastore_api.run_aggregation_query.side_effect = [
+        _run_aggregation_query_response(count) for count in counts
+    ]
+
+    return client
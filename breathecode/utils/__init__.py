@@ -6,8 +6,11 @@ from .admin_export_csv_mixin import *
 from .attr_dict import *
 from .breathecode_exception_handler import *
 from .cache import *
+from .cache_codecs import *
 from .decorators import *
 from .header_limit_offset_pagination import *
+from .cursor_pagination import *
+from .count import *
 from .localize_query import *
 from .permissions import *
 from .script_notification import *
@@ -22,3 +25,5 @@ from .object import *
 from .io import *
 from .api_view_extensions import *
 from .multi_status_response import *
+from .streaming_response import *
+from .request_profile import *
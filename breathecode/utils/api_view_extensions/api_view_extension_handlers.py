@@ -5,7 +5,7 @@ from typing import Any, Optional
 from rest_framework.response import Response
 from rest_framework import status
 from breathecode.utils.api_view_extensions.extension_base import ExtensionBase
-from .extensions import CacheExtension
+from .extensions import CacheExtension, FieldsExtension, rendered_response
 
 __all__ = ['APIViewExtensionHandlers']
 is_test_env = os.getenv('ENV') == 'test'
@@ -18,6 +18,7 @@ class APIViewExtensionHandlers:
 
     # the custom method we want to export go here
     cache: Optional[CacheExtension]
+    fields: Optional[FieldsExtension]
 
     # internal attrs
     _request: WSGIRequest
@@ -75,6 +76,10 @@ class APIViewExtensionHandlers:
         for extension in extensions:
             data, headers = extension._apply_response_mutation(data, headers)
 
+        # the cache extension renders the data once, it's used by the cache and by the response
+        if isinstance(data, bytes):
+            return rendered_response(data, headers=headers)
+
         return Response(data, status=status.HTTP_200_OK, headers=headers)
 
     def _register_valid_extensions(self) -> None:
@@ -1,3 +1,4 @@
 from .cache_extension import *
+from .fields_extension import *
 from .pagination_extension import *
 from .sort_extension import *
@@ -1,9 +1,38 @@
+import time
 from typing import Optional
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
 from breathecode.utils.api_view_extensions.extension_base import ExtensionBase
 from breathecode.utils.api_view_extensions.priorities.response_order import ResponseOrder
-from breathecode.utils.cache import Cache
+from breathecode.utils.cache import Cache, CachedResponse
+from breathecode.utils.request_profile import measure_serialization
 
-__all__ = ['CacheExtension']
+__all__ = ['CacheExtension', 'rendered_response']
+
+CONTENT_TYPE = 'application/json'
+LOCK_TIMEOUT = 10
+
+# seconds that a miss without a stale response waits for the request that is recomputing it, after that it
+# computes the response by itself, the interval between the checks is doubled each time
+WAIT_TIMEOUT = 1
+WAIT_INTERVAL = 0.05
+
+# these params are not comma separated lists
+LITERAL_PARAMS = ['like', 'sort']
+
+# sent by the requests that warm the cache, they are not counted as real ones
+WARMING_HEADER = 'X-Cache-Warming'
+
+
+def rendered_response(content: bytes, status: int = status.HTTP_200_OK, headers: dict = {}) -> Response:
+    """Build a response with a content rendered previously, DRF does not render it again."""
+
+    response = Response(status=status, headers=headers)
+    response.content = content
+    response['Content-Type'] = CONTENT_TYPE
+    return response
 
 
 class CacheExtension(ExtensionBase):
@@ -11,13 +40,39 @@ class CacheExtension(ExtensionBase):
     _cache: Cache
     _cache_per_user: bool
     _cache_prefix: str
+    _cache_soft_ttl: Optional[int]
+    _cache_stale_ttl: int
+    _cache_ignore: list[str]
+    _locked: bool
 
     def __init__(self, cache: Cache, **kwargs) -> None:
         self._cache = cache()
 
-    def _optional_dependencies(self, cache_per_user: bool = False, cache_prefix: str = '', **kwargs):
+    def _optional_dependencies(self,
+                               cache_per_user: bool = False,
+                               cache_prefix: str = '',
+                               cache_soft_ttl: Optional[int] = None,
+                               cache_stale_ttl: int = 60 * 5,
+                               cache_ignore: list[str] = [],
+                               **kwargs):
+        """
+        Set the optional arguments.
+
+        `cache_soft_ttl` enables stale-while-revalidate, after that number of seconds or after an invalidation
+        just one request recomputes the response while the others get the stale one for `cache_stale_ttl`
+        seconds, the concurrent misses without a stale response wait up to `WAIT_TIMEOUT` seconds for the
+        request that is recomputing, then they compute the response by themselves.
+
+        `cache_ignore` is a list of query params that does not change the response, they are not part of the
+        key.
+        """
+
         self._cache_per_user = cache_per_user
         self._cache_prefix = cache_prefix
+        self._cache_soft_ttl = cache_soft_ttl
+        self._cache_stale_ttl = cache_stale_ttl
+        self._cache_ignore = cache_ignore
+        self._locked = False
 
     def _instance_name(self) -> Optional[str]:
         return 'cache'
@@ -31,19 +86,143 @@ class CacheExtension(ExtensionBase):
         if self._cache_prefix:
             extends['breathecode.view.get'] = self._cache_prefix
 
-        return {**self._request.GET.dict(), **self._request.parser_context['kwargs'], **extends}
+        params = {}
+        for key, value in self._request.GET.dict().items():
+            if key in self._cache_ignore:
+                continue
+
+            # ?slug=b,a and ?slug=a,b are the same query
+            if key not in LITERAL_PARAMS and ',' in value:
+                value = ','.join(sorted(set(value.split(','))))
+
+            params[key] = value
+
+        return {**params, **self._request.parser_context['kwargs'], **extends}
+
+    def _is_cacheable(self) -> bool:
+        # the responses are stored rendered, other formats like csv are not cached
+        renderer = getattr(self._request, 'accepted_renderer', None)
+        return renderer is None or renderer.format == 'json'
+
+    def _is_not_modified(self, etag: str) -> bool:
+        if_none_match = self._request.headers.get('If-None-Match')
+        if not if_none_match:
+            return False
+
+        etags = parse_etags(if_none_match)
+        return etag in etags or '*' in etags
+
+    def _is_fresh(self, cached: CachedResponse) -> bool:
+        if self._cache_soft_ttl is None:
+            return True
+
+        return time.time() - cached.get('created_at', 0) < self._cache_soft_ttl
+
+    def _wait(self, params: dict) -> Optional[CachedResponse]:
+        # other request is recomputing this response
+        waited = 0
+        interval = WAIT_INTERVAL
+        while waited < WAIT_TIMEOUT and self._cache.is_locked(**params):
+            interval = min(interval, WAIT_TIMEOUT - waited)
+            time.sleep(interval)
+
+            waited += interval
+            interval *= 2
+
+        return self._cache.get_response(**params)
+
+    def _build_response(self, cached: CachedResponse) -> Response:
+        etag = quote_etag(cached['etag'])
+        if self._is_not_modified(etag):
+            return rendered_response(b'', status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        content = self._cache.codec.decompress(cached['content'])
+        return rendered_response(content, headers={**cached['headers'], 'ETag': etag})
+
+    def get(self) -> Optional[Response]:
+        """Get the cached response, it's returned as is without being deserialized."""
+
+        if not self._is_cacheable():
+            return None
 
-    def get(self) -> dict:
         params = self._get_params()
-        return self._cache.get(**params)
+        cached = self._cache.get_response(**params)
+
+        if cached is not None and self._is_fresh(cached):
+            return self._build_response(cached)
+
+        if self._cache_soft_ttl is None:
+            return None
+
+        stale = cached or self._cache.get_stale_response(**params)
+
+        # this request is in charge of recomputing the response
+        if self._cache.lock(LOCK_TIMEOUT, **params):
+            self._locked = True
+            self._release_when_finished()
+            return None
+
+        if stale is not None:
+            return self._build_response(stale)
+
+        if cached := self._wait(params):
+            return self._build_response(cached)
+
+        return None
+
+    def release(self) -> None:
+        """Release the lock of the recomputation, the waiting requests stop waiting."""
+
+        if self._locked:
+            self._cache.unlock(**self._get_params())
+            self._locked = False
+
+    def _release_when_finished(self) -> None:
+        # the view can raise or return a response that is not cached, like a 404, the lock is released when
+        # the view finishes instead of waiting for its timeout
+        view = self._request.parser_context.get('view')
+        if view is None:
+            return
+
+        handle_exception = view.handle_exception
+        finalize_response = view.finalize_response
+
+        def handle_exception_and_release(exc):
+            self.release()
+            return handle_exception(exc)
+
+        def finalize_response_and_release(request, response, *args, **kwargs):
+            self.release()
+            return finalize_response(request, response, *args, **kwargs)
+
+        view.handle_exception = handle_exception_and_release
+        view.finalize_response = finalize_response_and_release
 
     def _get_order_of_response(self) -> int:
         return int(ResponseOrder.CACHE)
 
     def _can_modify_response(self) -> bool:
-        return True
+        return self._is_cacheable()
+
+    def _render(self, data: list[dict] | dict) -> bytes:
+        renderer = getattr(self._request, 'accepted_renderer', None) or JSONRenderer()
+        media_type = getattr(self._request, 'accepted_media_type', None) or CONTENT_TYPE
+
+        with measure_serialization():
+            return renderer.render(data, media_type, {'request': self._request})
 
     def _apply_response_mutation(self, data: list[dict] | dict, headers: dict = {}):
+        content = self._render(data)
+        headers = {k: str(v) for k, v in headers.items()}
+
         params = self._get_params()
-        self._cache.set(data, **params)
-        return (data, headers)
+        stale_timeout = self._cache_stale_ttl if self._cache_soft_ttl is not None else None
+        cached = self._cache.set_response(content, headers, stale_timeout=stale_timeout, **params)
+
+        self.release()
+
+        if self._cache.warm_entries and not self._cache_per_user and WARMING_HEADER not in self._request.headers:
+            self._cache.record_request(self._request.build_absolute_uri())
+
+        # the content is already rendered, the handler return it as is
+        return (content, {**headers, 'ETag': quote_etag(cached['etag'])})
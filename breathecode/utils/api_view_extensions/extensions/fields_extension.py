@@ -0,0 +1,161 @@
+import functools
+from typing import Any, Optional
+import serpy
+from serpy.serializer import _compile_field_to_tuple
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from breathecode.utils.api_view_extensions.extension_base import ExtensionBase
+from breathecode.utils.api_view_extensions.priorities.mutator_order import MutatorOrder
+from breathecode.utils.serpy_extensions.query_planner import plan_queryset
+from breathecode.utils.validation_exception import ValidationException
+
+__all__ = ['FieldsExtension', 'get_sparse_serializer']
+
+FIELDS_QUERY_PARAM = 'fields'
+
+
+def _get_tree(paths: tuple[str, ...]) -> dict:
+    # ('id', 'academy.slug') -> {'id': {}, 'academy': {'slug': {}}}
+    tree = {}
+    for path in paths:
+        node = tree
+        for name in path.split('.'):
+            node = node.setdefault(name, {})
+
+    return tree
+
+
+def _build_sparse_serializer(serializer: type[serpy.Serializer], tree: dict) -> type[serpy.Serializer]:
+    if not tree:
+        return serializer
+
+    invalid = [x for x in tree if x not in serializer._field_map]
+    if invalid:
+        raise ValidationException(f'Invalid fields: {", ".join(invalid)}', code=400, slug='invalid-fields')
+
+    sparse = type(serializer.__name__, (serializer, ), {})
+    field_map = {}
+    compiled_fields = []
+
+    # the compiled fields keep the order of the field map
+    for (name, field), compiled_field in zip(serializer._field_map.items(), serializer._compiled_fields):
+        if name not in tree:
+            continue
+
+        if tree[name]:
+            if not isinstance(field, serpy.Serializer):
+                raise ValidationException(f'Invalid fields: {name}', code=400, slug='invalid-fields')
+
+            nested = _build_sparse_serializer(type(field), tree[name])
+            field = nested(many=field.many,
+                           attr=field.attr,
+                           call=field.call,
+                           label=field.label,
+                           required=field.required)
+
+            compiled_field = _compile_field_to_tuple(field, name, sparse)
+
+        field_map[name] = field
+        compiled_fields.append(compiled_field)
+
+    # the field map is read by plan_queryset
+    sparse._field_map = field_map
+    sparse._compiled_fields = tuple(compiled_fields)
+    return sparse
+
+
+@functools.lru_cache(maxsize=256)
+def get_sparse_serializer(serializer: type[serpy.Serializer], paths: tuple[str, ...]):
+    """
+    Get a serializer that just includes some fields, the nested ones are selected like `academy.slug`.
+
+    The serializers are built once for each selection.
+    """
+
+    return _build_sparse_serializer(serializer, _get_tree(paths))
+
+
+def _get_only_fields(serializer: type[serpy.Serializer], model: type[Model],
+                     tree: dict) -> Optional[list[str]]:
+    fields = [model._meta.pk.name]
+
+    for name in tree:
+        field = serializer._field_map[name]
+        attr = field.attr or name
+
+        # the getter could read any attribute
+        if field.getter_takes_serializer or field.call or '.' in attr:
+            return None
+
+        try:
+            model_field = model._meta.get_field(attr)
+
+        # it's a property
+        except FieldDoesNotExist:
+            return None
+
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+
+        # the related objects are still loaded on demand, just the foreign key is needed
+        fields.append(attr)
+
+    return fields
+
+
+class FieldsExtension(ExtensionBase):
+    """
+    Serialize just the fields requested with `?fields=id,slug,academy.slug`.
+
+    The relations read by the fields are loaded with `plan_queryset`. The queryset is narrowed with `.only()`
+    when every field requested is a column of the model, the methods and properties can read any attribute,
+    so the queryset is not narrowed if one of them is requested.
+    """
+
+    _serializer: type[serpy.Serializer]
+
+    def __init__(self, serializer: type[serpy.Serializer], **kwargs) -> None:
+        self._serializer = serializer
+
+    def _instance_name(self) -> Optional[str]:
+        return 'fields'
+
+    def _get_paths(self) -> tuple[str, ...]:
+        value = self._request.GET.get(FIELDS_QUERY_PARAM, '')
+        return tuple(sorted(set(x.strip() for x in value.split(',') if x.strip())))
+
+    def _can_modify_queryset(self) -> bool:
+        return True
+
+    def _get_order_of_mutator(self) -> int:
+        return int(MutatorOrder.FIELDS)
+
+    def _apply_queryset_mutation(self, queryset: QuerySet[Any]) -> QuerySet[Any]:
+        paths = self._get_paths()
+
+        # it raises if a field does not exist
+        serializer = get_sparse_serializer(self._serializer, paths)
+        queryset = plan_queryset(queryset, serializer)
+
+        if not paths:
+            return queryset
+
+        fields = _get_only_fields(self._serializer, queryset.model, _get_tree(paths))
+        if fields is None:
+            return queryset
+
+        return queryset.only(*fields)
+
+    def use(self, serializer: type[serpy.Serializer]) -> None:
+        """
+        Replace the serializer of the view, it must be called before mutating the queryset because the fields
+        are validated and loaded with it.
+        """
+
+        self._serializer = serializer
+
+    def serializer(self, instance: Any, many: bool = False) -> serpy.Serializer:
+        """Build the serializer with the fields requested."""
+
+        serializer = get_sparse_serializer(self._serializer, self._get_paths())
+        return serializer(instance, many=many)
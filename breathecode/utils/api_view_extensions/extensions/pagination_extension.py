@@ -1,10 +1,12 @@
 import inspect
 from collections import OrderedDict
-from typing import Any
+from typing import Any, Optional
 from breathecode.utils.api_view_extensions.extension_base import ExtensionBase
 from breathecode.utils.api_view_extensions.priorities.mutator_order import MutatorOrder
 from breathecode.utils.api_view_extensions.priorities.response_order import ResponseOrder
 from breathecode.utils.cache import Cache
+from breathecode.utils.count import count_queryset, is_count_disabled, is_count_requested
+from breathecode.utils.cursor_pagination import CURSOR_QUERY_PARAM, is_cursor_requested, paginate_by_cursor
 from breathecode.utils.exceptions import ProgramingError
 from django.db.models import QuerySet
 from rest_framework.utils.urls import replace_query_param, remove_query_param
@@ -32,13 +34,27 @@ def _positive_int(integer_string, strict=False, cutoff=None):
 
 
 class PaginationExtension(ExtensionBase):
+    """
+    Paginate the queryset through `limit` and `offset`.
+
+    With `paginate='cursor'` the clients can opt in to the cursor pagination with `?cursor=` or
+    `?paginate=cursor`, the pages are found through the sort field and the pk of the last row, the next link
+    has an opaque `cursor` and the count is only calculated with `?count=true`. The other requests are
+    paginated by offset.
+
+    The count is exact for the small querysets and estimated for the large ones, `?count=false` skips it, in
+    both cases the next link is found by fetching one extra row.
+    """
 
-    _count: int
+    _count: Optional[int]
+    _estimated: bool
+    _has_next: Optional[bool]
     _offset: int
     _use_envelope: bool
-    _paginate: bool
+    _paginate: bool | str
+    _next_cursor: Optional[str]
 
-    def __init__(self, paginate: bool, **kwargs) -> None:
+    def __init__(self, paginate: bool | str, **kwargs) -> None:
         self._paginate = paginate
 
     def _can_modify_queryset(self) -> bool:
@@ -54,7 +70,15 @@ class PaginationExtension(ExtensionBase):
         return int(ResponseOrder.PAGINATION) if self._is_paginate() else -1
 
     def _is_paginate(self):
-        return bool(self._request.GET.get(LIMIT_QUERY_PARAM) or self._request.GET.get(OFFSET_QUERY_PARAM))
+        return bool(
+            self._request.GET.get(LIMIT_QUERY_PARAM) or self._request.GET.get(OFFSET_QUERY_PARAM)
+            or self._is_cursor())
+
+    def _is_cursor(self):
+        if self._paginate != 'cursor' or OFFSET_QUERY_PARAM in self._request.GET:
+            return False
+
+        return is_cursor_requested(self._request.GET)
 
     def _apply_queryset_mutation(self, queryset: QuerySet[Any]):
         if not self._is_paginate():
@@ -64,12 +88,37 @@ class PaginationExtension(ExtensionBase):
         if str(self._request.GET.get('envelope')).lower() in ['false', '0']:
             self._use_envelope = False
 
-        self._count = self._get_count(queryset)
-        self._offset = self._get_offset()
         self._limit = self._get_limit()
-        return queryset[self._offset:self._offset + self._limit]
+
+        self._count = None
+        self._estimated = False
+
+        if self._is_cursor():
+            if is_count_requested(self._request):
+                self._count, self._estimated = self._get_count(queryset)
+
+            cursor = self._request.GET.get(CURSOR_QUERY_PARAM)
+            items, self._next_cursor = paginate_by_cursor(queryset, cursor, self._limit)
+            return items
+
+        if not is_count_disabled(self._request):
+            self._count, self._estimated = self._get_count(queryset)
+
+        self._offset = self._get_offset()
+        self._has_next = None
+
+        if self._count is not None and not self._estimated:
+            return queryset[self._offset:self._offset + self._limit]
+
+        # the extra row tells if there is a next page
+        items = list(queryset[self._offset:self._offset + self._limit + 1])
+        self._has_next = len(items) > self._limit
+        return items[0:self._limit]
 
     def _apply_response_mutation(self, data: list[dict] | dict, headers: dict = {}):
+        if self._is_cursor():
+            return self._apply_cursor_response_mutation(data, headers)
+
         next_url = self._parse_comma(self._get_next_link())
         previous_url = self._parse_comma(self._get_previous_link())
         first_url = self._parse_comma(self._get_first_link())
@@ -86,7 +135,7 @@ class PaginationExtension(ExtensionBase):
                 links.append('<{}>; rel="{}"'.format(url, label))
 
         headers = {**headers, 'Link': ', '.join(links)} if links else {**headers}
-        headers['x-total-count'] = self._count
+        self._set_count_headers(headers)
 
         if self._use_envelope:
             data = OrderedDict([('count', self._count), ('first', first_url), ('next', next_url),
@@ -95,21 +144,60 @@ class PaginationExtension(ExtensionBase):
 
         return (data, headers)
 
+    def _apply_cursor_response_mutation(self, data: list[dict] | dict, headers: dict = {}):
+        url = self._request.build_absolute_uri()
+        url = replace_query_param(url, LIMIT_QUERY_PARAM, self._limit)
+
+        # the empty cursor keeps the first page in the cursor pagination
+        first_url = None
+        if self._request.GET.get(CURSOR_QUERY_PARAM):
+            first_url = self._parse_comma(replace_query_param(url, CURSOR_QUERY_PARAM, ''))
+
+        next_url = None
+        if self._next_cursor:
+            next_url = self._parse_comma(replace_query_param(url, CURSOR_QUERY_PARAM, self._next_cursor))
+
+        links = []
+        for label, url in (
+            ('first', first_url),
+            ('next', next_url),
+        ):
+            if url is not None:
+                links.append('<{}>; rel="{}"'.format(url, label))
+
+        headers = {**headers, 'Link': ', '.join(links)} if links else {**headers}
+        self._set_count_headers(headers)
+
+        if self._use_envelope:
+            data = OrderedDict([('count', self._count), ('first', first_url), ('next', next_url),
+                                ('previous', None), ('last', None), ('results', data)])
+
+        return (data, headers)
+
     def _parse_comma(self, string: str):
         if not string:
             return None
 
         return string.replace('%2C', ',')
 
-    def _get_count(self, queryset: QuerySet[Any] | list):
+    def _set_count_headers(self, headers: dict) -> None:
+        if self._count is None:
+            return
+
+        headers['x-total-count'] = self._count
+
+        if self._estimated:
+            headers['x-total-count-estimated'] = 'true'
+
+    def _get_count(self, queryset: QuerySet[Any] | list) -> tuple[int, bool]:
         """
-        Determine an object count, supporting either querysets or regular lists.
+        Determine an object count and if it was estimated, supporting either querysets or regular lists.
         """
 
-        try:
-            return queryset.count()
-        except (AttributeError, TypeError):
-            return len(queryset)
+        if isinstance(queryset, QuerySet):
+            return count_queryset(queryset)
+
+        return len(queryset), False
 
     def _get_limit(self):
         if LIMIT_QUERY_PARAM:
@@ -136,7 +224,8 @@ class PaginationExtension(ExtensionBase):
         return remove_query_param(url, OFFSET_QUERY_PARAM)
 
     def _get_last_link(self):
-        if self._offset + self._limit >= self._count:
+        # an estimated count could point to an empty page
+        if self._count is None or self._estimated or self._offset + self._limit >= self._count:
             return None
 
         url = self._request.build_absolute_uri()
@@ -145,7 +234,7 @@ class PaginationExtension(ExtensionBase):
         return replace_query_param(url, OFFSET_QUERY_PARAM, offset)
 
     def _get_next_link(self):
-        if self._offset + self._limit >= self._count:
+        if self._has_next is False or (self._has_next is None and self._offset + self._limit >= self._count):
             return None
 
         url = self._request.build_absolute_uri()
@@ -5,4 +5,5 @@ __all__ = ['MutatorOrder']
 
 class MutatorOrder(IntEnum):
     SORT = 0
-    PAGINATION = 1  # keep as lastest number
+    FIELDS = 1
+    PAGINATION = 2  # keep as lastest number
@@ -1,105 +1,544 @@
 from __future__ import annotations
-import urllib.parse, json
+import hashlib, threading, time, urllib.parse
+from collections import OrderedDict
+from typing import Any, Optional, TypedDict
 from django.core.cache import cache
-from datetime import datetime
-from breathecode.tests.mixins import DatetimeMixin
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from .cache_codecs import CacheCodec, get_default_cache_codec
+from .request_profile import track_cache
 
-__all__ = ['Cache', 'CACHE_DESCRIPTORS']
+__all__ = [
+    'Cache', 'CachedResponse', 'CACHE_DESCRIPTORS', 'CACHE_DEPENDENCIES', 'get_cache_dependents',
+    'clear_cache_tree', 'get_cache_stats', 'clear_local_cache', 'CACHE_COUNTERS'
+]
 CACHE_DESCRIPTORS: dict[int, Cache] = {}
 
+# model name -> model names whose caches include its data
+CACHE_DEPENDENCIES: dict[str, set[str]] = {}
+
+# `bytes` is the size of the payloads written, not the size currently stored
+CACHE_COUNTERS = ['hits', 'misses', 'sets', 'invalidations', 'evictions', 'bytes']
+
+# seconds that each process keeps its counters before adding them to the shared ones
+STATS_FLUSH_INTERVAL = 5
+
+
+def get_cache_dependents(name: str) -> set[str]:
+    """Get the transitive set of model names whose caches must be invalidated when `name` changes."""
+
+    found = {name}
+    pending = [name]
+
+    while pending:
+        for dependent in CACHE_DEPENDENCIES.get(pending.pop(), ()):
+            if dependent not in found:
+                found.add(dependent)
+                pending.append(dependent)
+
+    return found
+
+
+def _generation_key(name: str) -> str:
+    return f'{name}__generation'
+
+
+def _seed_generation(key: str) -> None:
+    # the generation starts at the current time in microseconds, if it's evicted it's seeded again with a
+    # greater value, so it can't go back to the generation of the entries written before
+    cache.add(key, time.time_ns() // 1000, timeout=None)
+
+
+def _stats_key(name: str, counter: str) -> str:
+    return f'{name}__stats__{counter}'
+
+
+def _incr(key: str, delta: int = 1) -> None:
+    cache.add(key, 0, timeout=None)
+
+    try:
+        cache.incr(key, delta)
+
+    # the key was evicted between add and incr
+    except ValueError:
+        cache.set(key, delta, timeout=None)
+
+
+# model name -> key -> (generation, value, last check of the generation, expiration), it lives in each process
+_LOCAL_ENTRIES: dict[str, OrderedDict[str, tuple[int, Any, float, Optional[float]]]] = {}
+
+# model name -> counter -> delta, they are added to the shared counters every `STATS_FLUSH_INTERVAL` seconds
+_LOCAL_COUNTERS: dict[str, dict[str, int]] = {}
+
+# model name -> last time that its counters were added to the shared ones
+_LOCAL_FLUSHED_AT: dict[str, float] = {}
+
+_local_lock = threading.Lock()
+
+
+def _get_redis():
+    """Get the Redis client of the cache, it's None with other backends like the one of the tests."""
+
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+
+    except (ImportError, NotImplementedError):
+        return None
+
+
+def _sadd(key: str, member: str) -> None:
+    """Add a member to a set shared between processes, it's a set of Redis."""
+
+    if (redis := _get_redis()) is not None:
+        redis.sadd(cache.make_key(key), member)
+        return
+
+    # without Redis the set is only consistent within the process
+    with _local_lock:
+        members = cache.get(key) or set()
+
+        if member not in members:
+            members.add(member)
+            cache.set(key, members, timeout=None)
+
+
+def _smembers(key: str) -> set[str]:
+    if (redis := _get_redis()) is not None:
+        return {x.decode('utf-8') for x in redis.smembers(cache.make_key(key))}
+
+    return set(cache.get(key) or set())
+
+
+def _clear_one(name: str) -> None:
+    # the old entries become unreachable and expire by themselves
+    key = _generation_key(name)
+    _seed_generation(key)
+
+    try:
+        cache.incr(key)
+
+    # the key was evicted between add and incr, the new seed is a new generation too
+    except ValueError:
+        _seed_generation(key)
+
+    _incr(_stats_key(name, 'invalidations'))
+
+    # the other processes find out through the generation
+    with _local_lock:
+        _LOCAL_ENTRIES.pop(name, None)
+
+
+def clear_cache_tree(name: str) -> None:
+    """Invalidate the caches of a model and of every cache that depends on it."""
+
+    for dependent in get_cache_dependents(name):
+        _clear_one(dependent)
+
+
+def clear_local_cache() -> None:
+    """Clear the local tier of this process, the shared cache is not touched."""
+
+    with _local_lock:
+        _LOCAL_ENTRIES.clear()
+        _LOCAL_COUNTERS.clear()
+        _LOCAL_FLUSHED_AT.clear()
+
+
+def get_cache_stats() -> list[dict]:
+    """Get the counters of every cache descriptor."""
+
+    descriptors = sorted(CACHE_DESCRIPTORS.values(), key=lambda x: x.model.__name__)
+    return [{'name': type(x).__name__, **x.stats()} for x in descriptors]
+
+
+class CachedResponse(TypedDict):
+    etag: str
+    headers: dict[str, str]
+
+    # compressed by the codec of the cache
+    content: bytes
+
+    # timestamp used to know if the response is stale
+    created_at: float
+
+
+class Cache:
+    """
+    Descriptor of the cache of a model.
+
+    `timeout` is the time to live of each entry, by default the one of the backend. If `max_entries` is
+    provided, the least recently used entries of the current generation are evicted beyond that number,
+    the index used to find them is a sorted set of Redis shared between processes.
+
+    The counters are kept in each process and added to the shared ones every `STATS_FLUSH_INTERVAL` seconds.
+
+    If `local_max_entries` is provided, the hits are also kept in the memory of the process, they are served
+    without using the network during `local_timeout` seconds, after that the generation is checked again.
+    An invalidation is seen immediately in the process that does it and within `local_timeout` seconds in
+    the others.
+
+    If `warm_entries` is provided, the most requested urls that missed are recorded to be requested again
+    after an invalidation, the requests are anonymous so it only fits the caches of public views.
+    """
 
-class Cache(DatetimeMixin):
     model: str
+    depends: list[str]
     parents: list[str]
+    codec: CacheCodec = get_default_cache_codec()
+    timeout: Optional[int] = DEFAULT_TIMEOUT
+    max_entries: Optional[int] = None
+    local_max_entries: Optional[int] = None
+    local_timeout: float = 1
+    warm_entries: int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        name = cls.model.__name__
+        CACHE_DEPENDENCIES.setdefault(name, set())
+
+        for dependency in getattr(cls, 'depends', []):
+            CACHE_DEPENDENCIES.setdefault(dependency, set()).add(name)
+
+        for parent in getattr(cls, 'parents', []):
+            CACHE_DEPENDENCIES[name].add(parent)
+
+        CACHE_DESCRIPTORS[hash(cls.model)] = cls()
 
     def __init__(self):
         CACHE_DESCRIPTORS[hash(self.model)] = self
 
-    def __generate_key__(self, storage_key=False, parent='', **kwargs):
+    def __generate_key__(self, parent='', **kwargs):
         key = self.model.__name__ if not parent else parent
+        generation = self.generation(parent=parent)
 
-        if storage_key:
-            return f'{key}__keys'
+        return self._build_key(key, generation, **kwargs)
 
-        credentials = urllib.parse.urlencode(kwargs)
-        return f'{key}__{credentials}'
+    def _build_key(self, name: str, generation: int, /, **kwargs):
+        return f'{name}__v{generation}__{self._credentials(kwargs)}'
 
-    def __add_key_to_storage__(self, key: str):
-        storage_key = self.__generate_key__(storage_key=True)
+    def _credentials(self, kwargs: dict) -> str:
+        # the order of the params is irrelevant and the long values does not end in huge keys
+        credentials = urllib.parse.urlencode(sorted(kwargs.items()))
+        return hashlib.blake2b(credentials.encode('utf-8'), digest_size=16).hexdigest()
 
-        json_data = cache.get(storage_key)
-        keys = json.loads(json_data) if json_data else []
+    def __generate_unversioned_key__(self, kind: str, **kwargs):
+        # this key survives to the invalidations
+        return f'{self.model.__name__}__{kind}__{self._credentials(kwargs)}'
 
-        keys.append(key)
+    def generation(self, parent='') -> int:
+        # we get the generation from cache to support multiprocess
+        key = _generation_key(self.model.__name__ if not parent else parent)
+        generation = cache.get(key)
 
-        json_data = json.dumps(keys)
-        cache.set(storage_key, json_data)
+        if generation is None:
+            _seed_generation(key)
+            generation = cache.get(key)
 
-    def keys(self):
-        # we get key from cache to support multiprocess
-        key = self.__generate_key__(storage_key=True)
-        json_data = cache.get(key)
-        return json.loads(json_data) if json_data else []
+        return generation or 0
 
-    def __clear_one__(self, parent=''):
-        # we get key from cache to support multiprocess
-        storage_key = self.__generate_key__(storage_key=True, parent=parent)
-        keys = self.keys()
+    def clear(self):
+        clear_cache_tree(self.model.__name__)
 
-        for key in keys:
-            cache.set(key, None)
+    def _get_timeout(self) -> Optional[int]:
+        return cache.default_timeout if self.timeout is DEFAULT_TIMEOUT else self.timeout
 
-        cache.set(storage_key, None)
+    def _track(self, counter: str, delta: int = 1) -> None:
+        name = self.model.__name__
+        now = time.monotonic()
 
-    def clear(self):
-        # we get key from cache to support multiprocess
-        for parent in self.parents:
-            self.__clear_one__(parent)
+        with _local_lock:
+            counters = _LOCAL_COUNTERS.setdefault(name, {})
+            counters[counter] = counters.get(counter, 0) + delta
+            flushed_at = _LOCAL_FLUSHED_AT.setdefault(name, now)
 
-        self.__clear_one__()
+        if now - flushed_at >= STATS_FLUSH_INTERVAL:
+            self._flush_stats()
 
-    def get(self, **kwargs) -> dict:
-        key = self.__generate_key__(**kwargs)
-        json_data = cache.get(key)
-        return json.loads(json_data) if json_data else None
+    def _flush_stats(self) -> None:
+        name = self.model.__name__
 
-    def __fix_fields__(self, data):
-        for key in data.keys():
-            if isinstance(data[key], datetime):
-                data[key] = self.datetime_to_iso(data[key])
+        with _local_lock:
+            counters = _LOCAL_COUNTERS.pop(name, {})
+            _LOCAL_FLUSHED_AT[name] = time.monotonic()
 
-            if isinstance(data[key], dict):
-                data[key] = self.__fix_fields__(data[key])
+        for counter, delta in counters.items():
+            _incr(_stats_key(name, counter), delta)
 
-            if isinstance(data[key], list):
-                if data[key] and isinstance(data[key][0], dict):
-                    data[key] = [self.__fix_fields__(item) for item in data[key]]
+    def _get_local(self, kind: str, **kwargs) -> Any:
+        if self.local_max_entries is None:
+            return None
 
-                if data[key] and isinstance(data[key][0], datetime):
-                    data[key] = [self.datetime_to_iso(item) for item in data[key]]
+        name = self.model.__name__
+        key = self.__generate_unversioned_key__(kind, **kwargs)
 
-        return data
+        with _local_lock:
+            entry = _LOCAL_ENTRIES.get(name, {}).get(key)
 
-    def __fix_fields_in_array__(self, data):
-        check_data = data
-        if 'results' in data:
-            check_data = data['results']
+        if entry is None:
+            return None
+
+        generation, value, checked_at, expires_at = entry
+        now = time.monotonic()
+
+        if expires_at is not None and now >= expires_at:
+            return None
+
+        if now - checked_at >= self.local_timeout:
+            if self.generation() != generation:
+                return None
+
+            entry = (generation, value, now, expires_at)
+
+        with _local_lock:
+            entries = _LOCAL_ENTRIES.setdefault(name, OrderedDict())
+            entries[key] = entry
+            entries.move_to_end(key)
+
+        self._track('hits')
+        track_cache('hits')
+        return value
+
+    def _set_local(self, kind: str, generation: int, value: Any, **kwargs) -> None:
+        if self.local_max_entries is None:
+            return
+
+        key = self.__generate_unversioned_key__(kind, **kwargs)
+        now = time.monotonic()
+
+        # it does not outlive the shared entry
+        timeout = self._get_timeout()
+        expires_at = now + timeout if timeout is not None else None
+
+        with _local_lock:
+            entries = _LOCAL_ENTRIES.setdefault(self.model.__name__, OrderedDict())
+            entries[key] = (generation, value, now, expires_at)
+            entries.move_to_end(key)
+
+            while len(entries) > self.local_max_entries:
+                entries.popitem(last=False)
+
+    def _touch(self, key: str) -> None:
+        # keep the last use of each entry to evict the least recently used ones
+        if self.max_entries is None:
+            return
+
+        index_key = f'{self.model.__name__}__v{self.generation()}__entries'
+
+        if (redis := _get_redis()) is not None:
+            evicted = self._touch_sorted_set(redis, cache.make_key(index_key), key)
 
-        if isinstance(check_data, dict):
-            check_data = self.__fix_fields__(check_data)
         else:
-            check_data = [self.__fix_fields__(x) for x in check_data]
+            evicted = self._touch_dict(index_key, key)
+
+        if evicted:
+            cache.delete_many(evicted)
+            self._track('evictions', len(evicted))
+
+    def _touch_sorted_set(self, redis, index_key: str, key: str) -> list[str]:
+        # Redis updates the index atomically and each entry is popped by just one process
+        pipeline = redis.pipeline()
+        pipeline.zadd(index_key, {key: time.time()})
+        pipeline.zcard(index_key)
+
+        if (timeout := self._get_timeout()) is not None:
+            pipeline.expire(index_key, timeout)
+
+        size = pipeline.execute()[1]
+        if size <= self.max_entries:
+            return []
+
+        return [x.decode('utf-8') for x, _ in redis.zpopmin(index_key, size - self.max_entries)]
+
+    def _touch_dict(self, index_key: str, key: str) -> list[str]:
+        # without Redis the index is only consistent within the process, like the local memory of the tests
+        with _local_lock:
+            entries = cache.get(index_key) or {}
+            entries[key] = time.time()
+
+            evicted = sorted(entries, key=entries.get)[:max(len(entries) - self.max_entries, 0)]
+            for x in evicted:
+                del entries[x]
+
+            cache.set(index_key, entries, timeout=self._get_timeout())
+
+        return evicted
+
+    def _found(self, key: str, value) -> bool:
+        if not value:
+            self._track('misses')
+            track_cache('misses')
+            return False
+
+        self._track('hits')
+        track_cache('hits')
+        self._touch(key)
+        return True
+
+    def _store(self, key: str, value, size: int) -> None:
+        cache.set(key, value, timeout=self.timeout)
+
+        self._track('sets')
+        self._track('bytes', size)
+        self._touch(key)
+
+    def stats(self) -> dict[str, int]:
+        # the counters of the other processes are added within `STATS_FLUSH_INTERVAL` seconds
+        self._flush_stats()
+
+        keys = {_stats_key(self.model.__name__, x): x for x in CACHE_COUNTERS}
+        values = cache.get_many(list(keys))
+        return {counter: values.get(key, 0) for key, counter in keys.items()}
+
+    def reset_stats(self) -> None:
+        with _local_lock:
+            _LOCAL_COUNTERS.pop(self.model.__name__, None)
+
+        cache.delete_many([_stats_key(self.model.__name__, x) for x in CACHE_COUNTERS])
+
+    def get(self, **kwargs) -> dict:
+        if (value := self._get_local('data', **kwargs)) is not None:
+            return value
+
+        generation = self.generation()
+        key = self._build_key(self.model.__name__, generation, **kwargs)
+        value = cache.get(key)
 
-        if 'results' in data:
-            return {**data, 'results': check_data}
+        if not self._found(key, value):
+            return None
 
-        return check_data
+        value = self.codec.decode(value)
+        self._set_local('data', generation, value, **kwargs)
+        return value
 
     def set(self, data, **kwargs):
-        key = self.__generate_key__(**kwargs)
-        data = self.__fix_fields_in_array__(data)
+        generation = self.generation()
+        key = self._build_key(self.model.__name__, generation, **kwargs)
+        value = self.codec.encode(data)
+
+        self._store(key, value, len(value))
+
+        # the codec could transform some fields, like the datetimes
+        if self.local_max_entries is not None:
+            self._set_local('data', generation, self.codec.decode(value), **kwargs)
+
+    def get_response(self, **kwargs) -> Optional[CachedResponse]:
+        if (value := self._get_local('response', **kwargs)) is not None:
+            return value
+
+        generation = self.generation()
+        key = self._build_key(self.model.__name__, generation, **kwargs)
+        value = cache.get(key)
+
+        if not isinstance(value, dict):
+            value = None
+
+        if not self._found(key, value):
+            return None
+
+        self._set_local('response', generation, value, **kwargs)
+        return value
+
+    def set_response(self,
+                     content: bytes,
+                     headers: dict[str, str],
+                     stale_timeout: Optional[int] = None,
+                     **kwargs) -> CachedResponse:
+        """
+        Store a rendered response, the etag is the hash of its content.
+
+        If `stale_timeout` is provided, a copy is kept during that time to be served after the invalidation.
+        """
+
+        generation = self.generation()
+        key = self._build_key(self.model.__name__, generation, **kwargs)
+        value: CachedResponse = {
+            'etag': hashlib.blake2b(content, digest_size=16).hexdigest(),
+            'headers': headers,
+            'content': self.codec.compress(content),
+            'created_at': time.time(),
+        }
+
+        self._store(key, value, len(value['content']))
+        self._set_local('response', generation, value, **kwargs)
+
+        if stale_timeout:
+            stale_key = self.__generate_unversioned_key__('stale', **kwargs)
+            cache.set(stale_key, value, timeout=stale_timeout)
+
+        return value
+
+    def _hot_key(self) -> str:
+        return f'{self.model.__name__}__hot'
+
+    def record_request(self, url: str) -> None:
+        """Count a request of an url, the counters are a sorted set of Redis shared between processes."""
+
+        if not self.warm_entries:
+            return
+
+        if (redis := _get_redis()) is not None:
+            key = cache.make_key(self._hot_key())
+
+            pipeline = redis.pipeline()
+            pipeline.zincrby(key, 1, url)
+            pipeline.zcard(key)
+
+            # keep the most requested ones, the new ones have a chance to climb before being dropped
+            if pipeline.execute()[1] > self.warm_entries * 2:
+                redis.zremrangebyrank(key, 0, -self.warm_entries - 1)
+
+            return
+
+        # without Redis the counters are only consistent within the process
+        with _local_lock:
+            requests = cache.get(self._hot_key()) or {}
+            requests[url] = requests.get(url, 0) + 1
+
+            if len(requests) > self.warm_entries * 2:
+                requests = dict(
+                    sorted(requests.items(), key=lambda x: x[1], reverse=True)[:self.warm_entries])
+
+            cache.set(self._hot_key(), requests, timeout=None)
+
+    def forget_request(self, url: str) -> None:
+        if (redis := _get_redis()) is not None:
+            redis.zrem(cache.make_key(self._hot_key()), url)
+            return
+
+        with _local_lock:
+            requests = cache.get(self._hot_key()) or {}
+
+            if requests.pop(url, None) is not None:
+                cache.set(self._hot_key(), requests, timeout=None)
+
+    def get_hot_requests(self) -> list[str]:
+        """Get the most requested urls, sorted from the most requested."""
+
+        if (redis := _get_redis()) is not None:
+            urls = redis.zrevrange(cache.make_key(self._hot_key()), 0, self.warm_entries - 1)
+            return [x.decode('utf-8') for x in urls]
+
+        requests = cache.get(self._hot_key()) or {}
+        return sorted(requests, key=requests.get, reverse=True)[:self.warm_entries]
+
+    def get_stale_response(self, **kwargs) -> Optional[CachedResponse]:
+        """Get the last response stored with a `stale_timeout`, even if it was invalidated."""
+
+        key = self.__generate_unversioned_key__('stale', **kwargs)
+        value = cache.get(key)
+        return value if isinstance(value, dict) else None
+
+    def lock(self, timeout: int, **kwargs) -> bool:
+        """Try to get the right to recompute a response, it's released after `timeout` seconds."""
+
+        key = self.__generate_unversioned_key__('lock', **kwargs)
+        return cache.add(key, 1, timeout=timeout)
 
-        json_data = json.dumps(data)
-        cache.set(key, json_data)
+    def is_locked(self, **kwargs) -> bool:
+        key = self.__generate_unversioned_key__('lock', **kwargs)
+        return bool(cache.get(key))
 
-        self.__add_key_to_storage__(key)
+    def unlock(self, **kwargs) -> None:
+        key = self.__generate_unversioned_key__('lock', **kwargs)
+        cache.delete(key)
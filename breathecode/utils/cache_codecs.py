@@ -0,0 +1,130 @@
+"""
+Serialization of the payloads stored by `Cache`.
+"""
+
+from __future__ import annotations
+import json, zlib
+from datetime import datetime
+from typing import Any, Optional
+from breathecode.tests.mixins import DatetimeMixin
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ['CacheCodec', 'JsonCacheCodec', 'OrjsonCacheCodec', 'get_default_cache_codec']
+
+RAW_FLAG = b'r'
+ZLIB_FLAG = b'z'
+
+
+class CacheCodec:
+    """
+    Transform the data of a `Cache` to bytes and vice versa.
+
+    The payloads with a size equal or greater than `compress_min_size` are compressed with zlib, the first
+    byte of the stored value tells if it was compressed.
+    """
+
+    compress_min_size: Optional[int]
+    compress_level: int
+
+    def __init__(self, compress_min_size: Optional[int] = 16 * 1024, compress_level: int = 1):
+        self.compress_min_size = compress_min_size
+        self.compress_level = compress_level
+
+    def dumps(self, data: Any) -> bytes:
+        raise NotImplementedError()
+
+    def loads(self, value: bytes) -> Any:
+        raise NotImplementedError()
+
+    def compress(self, value: bytes) -> bytes:
+        if self.compress_min_size is not None and len(value) >= self.compress_min_size:
+            return ZLIB_FLAG + zlib.compress(value, self.compress_level)
+
+        return RAW_FLAG + value
+
+    def decompress(self, value: bytes) -> bytes:
+        flag, value = value[:1], value[1:]
+        if flag == ZLIB_FLAG:
+            return zlib.decompress(value)
+
+        return value
+
+    def encode(self, data: Any) -> bytes:
+        value = self.dumps(data)
+        return self.compress(value)
+
+    def decode(self, value: bytes | str) -> Any:
+        # plain JSON, it was stored before the codecs were introduced
+        if isinstance(value, str):
+            return json.loads(value)
+
+        value = self.decompress(value)
+        return self.loads(value)
+
+
+class JsonCacheCodec(CacheCodec, DatetimeMixin):
+    """Codec based on the standard library, it walks the payload to transform the datetimes to ISO 8601."""
+
+    def __fix_fields__(self, data):
+        for key in data.keys():
+            if isinstance(data[key], datetime):
+                data[key] = self.datetime_to_iso(data[key])
+
+            if isinstance(data[key], dict):
+                data[key] = self.__fix_fields__(data[key])
+
+            if isinstance(data[key], list):
+                if data[key] and isinstance(data[key][0], dict):
+                    data[key] = [self.__fix_fields__(item) for item in data[key]]
+
+                if data[key] and isinstance(data[key][0], datetime):
+                    data[key] = [self.datetime_to_iso(item) for item in data[key]]
+
+        return data
+
+    def __fix_fields_in_array__(self, data):
+        check_data = data
+        if 'results' in data:
+            check_data = data['results']
+
+        if isinstance(check_data, dict):
+            check_data = self.__fix_fields__(check_data)
+        else:
+            check_data = [self.__fix_fields__(x) for x in check_data]
+
+        if 'results' in data:
+            return {**data, 'results': check_data}
+
+        return check_data
+
+    def dumps(self, data: Any) -> bytes:
+        data = self.__fix_fields_in_array__(data)
+        return json.dumps(data).encode('utf-8')
+
+    def loads(self, value: bytes) -> Any:
+        return json.loads(value)
+
+
+class OrjsonCacheCodec(CacheCodec):
+    """Codec based on orjson, it serializes the datetimes natively in ISO 8601 with the Z suffix."""
+
+    options = 0 if orjson is None else orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, data: Any) -> bytes:
+        return orjson.dumps(data, option=self.options)
+
+    def loads(self, value: bytes) -> Any:
+        return orjson.loads(value)
+
+
+def get_default_cache_codec() -> CacheCodec:
+    """Get the orjson codec, it falls back to the standard library when orjson is not installed."""
+
+    if orjson is None:
+        return JsonCacheCodec()
+
+    return OrjsonCacheCodec()
@@ -0,0 +1,86 @@
+"""
+Counts of querysets for the paginations, they are exact for the small ones and estimated for the large ones.
+"""
+
+import hashlib, json
+from typing import Optional
+from django.core.cache import cache
+from django.db import DatabaseError, connections, transaction
+from django.db.models import QuerySet
+
+__all__ = [
+    'EXACT_COUNT_THRESHOLD', 'COUNT_QUERY_PARAM', 'count_queryset', 'is_count_disabled', 'is_count_requested'
+]
+
+# querysets with more rows than this get an estimated count
+EXACT_COUNT_THRESHOLD = 1000
+
+# seconds that an exact count of a large queryset is reused
+COUNT_CACHE_TIMEOUT = 60
+
+COUNT_QUERY_PARAM = 'count'
+
+
+def is_count_disabled(request) -> bool:
+    return str(request.GET.get(COUNT_QUERY_PARAM)).lower() in ['false', '0']
+
+
+def is_count_requested(request) -> bool:
+    return str(request.GET.get(COUNT_QUERY_PARAM)).lower() in ['true', '1']
+
+
+def _planner_estimate(queryset: QuerySet) -> Optional[int]:
+    sql, params = queryset.query.sql_with_params()
+
+    # in a savepoint, an error would abort the transaction of the request
+    try:
+        with transaction.atomic(using=queryset.db), connections[queryset.db].cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+
+    except DatabaseError:
+        return None
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _cached_count(queryset: QuerySet) -> int:
+    sql, params = queryset.query.sql_with_params()
+    fingerprint = hashlib.blake2b(f'{sql}{params}'.encode('utf-8'), digest_size=16).hexdigest()
+    key = f'count__{fingerprint}'
+
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout=COUNT_CACHE_TIMEOUT)
+
+    return count
+
+
+def count_queryset(queryset: QuerySet, threshold: Optional[int] = None) -> tuple[int, bool]:
+    """
+    Count the rows of a queryset, it returns the count and if it was estimated.
+
+    Below `threshold` the count is exact, above it PostgreSQL returns the estimate of its planner and the
+    other databases an exact count cached for a short time.
+    """
+
+    if threshold is None:
+        threshold = EXACT_COUNT_THRESHOLD
+
+    queryset = queryset.order_by()
+
+    # it's bounded, the database stops after `threshold + 1` rows
+    count = queryset[0:threshold + 1].count()
+    if count <= threshold:
+        return count, False
+
+    if connections[queryset.db].vendor == 'postgresql':
+        estimate = _planner_estimate(queryset)
+        if estimate is not None:
+            return max(estimate, count), True
+
+    return _cached_count(queryset), True
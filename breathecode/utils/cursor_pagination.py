@@ -0,0 +1,125 @@
+"""
+Keyset pagination, the next page is found through the values of the last row instead of an offset.
+"""
+
+import base64, json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+from uuid import UUID
+from django.db.models import F, Q, QuerySet
+from .validation_exception import ValidationException
+
+__all__ = [
+    'CURSOR_QUERY_PARAM', 'PAGINATE_QUERY_PARAM', 'is_cursor_requested', 'encode_cursor', 'decode_cursor',
+    'paginate_by_cursor'
+]
+
+CURSOR_QUERY_PARAM = 'cursor'
+PAGINATE_QUERY_PARAM = 'paginate'
+
+
+def _default(value):
+    # the datetimes keep the microseconds, otherwise the rows with the same second would be skipped
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+
+    raise TypeError(f'Type {type(value)} is not supported by the cursors')
+
+
+def is_cursor_requested(params) -> bool:
+    """Tell if the client opted in to the cursor pagination with `?cursor=` or `?paginate=cursor`."""
+
+    return CURSOR_QUERY_PARAM in params or params.get(PAGINATE_QUERY_PARAM) == 'cursor'
+
+
+def encode_cursor(value: Any, pk: Any) -> str:
+    content = json.dumps([value, pk], default=_default, separators=(',', ':'))
+
+    # without padding, it does not need to be escaped in the urls
+    return base64.urlsafe_b64encode(content.encode('utf-8')).decode('utf-8').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[Any, Any]:
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        value, pk = json.loads(base64.urlsafe_b64decode((cursor + padding).encode('utf-8')))
+
+    except Exception:
+        raise ValidationException('Invalid cursor', code=400, slug='invalid-cursor')
+
+    return value, pk
+
+
+def _get_ordering(queryset: QuerySet) -> tuple[str, bool]:
+    ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering) or ['pk']
+    field = ordering[0]
+
+    # the expressions are not supported
+    if not isinstance(field, str):
+        return 'pk', False
+
+    return field.lstrip('-'), field.startswith('-')
+
+
+def _get_value(obj, field: str) -> Any:
+    for attr in field.split('__'):
+        if obj is None:
+            return None
+
+        obj = getattr(obj, attr)
+
+    return obj
+
+
+def _after(field: str, value: Any, pk: Any, descending: bool) -> Q:
+    # the nulls are first in descending order and last in ascending order
+    if descending:
+        if value is None:
+            return Q(**{f'{field}__isnull': True, 'pk__lt': pk}) | Q(**{f'{field}__isnull': False})
+
+        return Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lt': pk})
+
+    if value is None:
+        return Q(**{f'{field}__isnull': True, 'pk__gt': pk})
+
+    return Q(**{f'{field}__gt': value}) | Q(**{field: value, 'pk__gt': pk}) | Q(**{f'{field}__isnull': True})
+
+
+def paginate_by_cursor(queryset: QuerySet, cursor: Optional[str], limit: int) -> tuple[list, Optional[str]]:
+    """
+    Get the page after `cursor` sorted by the first field of the current ordering and the pk.
+
+    It returns the rows and the cursor of the next page, it's None if this is the last one.
+    """
+
+    field, descending = _get_ordering(queryset)
+    pk_ordering = '-pk' if descending else 'pk'
+
+    if field in ['pk', 'id']:
+        queryset = queryset.order_by(pk_ordering)
+
+    else:
+        expression = F(field).desc(nulls_first=True) if descending else F(field).asc(nulls_last=True)
+        queryset = queryset.order_by(expression, pk_ordering)
+
+    if cursor:
+        value, pk = decode_cursor(cursor)
+
+        if field in ['pk', 'id']:
+            queryset = queryset.filter(**{'pk__lt' if descending else 'pk__gt': pk})
+
+        else:
+            queryset = queryset.filter(_after(field, value, pk, descending))
+
+    # the extra row tells if there is a next page
+    items = list(queryset[0:limit + 1])
+    if len(items) <= limit:
+        return items, None
+
+    items = items[0:limit]
+    last = items[-1]
+    return items, encode_cursor(_get_value(last, field), last.pk)
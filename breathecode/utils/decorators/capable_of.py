@@ -6,7 +6,7 @@ from breathecode.utils.exceptions import ProgramingError
 from ..validation_exception import ValidationException
 from rest_framework.views import APIView
 
-__all__ = ['capable_of']
+__all__ = ['capable_of', 'get_user_capabilities']
 
 
 def capable_of(capability=None):
@@ -74,19 +74,43 @@ def get_academy_from_capability(kwargs, request, capability):
     if isinstance(request.user, AnonymousUser):
         raise PermissionDenied('Invalid user')
 
-    capable = ProfileAcademy.objects.filter(user=request.user.id,
-                                            academy__id=academy_id,
-                                            role__capabilities__slug=capability)
+    academy = get_user_capabilities(request.user.id).get(str(academy_id))
 
-    if capable.count() == 0:
+    if academy is None or capability not in academy['capabilities']:
         raise PermissionDenied(
             f"You (user: {request.user.id}) don't have this capability: {capability} for academy {academy_id}"
         )
 
-    academy = capable.first().academy
-    if academy.status == 'DELETED':
+    if academy['status'] == 'DELETED':
         raise PermissionDenied(f'This academy is deleted')
-    if request.get_full_path() != '/v1/admissions/academy/activate' and academy.status == 'INACTIVE':
+    if request.get_full_path() != '/v1/admissions/academy/activate' and academy['status'] == 'INACTIVE':
         raise PermissionDenied(f'This academy is not active')
 
     return academy_id
+
+
+def get_user_capabilities(user_id: int) -> dict[str, dict]:
+    """
+    Get the capabilities of an user in each academy, like `{'1': {'status': 'ACTIVE', 'capabilities': [...]}}`.
+
+    It's cached until a ProfileAcademy, Role, Capability or Academy changes.
+    """
+
+    from breathecode.authenticate.caches import ProfileAcademyCache
+
+    descriptor = ProfileAcademyCache()
+    capabilities = descriptor.get(user_id=user_id)
+    if capabilities is not None:
+        return capabilities
+
+    capabilities = {}
+    rows = ProfileAcademy.objects.filter(user__id=user_id).values_list('academy__id', 'academy__status',
+                                                                       'role__capabilities__slug')
+
+    for academy_id, status, capability in rows:
+        academy = capabilities.setdefault(str(academy_id), {'status': status, 'capabilities': []})
+        if capability and capability not in academy['capabilities']:
+            academy['capabilities'].append(capability)
+
+    descriptor.set(capabilities, user_id=user_id)
+    return capabilities
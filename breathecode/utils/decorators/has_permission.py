@@ -1,19 +1,46 @@
 from django.contrib.auth.models import AnonymousUser
+from django.db.models import Q
 from rest_framework.views import APIView
 
 from ..validation_exception import ValidationException
 from ..exceptions import ProgramingError
 from breathecode.authenticate.models import Permission, User
 
-__all__ = ['has_permission', 'validate_permission']
+__all__ = ['has_permission', 'validate_permission', 'user_has_permissions', 'get_user_permissions']
 
 
-def validate_permission(user: User, permission: str) -> bool:
-    found = Permission.objects.filter(codename=permission).first()
-    if not found:
-        return False
+def get_user_permissions(user: User) -> set[str]:
+    """
+    Get the codenames of the permissions of an user, the ones assigned directly and through its groups.
+
+    It's cached until a Permission or Group changes, or until the permissions or groups of an user change.
+    """
+
+    if not user.id:
+        return set()
+
+    from breathecode.authenticate.caches import PermissionCache
+
+    descriptor = PermissionCache()
+    permissions = descriptor.get(user_id=user.id)
+    if permissions is not None:
+        return set(permissions)
+
+    query = Q(user__id=user.id) | Q(group__user__id=user.id)
+    permissions = sorted(Permission.objects.filter(query).values_list('codename', flat=True).distinct())
 
-    return found.user_set.filter(id=user.id).count() or found.group_set.filter(user__id=user.id).count()
+    descriptor.set(permissions, user_id=user.id)
+    return set(permissions)
+
+
+def user_has_permissions(user: User, permissions: list[str]) -> bool:
+    """Check if an user has all the permissions provided."""
+
+    return set(permissions).issubset(get_user_permissions(user))
+
+
+def validate_permission(user: User, permission: str) -> bool:
+    return permission in get_user_permissions(user)
 
 
 def has_permission(permission: str):
@@ -2,21 +2,119 @@ from collections import OrderedDict
 from rest_framework.pagination import LimitOffsetPagination, PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.utils.urls import replace_query_param, remove_query_param
+from .count import count_queryset, is_count_disabled, is_count_requested
+from .cursor_pagination import CURSOR_QUERY_PARAM, is_cursor_requested, paginate_by_cursor
+from .validation_exception import ValidationException
 
 __all__ = ['HeaderLimitOffsetPagination']
 
 
 class HeaderLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Paginate through `limit` and `offset`, the links are returned in the headers.
+
+    If `cursor_pagination` is True, the clients can opt in to the cursor pagination with `?cursor=` or
+    `?paginate=cursor`, the querysets are paginated through the sort field and the pk of the last row, the
+    next link has an opaque `cursor` and the count is only calculated with `?count=true`. The other requests
+    are paginated by offset.
+
+    The queries that are not querysets, like the ones of Google Cloud Datastore, are paginated by their own
+    cursors with `paginate_by_fetch_page`.
+
+    The count of the querysets is exact for the small ones and estimated for the large ones, `?count=false`
+    skips it, in both cases the next link is found by fetching one extra row.
+    """
+
+    cursor_pagination = False
+    paginated_by_cursor = False
+    count_estimated = False
+    has_next_page = None
 
     def paginate_queryset(self, queryset, request, view=None):
         self.use_envelope = True
         if str(request.GET.get('envelope')).lower() in ['false', '0']:
             self.use_envelope = False
-        result = super().paginate_queryset(queryset, request, view)
+
+        self.paginated_by_cursor = hasattr(queryset, 'filter') and self.is_paginated_by_cursor(request)
+
+        if self.paginated_by_cursor:
+            return self.paginate_queryset_by_cursor(queryset, request)
+
         if hasattr(queryset, 'filter'):
-            return result
+            return self.paginate_queryset_by_offset(queryset, request)
+
+        super().paginate_queryset(queryset, request, view)
         return queryset
 
+    def paginate_queryset_by_offset(self, queryset, request):
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.request = request
+        self.offset = self.get_offset(request)
+        self.count = None
+        self.count_estimated = False
+
+        if not is_count_disabled(request):
+            self.count, self.count_estimated = count_queryset(queryset)
+
+        if self.count is not None and not self.count_estimated:
+            if self.count == 0 or self.offset > self.count:
+                return []
+
+            return list(queryset[self.offset:self.offset + self.limit])
+
+        # the extra row tells if there is a next page
+        items = list(queryset[self.offset:self.offset + self.limit + 1])
+        self.has_next_page = len(items) > self.limit
+        return items[0:self.limit]
+
+    def paginate_queryset_by_cursor(self, queryset, request):
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.request = request
+        self.count = None
+        self.count_estimated = False
+
+        if is_count_requested(request):
+            self.count, self.count_estimated = count_queryset(queryset)
+
+        items, self.next_cursor = paginate_by_cursor(queryset, request.GET.get(CURSOR_QUERY_PARAM),
+                                                     self.limit)
+        return items
+
+    def is_paginated_by_cursor(self, request) -> bool:
+        """Tell if the request must be paginated by cursor, it's paginated by offset if it has `offset`."""
+
+        return bool(self.cursor_pagination and self.offset_query_param not in request.GET
+                    and is_cursor_requested(request.GET))
+
+    def paginate_by_fetch_page(self, fetch_page, request):
+        """
+        Paginate a query through its own cursors, `fetch_page(limit, cursor)` returns the elements of the page
+        and the cursor of the next one, or None in the last page, and it raises ValueError if the cursor is not
+        valid.
+        """
+
+        self.use_envelope = str(request.GET.get('envelope')).lower() not in ['false', '0']
+        self.paginated_by_cursor = True
+        self.limit = self.get_limit(request) or self.default_limit or 100
+
+        self.request = request
+        self.count = None
+        self.count_estimated = False
+
+        try:
+            items, self.next_cursor = fetch_page(self.limit, request.GET.get(CURSOR_QUERY_PARAM) or None)
+
+        except ValueError:
+            raise ValidationException('Invalid cursor', code=400, slug='invalid-cursor')
+
+        return items
+
     def __parse_comma__(self, string: str):
         if not string:
             return None
@@ -27,6 +125,9 @@ class HeaderLimitOffsetPagination(LimitOffsetPagination):
         if count:
             self.count = count
 
+        if self.paginated_by_cursor:
+            return self.get_paginated_response_by_cursor(data, cache, cache_kwargs)
+
         next_url = self.__parse_comma__(self.get_next_link())
         previous_url = self.__parse_comma__(self.get_previous_link())
         first_url = self.__parse_comma__(self.get_first_link())
@@ -43,7 +144,7 @@ class HeaderLimitOffsetPagination(LimitOffsetPagination):
                 links.append('<{}>; rel="{}"'.format(url, label))
 
         headers = {'Link': ', '.join(links)} if links else {}
-        headers['x-total-count'] = self.count
+        self.set_count_headers(headers)
 
         if self.use_envelope:
             data = OrderedDict([('count', self.count), ('first', first_url), ('next', next_url),
@@ -54,6 +155,61 @@ class HeaderLimitOffsetPagination(LimitOffsetPagination):
 
         return Response(data, headers=headers)
 
+    def get_paginated_response_by_cursor(self, data, cache=None, cache_kwargs={}):
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+
+        # the empty cursor keeps the first page in the cursor pagination
+        first_url = None
+        if self.request.GET.get(CURSOR_QUERY_PARAM):
+            first_url = self.__parse_comma__(replace_query_param(url, CURSOR_QUERY_PARAM, ''))
+
+        next_url = None
+        if self.next_cursor:
+            next_url = self.__parse_comma__(replace_query_param(url, CURSOR_QUERY_PARAM, self.next_cursor))
+
+        links = []
+        for label, url in (
+            ('first', first_url),
+            ('next', next_url),
+        ):
+            if url is not None:
+                links.append('<{}>; rel="{}"'.format(url, label))
+
+        headers = {'Link': ', '.join(links)} if links else {}
+        self.set_count_headers(headers)
+
+        if self.use_envelope:
+            data = OrderedDict([('count', self.count), ('first', first_url), ('next', next_url),
+                                ('previous', None), ('last', None), ('results', data)])
+
+        if cache:
+            cache.set(data, **cache_kwargs)
+
+        return Response(data, headers=headers)
+
+    def set_count_headers(self, headers: dict) -> None:
+        if self.count is None:
+            return
+
+        headers['x-total-count'] = self.count
+
+        if self.count_estimated:
+            headers['x-total-count-estimated'] = 'true'
+
+    def get_next_link(self):
+        if self.has_next_page is False:
+            return None
+
+        if self.has_next_page is None and self.offset + self.limit >= self.count:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+
+        offset = self.offset + self.limit
+        return replace_query_param(url, self.offset_query_param, offset)
+
     def get_first_link(self):
         if self.offset <= 0:
             return None
@@ -62,7 +218,8 @@ class HeaderLimitOffsetPagination(LimitOffsetPagination):
         return remove_query_param(url, self.offset_query_param)
 
     def get_last_link(self):
-        if self.offset + self.limit >= self.count:
+        # an estimated count could point to an empty page
+        if self.count is None or self.count_estimated or self.offset + self.limit >= self.count:
             return None
 
         url = self.request.build_absolute_uri()
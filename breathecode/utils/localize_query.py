@@ -13,6 +13,7 @@ def localize_query(query, request, matcher=None):
     if isinstance(request.user, AnonymousUser):
         return None
 
+    # it's not evaluated, the academies are filtered with a subquery in the same round trip
     academy_ids = ProfileAcademy.objects.filter(user=request.user).values_list('academy__id', flat=True)
 
     kwargs = {}
@@ -21,7 +22,7 @@ def localize_query(query, request, matcher=None):
     else:
         kwargs[matcher] = academy_ids
 
-    logger.debug(f"Localizing academies: [{','.join([ str(i) for i in academy_ids])}]")
+    logger.debug('Localizing the academies of the user %s', request.user.id)
     # only cohorts from that academy
     query = query.filter(**kwargs)
 
@@ -1,30 +1,65 @@
-from breathecode.services.google_cloud.credentials import resolve_credentials
+from typing import Optional
+from breathecode.services.google_cloud.clients import get_ndb_client
 
 __all__ = ['NDB']
 
 
+def _get_equality_filters(query) -> Optional[dict]:
+    from google.cloud.ndb.query import FilterNode
+
+    filters = {}
+    for node in query:
+        if not isinstance(node, FilterNode) or node._opsymbol != '=':
+            return None
+
+        filters[node._name] = node._value
+
+    return filters
+
+
 class NDB:
 
     def __init__(self, Model):
-        from google.cloud import ndb
-        resolve_credentials()
-        self.client = ndb.Client()
+        self.client = get_ndb_client()
         self.Model = Model
 
     def fetch(self, query, **kwargs):
-        from google.cloud import ndb
-        client = ndb.Client()
-
-        with client.context():
+        with self.client.context():
             query = self.Model.query().filter(*query)
 
             elements = query.fetch(**kwargs)
             return [c.to_dict() for c in elements]
 
+    def fetch_page(self, query, limit, cursor: Optional[str] = None):
+        """
+        Get a page of a query that starts in `cursor`, it returns the elements and the cursor of the next page.
+
+        It raises ValueError if the cursor is not valid.
+        """
+
+        from google.cloud.ndb import Cursor
+
+        with self.client.context():
+            try:
+                start_cursor = Cursor(urlsafe=cursor) if cursor else None
+
+            except ValueError:
+                raise ValueError('Invalid cursor')
+
+            query = self.Model.query().filter(*query)
+            elements, next_cursor, more = query.fetch_page(limit, start_cursor=start_cursor)
+
+            next_cursor = next_cursor.urlsafe().decode('utf-8') if more and next_cursor else None
+            return [c.to_dict() for c in elements], next_cursor
+
     def count(self, query):
-        from google.cloud import ndb
-        client = ndb.Client()
+        from breathecode.services.google_cloud import Datastore
+
+        # the equality filters are counted with an aggregation that is cached
+        filters = _get_equality_filters(query)
+        if filters is not None:
+            return Datastore().count(kind=self.Model._get_kind(), **filters)
 
-        with client.context():
+        with self.client.context():
             query = self.Model.query().filter(*query)
             return query.count()
@@ -0,0 +1,84 @@
+"""
+Measures of the request being handled, they are collected by `breathecode.monitoring.middleware`.
+"""
+
+import contextvars, time
+from contextlib import contextmanager
+from typing import Optional
+
+__all__ = [
+    'RequestProfile', 'get_request_profile', 'start_request_profile', 'stop_request_profile', 'track_query',
+    'track_cache', 'measure_serialization'
+]
+
+
+class RequestProfile:
+    """
+    Counters of one request, the times are in seconds.
+
+    `serialization_time` is the time spent rendering the response.
+    """
+
+    queries: int
+    db_time: float
+    cache_hits: int
+    cache_misses: int
+    serialization_time: float
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.serialization_time = 0.0
+
+
+_profile: contextvars.ContextVar[Optional[RequestProfile]] = contextvars.ContextVar('request_profile',
+                                                                                    default=None)
+
+
+def get_request_profile() -> Optional[RequestProfile]:
+    """Get the profile of the current request, it's None if it's not being profiled."""
+
+    return _profile.get()
+
+
+def start_request_profile(profile: RequestProfile) -> contextvars.Token:
+    return _profile.set(profile)
+
+
+def stop_request_profile(token: contextvars.Token) -> None:
+    _profile.reset(token)
+
+
+def track_query(duration: float) -> None:
+    if (profile := _profile.get()) is None:
+        return
+
+    profile.queries += 1
+    profile.db_time += duration
+
+
+def track_cache(counter: str, delta: int = 1) -> None:
+    if (profile := _profile.get()) is None:
+        return
+
+    if counter == 'hits':
+        profile.cache_hits += delta
+
+    elif counter == 'misses':
+        profile.cache_misses += delta
+
+
+@contextmanager
+def measure_serialization():
+    """Add the time spent inside the block to the serialization time of the current request."""
+
+    started = time.perf_counter()
+
+    try:
+        yield
+
+    finally:
+        if (profile := _profile.get()) is not None:
+            profile.serialization_time += time.perf_counter() - started
@@ -1 +1,2 @@
 from .serpy_extensions import *
+from .query_planner import *
@@ -1 +1,2 @@
 from .datetime_integer_field import *
+from .method_field import *
@@ -0,0 +1,19 @@
+import serpy
+
+__all__ = ['MethodField']
+
+
+class MethodField(serpy.MethodField):
+    """A MethodField that declares the relations read by its method, they are loaded by `plan_queryset`."""
+
+    select_related: list[str]
+    prefetch_related: list[str]
+
+    def __init__(self,
+                 method=None,
+                 select_related: list[str] = [],
+                 prefetch_related: list[str] = [],
+                 **kwargs):
+        super().__init__(method=method, **kwargs)
+        self.select_related = select_related
+        self.prefetch_related = prefetch_related
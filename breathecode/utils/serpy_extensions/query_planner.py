@@ -0,0 +1,102 @@
+"""
+Load the relations read by a serpy serializer along with the queryset, instead of one query per row.
+"""
+
+import serpy
+from django.db.models import Model, QuerySet
+
+__all__ = ['get_related_lookups', 'plan_queryset']
+
+
+def _get_relation_path(field: serpy.Serializer, name: str) -> str:
+    attr = field.attr or name
+
+    # like `Serializer(attr='cohorttimeslot_set.all', call=True, many=True)`
+    if field.call and attr.endswith('.all'):
+        attr = attr[:-len('.all')]
+
+    return attr
+
+
+def _get_relation(model: type[Model], attr: str):
+    for field in model._meta.get_fields():
+        if not field.is_relation or field.related_model is None:
+            continue
+
+        # the reverse relations are read through its accessor, like `cohorttimeslot_set`
+        name = field.get_accessor_name() if field.auto_created and not field.concrete else field.name
+        if name == attr:
+            return field
+
+    return None
+
+
+def _walk(serializer: type[serpy.Serializer], model: type[Model], prefix: str, prefetch: bool,
+          lookups: tuple[list[str], list[str]]) -> None:
+    select_related, prefetch_related = lookups
+
+    for name, field in serializer._field_map.items():
+        # the relations declared by a method
+        select_related_of_method = [prefix + x for x in getattr(field, 'select_related', [])]
+        prefetch_related_of_method = [prefix + x for x in getattr(field, 'prefetch_related', [])]
+
+        if prefetch:
+            prefetch_related += select_related_of_method + prefetch_related_of_method
+
+        else:
+            select_related += select_related_of_method
+            prefetch_related += prefetch_related_of_method
+
+        if not isinstance(field, serpy.Serializer):
+            continue
+
+        path = _get_relation_path(field, name)
+        if '.' in path:
+            continue
+
+        # it's not a relation, like a property or a method
+        model_field = _get_relation(model, path)
+        if model_field is None:
+            continue
+
+        lookup = prefix + path
+        is_single = model_field.many_to_one or model_field.one_to_one
+
+        # after a prefetch the relations must be prefetched too
+        if is_single and not prefetch and not field.many:
+            select_related.append(lookup)
+            _walk(type(field), model_field.related_model, lookup + '__', False, lookups)
+
+        else:
+            prefetch_related.append(lookup)
+            _walk(type(field), model_field.related_model, lookup + '__', True, lookups)
+
+
+def get_related_lookups(serializer: type[serpy.Serializer],
+                        model: type[Model]) -> tuple[list[str], list[str]]:
+    """
+    Get the lookups for `select_related` and `prefetch_related` that a serializer needs.
+
+    The nested serializers of a foreign key or a one to one relation are joined, the ones of a many relation
+    are prefetched, the methods declare their relations with `SerpyExtensions.MethodField`.
+    """
+
+    lookups = ([], [])
+    _walk(serializer, model, '', False, lookups)
+
+    select_related, prefetch_related = lookups
+    return list(dict.fromkeys(select_related)), list(dict.fromkeys(prefetch_related))
+
+
+def plan_queryset(queryset: QuerySet, serializer: type[serpy.Serializer]) -> QuerySet:
+    """Load the relations read by a serializer in the same query or in one query per relation."""
+
+    select_related, prefetch_related = get_related_lookups(serializer, queryset.model)
+
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+
+    return queryset
@@ -1,4 +1,4 @@
-from .extensions import DatetimeIntegerField
+from .extensions import DatetimeIntegerField, MethodField
 
 __all__ = ['SerpyExtensions']
 
@@ -8,3 +8,7 @@ class SerpyExtensions():
     @staticmethod
     def DatetimeIntegerField(*args, **kwargs):
         return DatetimeIntegerField(*args, **kwargs)
+
+    @staticmethod
+    def MethodField(*args, **kwargs):
+        return MethodField(*args, **kwargs)
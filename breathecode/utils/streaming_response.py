@@ -0,0 +1,264 @@
+"""
+Responses that serialize a queryset while it's being sent, the rows are never loaded all together.
+"""
+
+import csv
+from typing import AsyncIterator, Iterator, Optional
+import serpy
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.conf import settings
+from django.db.models import QuerySet, prefetch_related_objects
+from django.core.handlers.asgi import ASGIHandler as BaseASGIHandler, ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework_csv.misc import Echo
+from rest_framework_csv.renderers import CSVRenderer
+from .serpy_extensions.query_planner import get_related_lookups
+
+__all__ = [
+    'STREAMING_CHUNK_SIZE', 'ASYNC_STREAMING_SCOPE_KEY', 'StreamingJSONRenderer', 'StreamingCSVRenderer',
+    'AsyncStreamingHttpResponse', 'ASGIHandler', 'get_csv_header', 'streaming_response'
+]
+
+# rows fetched from the database and serialized together
+STREAMING_CHUNK_SIZE = 2000
+
+# set in the scope by `ASGIHandler`, the server is able to send an `AsyncStreamingHttpResponse`
+ASYNC_STREAMING_SCOPE_KEY = 'breathecode.async_streaming'
+
+
+class StreamingJSONRenderer(JSONRenderer):
+    """Render a JSON array chunk by chunk."""
+
+    def stream(self, chunks: Iterator[list[dict]]) -> Iterator[bytes]:
+        yield b'['
+
+        first = True
+        for chunk in chunks:
+            if not chunk:
+                continue
+
+            content = b','.join(self.render(row) for row in chunk)
+            yield content if first else b',' + content
+            first = False
+
+        yield b']'
+
+
+class StreamingCSVRenderer(CSVRenderer):
+    """
+    Render a CSV chunk by chunk.
+
+    `CSVRenderer` reads every row to build the header, here it should be provided in the renderer context,
+    otherwise it's built with the columns of the first chunk.
+    """
+
+    def stream(self, chunks: Iterator[list[dict]], renderer_context: dict = {}) -> Iterator[bytes]:
+        writer_opts = renderer_context.get('writer_opts', self.writer_opts or {})
+        header = renderer_context.get('header', self.header)
+        labels = renderer_context.get('labels', self.labels)
+        encoding = renderer_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        writer = csv.writer(Echo(), **writer_opts)
+
+        def write_header(header):
+            row = [labels.get(x, x) for x in header] if labels else header
+            return writer.writerow(row).encode(encoding)
+
+        if header:
+            yield write_header(header)
+
+        for chunk in chunks:
+            rows = list(self.flatten_data(chunk))
+            if not rows:
+                continue
+
+            if not header:
+                header = sorted({key for row in rows for key in row})
+                yield write_header(header)
+
+            yield ''.join(writer.writerow([row.get(key, None) for key in header])
+                          for row in rows).encode(encoding)
+
+
+class AsyncStreamingHttpResponse(StreamingHttpResponse):
+    """
+    A streaming response over an async iterator.
+
+    Django 3.2 iterates the streaming responses inside the event loop, this one is sent with `async for` by
+    `ASGIHandler`.
+    """
+
+    is_async = True
+
+    @property
+    def streaming_content(self) -> AsyncIterator[bytes]:
+        return self._aiter_bytes()
+
+    @streaming_content.setter
+    def streaming_content(self, value: AsyncIterator[bytes]):
+        self._set_streaming_content(value)
+
+    def _set_streaming_content(self, value: AsyncIterator[bytes]):
+        self._iterator = value.__aiter__()
+
+    async def _aiter_bytes(self) -> AsyncIterator[bytes]:
+        async for part in self._iterator:
+            yield self.make_bytes(part)
+
+    def __iter__(self):
+        raise TypeError('AsyncStreamingHttpResponse must be read with `async for`')
+
+    def getvalue(self):
+        raise TypeError('AsyncStreamingHttpResponse must be read with `async for`')
+
+
+class ASGIHandler(BaseASGIHandler):
+    """
+    Django's ASGI handler able to send an `AsyncStreamingHttpResponse`.
+
+    Django 3.2 runs the sync code of every request in one shared thread, with one shared database connection
+    that the other requests close when they start or finish. Here each request runs in its own thread, the
+    cursor of a response keeps its connection until the response is sent.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http':
+            scope = {**scope, ASYNC_STREAMING_SCOPE_KEY: True}
+
+        async with ThreadSensitiveContext():
+            await super().__call__(scope, receive, send)
+
+    async def send_response(self, response, send):
+        if not getattr(response, 'is_async', False):
+            return await super().send_response(response, send)
+
+        headers = []
+        for header, value in response.items():
+            if isinstance(header, str):
+                header = header.encode('ascii')
+            if isinstance(value, str):
+                value = value.encode('latin1')
+            headers.append((bytes(header), bytes(value)))
+
+        for cookie in response.cookies.values():
+            headers.append((b'Set-Cookie', cookie.output(header='').encode('ascii').strip()))
+
+        await send({
+            'type': 'http.response.start',
+            'status': response.status_code,
+            'headers': headers,
+        })
+
+        async for part in response.streaming_content:
+            for chunk, _ in self.chunk_bytes(part):
+                await send({
+                    'type': 'http.response.body',
+                    'body': chunk,
+                    'more_body': True,
+                })
+
+        await send({'type': 'http.response.body'})
+        await sync_to_async(response.close, thread_sensitive=True)()
+
+
+def get_csv_header(serializer: type[serpy.Serializer],
+                   nested: dict[str, type[serpy.Serializer]] = {}) -> list[str]:
+    """
+    Get the columns of the CSV of a serializer, sorted like the ones of `CSVRenderer`.
+
+    The nested serializers are flattened like the rows, `nested` has the serializers of the method fields
+    that return a serialized object.
+    """
+
+    header = []
+    for name, field in serializer._field_map.items():
+        name = field.label or name
+
+        child = field if isinstance(field, serpy.Serializer) and not field.many else nested.get(name)
+        if child is None:
+            header.append(name)
+
+        else:
+            header += [f'{name}.{x}' for x in get_csv_header(child)]
+
+    return sorted(header)
+
+
+def _serialize_chunk(objs: list, serializer: type[serpy.Serializer],
+                     prefetch_related: list[str]) -> list[dict]:
+    # `.iterator()` ignores `prefetch_related`, the relations are prefetched for each chunk
+    if prefetch_related:
+        prefetch_related_objects(objs, *prefetch_related)
+
+    return serializer(objs, many=True).data
+
+
+def _get_chunks(queryset: QuerySet, serializer: type[serpy.Serializer],
+                chunk_size: int) -> Iterator[list[dict]]:
+    select_related, prefetch_related = get_related_lookups(serializer, queryset.model)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+
+    objs = []
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        objs.append(obj)
+
+        if len(objs) == chunk_size:
+            yield _serialize_chunk(objs, serializer, prefetch_related)
+            objs = []
+
+    if objs:
+        yield _serialize_chunk(objs, serializer, prefetch_related)
+
+
+async def _aiter_content(content: Iterator[bytes]) -> AsyncIterator[bytes]:
+    # each chunk is fetched and rendered in the thread of the request, outside of the event loop
+    next_part = sync_to_async(next, thread_sensitive=True)
+
+    try:
+        while (part := await next_part(content, None)) is not None:
+            yield part
+
+    finally:
+        await sync_to_async(content.close, thread_sensitive=True)()
+
+
+def streaming_response(request,
+                       queryset: QuerySet,
+                       serializer: type[serpy.Serializer],
+                       chunk_size: int = STREAMING_CHUNK_SIZE,
+                       csv_header: Optional[list[str]] = None) -> StreamingHttpResponse | HttpResponse:
+    """
+    Send a queryset serialized with a serpy serializer, as JSON or as CSV if it was the accepted format.
+
+    The rows are fetched with `.iterator(chunk_size=chunk_size)` and the chunks are rendered while the
+    response is being sent, the memory used does not depend on the number of rows. The columns of the CSV
+    are the fields declared in the serializer if `csv_header` is not provided.
+
+    Under ASGI it's an `AsyncStreamingHttpResponse` that fetches each chunk with `sync_to_async`, Django 3.2
+    iterates the streaming responses inside the event loop where the queries raise
+    `SynchronousOnlyOperation`. It can only be sent by `ASGIHandler`, the ASGI requests of other handlers,
+    like the `AsyncClient` of the tests, get the content rendered before returning.
+    """
+
+    chunks = _get_chunks(queryset, serializer, chunk_size)
+    renderer = getattr(request, 'accepted_renderer', None)
+
+    if renderer is not None and renderer.format == 'csv':
+        renderer_context = {'header': csv_header or get_csv_header(serializer)}
+        content = StreamingCSVRenderer().stream(chunks, renderer_context)
+        content_type = f'text/csv; charset={settings.DEFAULT_CHARSET}'
+
+    else:
+        content = StreamingJSONRenderer().stream(chunks)
+        content_type = 'application/json'
+
+    request = getattr(request, '_request', request)
+    if isinstance(request, ASGIRequest):
+        if request.scope.get(ASYNC_STREAMING_SCOPE_KEY):
+            return AsyncStreamingHttpResponse(_aiter_content(content), content_type=content_type)
+
+        return HttpResponse(b''.join(content), content_type=content_type)
+
+    return StreamingHttpResponse(content, content_type=content_type)
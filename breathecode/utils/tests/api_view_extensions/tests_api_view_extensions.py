@@ -1,4 +1,7 @@
 import json
+import time
+import urllib.parse
+import hashlib
 import serpy
 from unittest.mock import MagicMock, call, patch
 from rest_framework.views import APIView
@@ -6,16 +9,48 @@ from rest_framework.response import Response
 from rest_framework.test import APIRequestFactory, force_authenticate
 from breathecode.admissions.caches import CohortCache
 from breathecode.admissions.models import Cohort
-from breathecode.utils import APIViewExtensions, ValidationException
+from breathecode.utils import APIViewExtensions, ValidationException, encode_cursor
 from rest_framework.permissions import AllowAny
 from rest_framework import status
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from ..mixins import UtilsTestCase
 from breathecode.utils.api_view_extensions.api_view_extension_handlers import APIViewExtensionHandlers
 
 cohort_cache = CohortCache()
 
 
+def params(credentials):
+    return dict(urllib.parse.parse_qsl(credentials))
+
+
+def cache_key(credentials=''):
+    return cohort_cache.__generate_key__(**params(credentials))
+
+
+def stale_key(credentials=''):
+    return cohort_cache.__generate_unversioned_key__('stale', **params(credentials))
+
+
+def lock_key(credentials=''):
+    return cohort_cache.__generate_unversioned_key__('lock', **params(credentials))
+
+
+def serialize(data, created_at=None):
+    content = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    return {
+        'etag': hashlib.blake2b(content, digest_size=16).hexdigest(),
+        'headers': {},
+        'content': cohort_cache.codec.compress(content),
+        'created_at': time.time() if created_at is None else created_at,
+    }
+
+
+def decode(value):
+    return json.loads(cohort_cache.codec.decompress(value['content']))
+
+
 class GetCohortSerializer(serpy.Serializer):
     id = serpy.Field()
     slug = serpy.Field()
@@ -42,11 +77,6 @@ class GetCohortSerializer(serpy.Serializer):
         return obj.academy.id if obj.academy else None
 
 
-def serialize_cache_value(data):
-    return str(data).replace('\'', '"').replace('None', 'null').replace('True',
-                                                                        'true').replace('False', 'false')
-
-
 class TestView(APIView):
     permission_classes = [AllowAny]
     extensions = APIViewExtensions(cache=CohortCache, sort='name', paginate=True)
@@ -56,7 +86,7 @@ class TestView(APIView):
 
         cache = handler.cache.get()
         if cache is not None:
-            return Response(cache, status=status.HTTP_200_OK)
+            return cache
 
         if id:
             item = Cohort.objects.filter(id=id).first()
@@ -96,6 +126,88 @@ class CachePrefixTestView(TestView):
                                    paginate=False)
 
 
+class StaleWhileRevalidateTestView(TestView):
+    extensions = APIViewExtensions(cache=CohortCache, cache_soft_ttl=60, sort='name', paginate=False)
+
+
+class StaleWhileRevalidateNotFoundTestView(APIView):
+    permission_classes = [AllowAny]
+    extensions = APIViewExtensions(cache=CohortCache, cache_soft_ttl=60, sort='name', paginate=False)
+
+    def get(self, request):
+        handler = self.extensions(request)
+
+        cache = handler.cache.get()
+        if cache is not None:
+            return cache
+
+        return Response({'detail': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
+
+
+class CursorTestView(TestView):
+    extensions = APIViewExtensions(cache=CohortCache, sort='name', paginate='cursor')
+
+
+class CacheIgnoreTestView(TestView):
+    extensions = APIViewExtensions(cache=CohortCache,
+                                   cache_ignore=['utm_source'],
+                                   sort='name',
+                                   paginate=False)
+
+
+class AcademySerializer(serpy.Serializer):
+    id = serpy.Field()
+    slug = serpy.Field()
+    name = serpy.Field()
+
+
+class CohortFieldsSerializer(serpy.Serializer):
+    id = serpy.Field()
+    slug = serpy.Field()
+    name = serpy.Field()
+    academy = AcademySerializer()
+    upper_name = serpy.MethodField()
+
+    def get_upper_name(self, obj):
+        return obj.name.upper()
+
+
+class FieldsTestView(APIView):
+    permission_classes = [AllowAny]
+    extensions = APIViewExtensions(cache=CohortCache,
+                                   sort='name',
+                                   paginate=False,
+                                   serializer=CohortFieldsSerializer)
+
+    def get(self, request):
+        handler = self.extensions(request)
+
+        cache = handler.cache.get()
+        if cache is not None:
+            return cache
+
+        items = handler.queryset(Cohort.objects.all())
+        serializer = handler.fields.serializer(items, many=True)
+
+        return handler.response(serializer.data)
+
+
+class CohortBigFieldsSerializer(CohortFieldsSerializer):
+    stage = serpy.Field()
+
+
+class BigFieldsTestView(FieldsTestView):
+
+    def get(self, request):
+        handler = self.extensions(request)
+        handler.fields.use(CohortBigFieldsSerializer)
+
+        items = handler.queryset(Cohort.objects.all())
+        serializer = handler.fields.serializer(items, many=True)
+
+        return handler.response(serializer.data)
+
+
 class ApiViewExtensionsGetTestSuite(UtilsTestCase):
     """
     🔽🔽🔽 Spy the extensions
@@ -201,8 +313,7 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
         self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        self.assertEqual(cohort_cache.keys(), ['Cohort__'])
+        self.assertEqual(decode(cache.get(cache_key())), expected)
 
     def test_cache__get__without_cache__one_cohort(self):
         cache.clear()
@@ -219,8 +330,7 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
         self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        self.assertEqual(cohort_cache.keys(), ['Cohort__'])
+        self.assertEqual(decode(cache.get(cache_key())), expected)
 
     def test_cache__get__without_cache__ten_cohorts(self):
         cache.clear()
@@ -237,8 +347,7 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
         self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        self.assertEqual(cohort_cache.keys(), ['Cohort__'])
+        self.assertEqual(decode(cache.get(cache_key())), expected)
 
     def test_cache__get__without_cache__ten_cohorts__passing_arguments(self):
         cache.clear()
@@ -257,17 +366,15 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
         self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        self.assertEqual(cohort_cache.keys(), ['Cohort__sort=slug&slug=100%2C101%2C110%2C111'])
+        self.assertEqual(decode(cache.get(cache_key('sort=slug&slug=100%2C101%2C110%2C111'))), expected)
 
     def test_cache__get__with_cache(self):
         cache.clear()
 
         cases = [[], [{'x': 1}], [{'x': 1}, {'x': 2}]]
         for expected in cases:
-            json_data = json.dumps(expected)
-            cache.set('Cohort__keys', '["Cohort__"]')
-            cache.set('Cohort__', json_data)
+            json_data = serialize(expected)
+            cache.set(cache_key(), json_data)
 
             request = APIRequestFactory()
             request = request.get('/the-beans-should-not-have-sugar')
@@ -277,7 +384,6 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(), ['Cohort__'])
 
     def test_cache__get__with_cache__passing_arguments(self):
         cache.clear()
@@ -285,9 +391,8 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
         cases = [[], [{'x': 1}], [{'x': 1}, {'x': 2}]]
         params = [bin(x).replace('0b', '') for x in range(4, 8)]
         for expected in cases:
-            json_data = json.dumps(expected)
-            cache.set('Cohort__keys', '["Cohort__sort=slug&slug=100%2C101%2C110%2C111"]')
-            cache.set('Cohort__sort=slug&slug=100%2C101%2C110%2C111', json_data)
+            json_data = serialize(expected)
+            cache.set(cache_key('sort=slug&slug=100%2C101%2C110%2C111'), json_data)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar?sort=slug&slug={",".join(params)}')
@@ -297,9 +402,7 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(), ['Cohort__sort=slug&slug=100%2C101%2C110%2C111'])
-            self.assertEqual(cache.get('Cohort__sort=slug&slug=100%2C101%2C110%2C111'),
-                             str(expected).replace('\'', '"'))
+            self.assertEqual(decode(cache.get(cache_key('sort=slug&slug=100%2C101%2C110%2C111'))), expected)
 
     def test_cache__get__with_cache_but_other_case__passing_arguments(self):
         cache.clear()
@@ -310,9 +413,8 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
             slug = self.bc.fake.slug()
             model = self.bc.database.create(cohort={'slug': slug})
 
-            json_data = json.dumps(case)
-            cache.set('Cohort__', json_data)
-            cache.set('Cohort__keys', '["Cohort__"]')
+            json_data = serialize(case)
+            cache.set(cache_key(), json_data)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar?sort=slug&slug={slug}')
@@ -323,9 +425,8 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(), ['Cohort__', f'Cohort__sort=slug&slug={slug}'])
-            self.assertEqual(cache.get('Cohort__'), serialize_cache_value(case))
-            self.assertEqual(cache.get(f'Cohort__sort=slug&slug={slug}'), serialize_cache_value(expected))
+            self.assertEqual(decode(cache.get(cache_key())), case)
+            self.assertEqual(decode(cache.get(cache_key(f'sort=slug&slug={slug}'))), expected)
 
     def test_cache__get__with_cache_case_of_root_and_current__passing_arguments(self):
         cache.clear()
@@ -337,11 +438,10 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
             self.bc.database.delete('admissions.Cohort')
             model = self.bc.database.create(cohort={'slug': slug})
 
-            json_data_root = json.dumps(case)
-            json_data_query = json.dumps(case + case)
-            cache.set('Cohort__', json_data_root)
-            cache.set(f'Cohort__sort=slug&slug={slug}', json_data_query)
-            cache.set('Cohort__keys', f'["Cohort__", "Cohort__sort=slug&slug={slug}"]')
+            json_data_root = serialize(case)
+            json_data_query = serialize(case + case)
+            cache.set(cache_key(), json_data_root)
+            cache.set(cache_key(f'sort=slug&slug={slug}'), json_data_query)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar?sort=slug&slug={slug}')
@@ -352,9 +452,8 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(), ['Cohort__', f'Cohort__sort=slug&slug={slug}'])
-            self.assertEqual(cache.get('Cohort__'), json_data_root)
-            self.assertEqual(cache.get(f'Cohort__sort=slug&slug={slug}'), json_data_query)
+            self.assertEqual(cache.get(cache_key()), json_data_root)
+            self.assertEqual(cache.get(cache_key(f'sort=slug&slug={slug}')), json_data_query)
 
     """
     🔽🔽🔽 Cache per user without auth
@@ -366,9 +465,8 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
         cases = [[], [{'x': 1}], [{'x': 1}, {'x': 2}]]
         params = [bin(x).replace('0b', '') for x in range(4, 8)]
         for expected in cases:
-            json_data = json.dumps(expected)
-            cache.set('Cohort__keys', '["Cohort__sort=slug&slug=100%2C101%2C110%2C111&request.user.id=None"]')
-            cache.set('Cohort__sort=slug&slug=100%2C101%2C110%2C111&request.user.id=None', json_data)
+            json_data = serialize(expected)
+            cache.set(cache_key('sort=slug&slug=100%2C101%2C110%2C111&request.user.id=None'), json_data)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar?sort=slug&slug={",".join(params)}')
@@ -378,10 +476,9 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(),
-                             ['Cohort__sort=slug&slug=100%2C101%2C110%2C111&request.user.id=None'])
-            self.assertEqual(cache.get('Cohort__sort=slug&slug=100%2C101%2C110%2C111&request.user.id=None'),
-                             str(expected).replace('\'', '"'))
+            self.assertEqual(
+                decode(cache.get(cache_key('sort=slug&slug=100%2C101%2C110%2C111&request.user.id=None'))),
+                expected)
 
     def test_cache_per_user__get__with_cache_but_other_case__passing_arguments(self):
         cache.clear()
@@ -392,9 +489,8 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
             slug = self.bc.fake.slug()
             model = self.bc.database.create(cohort={'slug': slug})
 
-            json_data = json.dumps(case)
-            cache.set('Cohort__', json_data)
-            cache.set('Cohort__keys', '["Cohort__"]')
+            json_data = serialize(case)
+            cache.set(cache_key(), json_data)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar?sort=slug&slug={slug}')
@@ -405,11 +501,9 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(),
-                             ['Cohort__', f'Cohort__sort=slug&slug={slug}&request.user.id=None'])
-            self.assertEqual(cache.get('Cohort__'), serialize_cache_value(case))
-            self.assertEqual(cache.get(f'Cohort__sort=slug&slug={slug}&request.user.id=None'),
-                             serialize_cache_value(expected))
+            self.assertEqual(decode(cache.get(cache_key())), case)
+            self.assertEqual(decode(cache.get(cache_key(f'sort=slug&slug={slug}&request.user.id=None'))),
+                             expected)
 
     def test_cache_per_user__get__with_cache_case_of_root_and_current__passing_arguments(self):
         cache.clear()
@@ -421,11 +515,10 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
             self.bc.database.delete('admissions.Cohort')
             model = self.bc.database.create(cohort={'slug': slug})
 
-            json_data_root = json.dumps(case)
-            json_data_query = json.dumps(case + case)
-            cache.set('Cohort__', json_data_root)
-            cache.set(f'Cohort__sort=slug&slug={slug}&request.user.id=None', json_data_query)
-            cache.set('Cohort__keys', f'["Cohort__", "Cohort__sort=slug&slug={slug}&request.user.id=None"]')
+            json_data_root = serialize(case)
+            json_data_query = serialize(case + case)
+            cache.set(cache_key(), json_data_root)
+            cache.set(cache_key(f'sort=slug&slug={slug}&request.user.id=None'), json_data_query)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar?sort=slug&slug={slug}')
@@ -436,10 +529,8 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(),
-                             ['Cohort__', f'Cohort__sort=slug&slug={slug}&request.user.id=None'])
-            self.assertEqual(cache.get('Cohort__'), json_data_root)
-            self.assertEqual(cache.get(f'Cohort__sort=slug&slug={slug}&request.user.id=None'),
+            self.assertEqual(cache.get(cache_key()), json_data_root)
+            self.assertEqual(cache.get(cache_key(f'sort=slug&slug={slug}&request.user.id=None')),
                              json_data_query)
 
     """
@@ -453,10 +544,8 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
         params = [bin(x).replace('0b', '') for x in range(4, 8)]
         for expected in cases:
             model = self.bc.database.create(user=1)
-            json_data = json.dumps(expected)
-            cache.set('Cohort__keys',
-                      f'["Cohort__sort=slug&slug=100%2C101%2C110%2C111&request.user.id={model.user.id}"]')
-            cache.set(f'Cohort__sort=slug&slug=100%2C101%2C110%2C111&request.user.id={model.user.id}',
+            json_data = serialize(expected)
+            cache.set(cache_key(f'sort=slug&slug=100%2C101%2C110%2C111&request.user.id={model.user.id}'),
                       json_data)
 
             request = APIRequestFactory()
@@ -469,11 +558,10 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
             self.assertEqual(
-                cohort_cache.keys(),
-                [f'Cohort__sort=slug&slug=100%2C101%2C110%2C111&request.user.id={model.user.id}'])
-            self.assertEqual(
-                cache.get(f'Cohort__sort=slug&slug=100%2C101%2C110%2C111&request.user.id={model.user.id}'),
-                str(expected).replace('\'', '"'))
+                decode(
+                    cache.get(
+                        cache_key(f'sort=slug&slug=100%2C101%2C110%2C111&request.user.id={model.user.id}'))),
+                expected)
 
     def test_cache_per_user__get__auth__with_cache_but_other_case__passing_arguments(self):
         cache.clear()
@@ -484,9 +572,8 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
             slug = self.bc.fake.slug()
             model = self.bc.database.create(cohort={'slug': slug}, user=1)
 
-            json_data = json.dumps(case)
-            cache.set('Cohort__', json_data)
-            cache.set('Cohort__keys', '["Cohort__"]')
+            json_data = serialize(case)
+            cache.set(cache_key(), json_data)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar?sort=slug&slug={slug}')
@@ -498,11 +585,10 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(),
-                             ['Cohort__', f'Cohort__sort=slug&slug={slug}&request.user.id={model.user.id}'])
-            self.assertEqual(cache.get('Cohort__'), serialize_cache_value(case))
-            self.assertEqual(cache.get(f'Cohort__sort=slug&slug={slug}&request.user.id={model.user.id}'),
-                             serialize_cache_value(expected))
+            self.assertEqual(decode(cache.get(cache_key())), case)
+            self.assertEqual(
+                decode(cache.get(cache_key(f'sort=slug&slug={slug}&request.user.id={model.user.id}'))),
+                expected)
 
     def test_cache_per_user__get__auth__with_cache_case_of_root_and_current__passing_arguments(self):
         cache.clear()
@@ -514,12 +600,10 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
             self.bc.database.delete('admissions.Cohort')
             model = self.bc.database.create(cohort={'slug': slug}, user=1)
 
-            json_data_root = json.dumps(case)
-            json_data_query = json.dumps(case + case)
-            cache.set('Cohort__', json_data_root)
-            cache.set(f'Cohort__sort=slug&slug={slug}&request.user.id={model.user.id}', json_data_query)
-            cache.set('Cohort__keys',
-                      f'["Cohort__", "Cohort__sort=slug&slug={slug}&request.user.id={model.user.id}"]')
+            json_data_root = serialize(case)
+            json_data_query = serialize(case + case)
+            cache.set(cache_key(), json_data_root)
+            cache.set(cache_key(f'sort=slug&slug={slug}&request.user.id={model.user.id}'), json_data_query)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar?sort=slug&slug={slug}')
@@ -531,10 +615,8 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(),
-                             ['Cohort__', f'Cohort__sort=slug&slug={slug}&request.user.id={model.user.id}'])
-            self.assertEqual(cache.get('Cohort__'), json_data_root)
-            self.assertEqual(cache.get(f'Cohort__sort=slug&slug={slug}&request.user.id={model.user.id}'),
+            self.assertEqual(cache.get(cache_key()), json_data_root)
+            self.assertEqual(cache.get(cache_key(f'sort=slug&slug={slug}&request.user.id={model.user.id}')),
                              json_data_query)
 
     """
@@ -547,14 +629,11 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
         cases = [[], [{'x': 1}], [{'x': 1}, {'x': 2}]]
         params = [bin(x).replace('0b', '') for x in range(4, 8)]
         for expected in cases:
-            json_data = json.dumps(expected)
-            cache.set(
-                'Cohort__keys',
-                '["Cohort__sort=slug&slug=100%2C101%2C110%2C111&breathecode.view.get=the-beans-should-not-have-sugar"]'
-            )
+            json_data = serialize(expected)
             cache.set(
-                'Cohort__sort=slug&slug=100%2C101%2C110%2C111&breathecode.view.get=the-beans-should-not-have-sugar',
-                json_data)
+                cache_key(
+                    'sort=slug&slug=100%2C101%2C110%2C111&breathecode.view.get=the-beans-should-not-have-sugar'
+                ), json_data)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar?sort=slug&slug={",".join(params)}')
@@ -564,14 +643,12 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(), [
-                'Cohort__sort=slug&slug=100%2C101%2C110%2C111&breathecode.view.get=the-beans-should-not-have-sugar'
-            ])
             self.assertEqual(
-                cache.get(
-                    'Cohort__sort=slug&slug=100%2C101%2C110%2C111&breathecode.view.get=the-beans-should-not-have-sugar'
-                ),
-                str(expected).replace('\'', '"'))
+                decode(
+                    cache.get(
+                        cache_key(
+                            'sort=slug&slug=100%2C101%2C110%2C111&breathecode.view.get=the-beans-should-not-have-sugar'
+                        ))), expected)
 
     def test_cache_with_prefix__get__with_cache_but_other_case__passing_arguments(self):
         cache.clear()
@@ -582,9 +659,8 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
             slug = self.bc.fake.slug()
             model = self.bc.database.create(cohort={'slug': slug})
 
-            json_data = json.dumps(case)
-            cache.set('Cohort__', json_data)
-            cache.set('Cohort__keys', '["Cohort__"]')
+            json_data = serialize(case)
+            cache.set(cache_key(), json_data)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar?sort=slug&slug={slug}')
@@ -595,15 +671,13 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(), [
-                'Cohort__',
-                f'Cohort__sort=slug&slug={slug}&breathecode.view.get=the-beans-should-not-have-sugar'
-            ])
-            self.assertEqual(cache.get('Cohort__'), serialize_cache_value(case))
+            self.assertEqual(decode(cache.get(cache_key())), case)
             self.assertEqual(
-                cache.get(
-                    f'Cohort__sort=slug&slug={slug}&breathecode.view.get=the-beans-should-not-have-sugar'),
-                serialize_cache_value(expected))
+                decode(
+                    cache.get(
+                        cache_key(
+                            f'sort=slug&slug={slug}&breathecode.view.get=the-beans-should-not-have-sugar'))),
+                expected)
 
     def test_cache_with_prefix__get__with_cache_case_of_root_and_current__passing_arguments(self):
         cache.clear()
@@ -615,15 +689,12 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
             self.bc.database.delete('admissions.Cohort')
             model = self.bc.database.create(cohort={'slug': slug})
 
-            json_data_root = json.dumps(case)
-            json_data_query = json.dumps(case + case)
-            cache.set('Cohort__', json_data_root)
-            cache.set(f'Cohort__sort=slug&slug={slug}&breathecode.view.get=the-beans-should-not-have-sugar',
-                      json_data_query)
+            json_data_root = serialize(case)
+            json_data_query = serialize(case + case)
+            cache.set(cache_key(), json_data_root)
             cache.set(
-                'Cohort__keys',
-                f'["Cohort__", "Cohort__sort=slug&slug={slug}&breathecode.view.get=the-beans-should-not-have-sugar"]'
-            )
+                cache_key(f'sort=slug&slug={slug}&breathecode.view.get=the-beans-should-not-have-sugar'),
+                json_data_query)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar?sort=slug&slug={slug}')
@@ -634,16 +705,318 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(), [
-                'Cohort__',
-                f'Cohort__sort=slug&slug={slug}&breathecode.view.get=the-beans-should-not-have-sugar'
-            ])
-            self.assertEqual(cache.get('Cohort__'), json_data_root)
+            self.assertEqual(cache.get(cache_key()), json_data_root)
             self.assertEqual(
                 cache.get(
-                    f'Cohort__sort=slug&slug={slug}&breathecode.view.get=the-beans-should-not-have-sugar'),
+                    cache_key(f'sort=slug&slug={slug}&breathecode.view.get=the-beans-should-not-have-sugar')),
                 json_data_query)
 
+    """
+    🔽🔽🔽 ETag
+    """
+
+    def test_etag__get__without_cache(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=1)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar')
+
+        view = TestView.as_view()
+
+        response = view(request).render()
+        expected = GetCohortSerializer([model.cohort], many=True).data
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], f'"{cache.get(cache_key())["etag"]}"')
+
+    def test_etag__get__with_cache(self):
+        cache.clear()
+
+        cases = [[], [{'x': 1}], [{'x': 1}, {'x': 2}]]
+        for expected in cases:
+            json_data = serialize(expected)
+            cache.set(cache_key(), json_data)
+
+            request = APIRequestFactory()
+            request = request.get('/the-beans-should-not-have-sugar')
+
+            view = TestView.as_view()
+            response = view(request).render()
+
+            self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response['ETag'], f'"{json_data["etag"]}"')
+
+    def test_etag__get__with_cache__if_none_match(self):
+        cache.clear()
+
+        cases = [[], [{'x': 1}], [{'x': 1}, {'x': 2}]]
+        for expected in cases:
+            json_data = serialize(expected)
+            cache.set(cache_key(), json_data)
+
+            request = APIRequestFactory()
+            request = request.get('/the-beans-should-not-have-sugar',
+                                  HTTP_IF_NONE_MATCH=f'"{json_data["etag"]}"')
+
+            view = TestView.as_view()
+            response = view(request).render()
+
+            self.assertEqual(response.content, b'')
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response['ETag'], f'"{json_data["etag"]}"')
+
+    def test_etag__get__with_cache__if_none_match__outdated(self):
+        cache.clear()
+
+        cases = [[], [{'x': 1}], [{'x': 1}, {'x': 2}]]
+        for expected in cases:
+            json_data = serialize(expected)
+            cache.set(cache_key(), json_data)
+
+            request = APIRequestFactory()
+            request = request.get('/the-beans-should-not-have-sugar', HTTP_IF_NONE_MATCH='"outdated"')
+
+            view = TestView.as_view()
+            response = view(request).render()
+
+            self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response['ETag'], f'"{json_data["etag"]}"')
+
+    def test_etag__get__with_cache__keep_the_headers(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=10)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?limit=5&offset=0')
+
+        view = TestView.as_view()
+
+        response1 = view(request).render()
+        response2 = view(request).render()
+
+        self.assertEqual(response1.content, response2.content)
+        self.assertEqual(response2.status_code, status.HTTP_200_OK)
+
+        for header in ['ETag', 'Link', 'x-total-count']:
+            self.assertEqual(response1[header], response2[header])
+
+    """
+    🔽🔽🔽 Stale while revalidate
+    """
+
+    def test_swr__get__fresh_cache(self):
+        cache.clear()
+
+        self.bc.database.create(cohort=1)
+        expected = [{'x': 1}]
+        cache.set(cache_key(), serialize(expected))
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar')
+
+        view = StaleWhileRevalidateTestView.as_view()
+        response = view(request).render()
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(cache.get(lock_key()), None)
+
+    def test_swr__get__stale_cache__recompute_it(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=1)
+        cache.set(cache_key(), serialize([{'x': 1}], created_at=time.time() - 61))
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar')
+
+        view = StaleWhileRevalidateTestView.as_view()
+        response = view(request).render()
+        expected = GetCohortSerializer([model.cohort], many=True).data
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(decode(cache.get(cache_key())), expected)
+        self.assertEqual(decode(cache.get(stale_key())), expected)
+        self.assertEqual(cache.get(lock_key()), None)
+
+    def test_swr__get__stale_cache__locked__serve_the_stale_one(self):
+        cache.clear()
+
+        self.bc.database.create(cohort=1)
+        expected = [{'x': 1}]
+        cache.set(cache_key(), serialize(expected, created_at=time.time() - 61))
+        cache.set(lock_key(), 1)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar')
+
+        view = StaleWhileRevalidateTestView.as_view()
+        response = view(request).render()
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_swr__get__invalidated_cache__locked__serve_the_stale_one(self):
+        cache.clear()
+
+        self.bc.database.create(cohort=1)
+        expected = [{'x': 1}]
+        cache.set(stale_key(), serialize(expected))
+        cache.set(lock_key(), 1)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar')
+
+        view = StaleWhileRevalidateTestView.as_view()
+        response = view(request).render()
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @patch('breathecode.utils.api_view_extensions.extensions.cache_extension.time.sleep', MagicMock())
+    def test_swr__get__without_stale_cache__locked__compute_it_after_waiting(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=1)
+        cache.set(lock_key(), 1)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar')
+
+        view = StaleWhileRevalidateTestView.as_view()
+        response = view(request).render()
+        expected = GetCohortSerializer([model.cohort], many=True).data
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # it waited one second, the interval grew between the checks
+        intervals = [args[0] for args, _ in time.sleep.call_args_list]
+        self.assertEqual([round(x, 2) for x in intervals], [0.05, 0.1, 0.2, 0.4, 0.25])
+        self.assertAlmostEqual(sum(intervals), 1)
+
+    def test_swr__get__view_raises__release_the_lock(self):
+        cache.clear()
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar/1')
+
+        view = StaleWhileRevalidateTestView.as_view()
+        response = view(request, id=1).render()
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), {
+            'detail': 'Not found',
+            'status_code': 404,
+        })
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(cache.get(cache_key('id=1')), None)
+        self.assertEqual(cache.get(lock_key('id=1')), None)
+
+    def test_swr__get__response_not_cached__release_the_lock(self):
+        cache.clear()
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar')
+
+        view = StaleWhileRevalidateNotFoundTestView.as_view()
+        response = view(request).render()
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), {'detail': 'Not found'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(cache.get(cache_key()), None)
+        self.assertEqual(cache.get(lock_key()), None)
+
+    """
+    🔽🔽🔽 Canonical keys
+    """
+
+    def test_cache__get__params_in_other_order(self):
+        cache.clear()
+
+        self.bc.database.create(cohort=1)
+        expected = [{'x': 1}]
+        cache.set(cache_key('limit=10&offset=0'), serialize(expected))
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?offset=0&limit=10')
+
+        view = PaginateFalseTestView.as_view()
+        response = view(request).render()
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_cache__get__comma_list_in_other_order(self):
+        cache.clear()
+
+        self.bc.database.create(cohort=1)
+        expected = [{'x': 1}]
+        cache.set(cache_key('slug=a,b'), serialize(expected))
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?slug=b,a,b')
+
+        view = PaginateFalseTestView.as_view()
+        response = view(request).render()
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_cache__get__like_is_not_a_list(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=1)
+        cache.set(cache_key('like=a,b'), serialize([{'x': 1}]))
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?like=b,a')
+
+        view = PaginateFalseTestView.as_view()
+        response = view(request).render()
+        expected = GetCohortSerializer([model.cohort], many=True).data
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_cache__get__ignored_param(self):
+        cache.clear()
+
+        self.bc.database.create(cohort=1)
+        expected = [{'x': 1}]
+        cache.set(cache_key(), serialize(expected))
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?utm_source=newsletter')
+
+        view = CacheIgnoreTestView.as_view()
+        response = view(request).render()
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_cache__get__long_param__key_size(self):
+        cache.clear()
+
+        self.bc.database.create(cohort=1)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?like=' + 'x' * 1000)
+
+        view = PaginateFalseTestView.as_view()
+        view(request).render()
+
+        key = cache_key('like=' + 'x' * 1000)
+
+        self.assertLess(len(key), 64)
+        self.assertNotEqual(cache.get(key), None)
+
     """
     🔽🔽🔽 Sort
     """
@@ -753,6 +1126,236 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
         self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    """
+    🔽🔽🔽 Count
+    """
+
+    def test_pagination__get__count_false(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=10)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?limit=5&offset=0&count=false')
+
+        view = TestView.as_view()
+
+        response = view(request).render()
+        expected = {
+            'count': None,
+            'first': None,
+            'last': None,
+            'next': 'http://testserver/the-beans-should-not-have-sugar?count=false&limit=5&offset=5',
+            'previous': None,
+            'results': GetCohortSerializer(sorted(model.cohort, key=lambda x: x.name)[:5], many=True).data
+        }
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse('x-total-count' in response)
+
+    def test_pagination__get__count_false__last_page(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=10)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?limit=5&offset=5&count=false')
+
+        view = TestView.as_view()
+
+        response = view(request).render()
+
+        self.assertEqual(json.loads(response.content.decode('utf-8'))['next'], None)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @patch('breathecode.utils.count.EXACT_COUNT_THRESHOLD', 3)
+    def test_pagination__get__estimated_count(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=10)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?limit=5&offset=0&envelope=false')
+
+        view = TestView.as_view()
+
+        response = view(request).render()
+        expected = GetCohortSerializer(sorted(model.cohort, key=lambda x: x.name)[:5], many=True).data
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response['x-total-count'], '10')
+        self.assertEqual(response['x-total-count-estimated'], 'true')
+        self.assertEqual(
+            response['Link'],
+            '<http://testserver/the-beans-should-not-have-sugar?envelope=false&limit=5&offset=5>; '
+            'rel="next"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    """
+    🔽🔽🔽 Pagination cursor
+    """
+
+    def test_pagination__get__cursor__with_10_cohorts__get_first_five(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=10)
+        cohorts = sorted(model.cohort, key=lambda x: x.name)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?limit=5&paginate=cursor')
+
+        view = CursorTestView.as_view()
+
+        response = view(request).render()
+        cursor = encode_cursor(cohorts[4].name, cohorts[4].id)
+        expected = {
+            'count': None,
+            'first': None,
+            'last': None,
+            'next':
+            f'http://testserver/the-beans-should-not-have-sugar?cursor={cursor}&limit=5&paginate=cursor',
+            'previous': None,
+            'results': GetCohortSerializer(cohorts[:5], many=True).data
+        }
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse('x-total-count' in response)
+
+    def test_pagination__get__cursor__with_10_cohorts__get_last_five(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=10)
+        cohorts = sorted(model.cohort, key=lambda x: x.name)
+        cursor = encode_cursor(cohorts[4].name, cohorts[4].id)
+
+        request = APIRequestFactory()
+        request = request.get(f'/the-beans-should-not-have-sugar?limit=5&cursor={cursor}')
+
+        view = CursorTestView.as_view()
+
+        response = view(request).render()
+        expected = {
+            'count': None,
+            'first': 'http://testserver/the-beans-should-not-have-sugar?cursor=&limit=5',
+            'last': None,
+            'next': None,
+            'previous': None,
+            'results': GetCohortSerializer(cohorts[5:], many=True).data
+        }
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_pagination__get__cursor__with_count(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=10)
+        cohorts = sorted(model.cohort, key=lambda x: x.name)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?cursor=&limit=5&count=true&envelope=false')
+
+        view = CursorTestView.as_view()
+
+        response = view(request).render()
+        expected = GetCohortSerializer(cohorts[:5], many=True).data
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response['x-total-count'], '10')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_pagination__get__cursor__empty_cursor(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=10)
+        cohorts = sorted(model.cohort, key=lambda x: x.name)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?cursor=&limit=5')
+
+        view = CursorTestView.as_view()
+
+        response = view(request).render()
+        cursor = encode_cursor(cohorts[4].name, cohorts[4].id)
+        expected = {
+            'count': None,
+            'first': None,
+            'last': None,
+            'next': f'http://testserver/the-beans-should-not-have-sugar?cursor={cursor}&limit=5',
+            'previous': None,
+            'results': GetCohortSerializer(cohorts[:5], many=True).data
+        }
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_pagination__get__cursor__just_limit__paginated_by_offset(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=10)
+        cohorts = sorted(model.cohort, key=lambda x: x.name)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?limit=5')
+
+        view = CursorTestView.as_view()
+
+        response = view(request).render()
+        expected = {
+            'count': 10,
+            'first': None,
+            'last': 'http://testserver/the-beans-should-not-have-sugar?limit=5&offset=5',
+            'next': 'http://testserver/the-beans-should-not-have-sugar?limit=5&offset=5',
+            'previous': None,
+            'results': GetCohortSerializer(cohorts[:5], many=True).data
+        }
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response['x-total-count'], '10')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_pagination__get__cursor__with_offset(self):
+        cache.clear()
+
+        model = self.bc.database.create(cohort=10)
+        cohorts = sorted(model.cohort, key=lambda x: x.name)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?limit=5&offset=5')
+
+        view = CursorTestView.as_view()
+
+        response = view(request).render()
+        expected = {
+            'count': 10,
+            'first': 'http://testserver/the-beans-should-not-have-sugar?limit=5',
+            'last': None,
+            'next': None,
+            'previous': 'http://testserver/the-beans-should-not-have-sugar?limit=5',
+            'results': GetCohortSerializer(cohorts[5:], many=True).data
+        }
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_pagination__get__cursor__invalid_cursor(self):
+        cache.clear()
+
+        self.bc.database.create(cohort=1)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?limit=5&cursor=the-beans')
+
+        view = CursorTestView.as_view()
+
+        response = view(request).render()
+        expected = {'detail': 'invalid-cursor', 'status_code': 400}
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     """
     🔽🔽🔽 Pagination False
     """
@@ -821,6 +1424,116 @@ class ApiViewExtensionsGetTestSuite(UtilsTestCase):
         self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    """
+    🔽🔽🔽 Fields
+    """
+
+    def test_fields__get__without_fields(self):
+        model = self.bc.database.create(cohort=2)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar')
+
+        view = FieldsTestView.as_view()
+
+        response = view(request).render()
+        cohorts = sorted(model.cohort, key=lambda x: x.name)
+        expected = CohortFieldsSerializer(cohorts, many=True).data
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_fields__get__with_fields(self):
+        model = self.bc.database.create(cohort=2)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?fields=slug,id')
+
+        view = FieldsTestView.as_view()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = view(request).render()
+
+        cohorts = sorted(model.cohort, key=lambda x: x.name)
+        expected = [{'id': x.id, 'slug': x.slug} for x in cohorts]
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # the queryset was narrowed
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"admissions_cohort"."kickoff_date"', queries[0]['sql'])
+
+    def test_fields__get__with_fields__other_serializer(self):
+        model = self.bc.database.create(cohort=2)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?fields=id,stage')
+
+        view = BigFieldsTestView.as_view()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = view(request).render()
+
+        cohorts = sorted(model.cohort, key=lambda x: x.name)
+        expected = [{'id': x.id, 'stage': x.stage} for x in cohorts]
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # the field of the serializer used is loaded with the narrowed queryset
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"admissions_cohort"."stage"', queries[0]['sql'])
+        self.assertNotIn('"admissions_cohort"."kickoff_date"', queries[0]['sql'])
+
+    def test_fields__get__with_nested_fields(self):
+        model = self.bc.database.create(cohort=2)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?fields=id,academy.slug')
+
+        view = FieldsTestView.as_view()
+
+        response = view(request).render()
+        cohorts = sorted(model.cohort, key=lambda x: x.name)
+        expected = [{'id': x.id, 'academy': {'slug': model.academy.slug}} for x in cohorts]
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_fields__get__with_method_field(self):
+        model = self.bc.database.create(cohort=2)
+
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?fields=id,upper_name')
+
+        view = FieldsTestView.as_view()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = view(request).render()
+
+        cohorts = sorted(model.cohort, key=lambda x: x.name)
+        expected = [{'id': x.id, 'upper_name': x.name.upper()} for x in cohorts]
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # the method could read any field, it's not narrowed
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"admissions_cohort"."kickoff_date"', queries[0]['sql'])
+
+    def test_fields__get__with_invalid_fields(self):
+        request = APIRequestFactory()
+        request = request.get('/the-beans-should-not-have-sugar?fields=id,the_beans')
+
+        view = FieldsTestView.as_view()
+
+        response = view(request).render()
+        expected = {'detail': 'invalid-fields', 'status_code': 400}
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 class ApiViewExtensionsGetIdTestSuite(UtilsTestCase):
     """
@@ -863,8 +1576,7 @@ class ApiViewExtensionsGetIdTestSuite(UtilsTestCase):
 
         self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-
-        self.assertEqual(cohort_cache.keys(), [])
+        self.assertEqual(cache.get(cache_key('id=1')), None)
 
     def test_cache__get__without_cache__one_cohort(self):
         cache.clear()
@@ -882,17 +1594,15 @@ class ApiViewExtensionsGetIdTestSuite(UtilsTestCase):
         self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        self.assertEqual(cohort_cache.keys(), ['Cohort__id=1'])
-        self.assertEqual(cache.get('Cohort__id=1'), serialize_cache_value(expected))
+        self.assertEqual(decode(cache.get(cache_key('id=1'))), expected)
 
     def test_cache__get__with_cache(self):
         cache.clear()
 
         cases = [[], [{'x': 1}], [{'x': 1}, {'x': 2}]]
         for expected in cases:
-            json_data = json.dumps(expected)
-            cache.set('Cohort__keys', '["Cohort__id=1"]')
-            cache.set('Cohort__id=1', json_data)
+            json_data = serialize(expected)
+            cache.set(cache_key('id=1'), json_data)
 
             request = APIRequestFactory()
             request = request.get('/the-beans-should-not-have-sugar/1')
@@ -902,8 +1612,7 @@ class ApiViewExtensionsGetIdTestSuite(UtilsTestCase):
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(), ['Cohort__id=1'])
-            self.assertEqual(cache.get('Cohort__id=1'), serialize_cache_value(expected))
+            self.assertEqual(decode(cache.get(cache_key('id=1'))), expected)
 
     def test_cache__get__with_cache_but_other_case(self):
         cache.clear()
@@ -913,10 +1622,9 @@ class ApiViewExtensionsGetIdTestSuite(UtilsTestCase):
         slug = self.bc.fake.slug()
         model = self.bc.database.create(cohort={'slug': slug})
 
-        json_data = json.dumps(case)
-        cache.set('Cohort__', json_data)
-        cache.set('Cohort__id=2', json_data)
-        cache.set('Cohort__keys', '["Cohort__", "Cohort__id=2"]')
+        json_data = serialize(case)
+        cache.set(cache_key(), json_data)
+        cache.set(cache_key('id=2'), json_data)
 
         request = APIRequestFactory()
         request = request.get(f'/the-beans-should-not-have-sugar/1')
@@ -927,10 +1635,9 @@ class ApiViewExtensionsGetIdTestSuite(UtilsTestCase):
 
         self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(cohort_cache.keys(), ['Cohort__', 'Cohort__id=2', 'Cohort__id=1'])
-        self.assertEqual(cache.get('Cohort__'), serialize_cache_value(case))
-        self.assertEqual(cache.get('Cohort__id=1'), serialize_cache_value(expected))
-        self.assertEqual(cache.get('Cohort__id=2'), serialize_cache_value(case))
+        self.assertEqual(decode(cache.get(cache_key())), case)
+        self.assertEqual(decode(cache.get(cache_key('id=1'))), expected)
+        self.assertEqual(decode(cache.get(cache_key('id=2'))), case)
 
     def test_cache__get__with_cache_case_of_root_and_current(self):
         cache.clear()
@@ -942,22 +1649,19 @@ class ApiViewExtensionsGetIdTestSuite(UtilsTestCase):
             self.bc.database.delete('admissions.Cohort')
             model = self.bc.database.create(cohort={'slug': slug})
 
-            json_data_root = json.dumps(case[0])
-            json_data_query = json.dumps(case[1])
-            cache.set('Cohort__', json_data_root)
-            cache.set('Cohort__id=1', json_data_query)
-            cache.set('Cohort__keys', '["Cohort__", "Cohort__id=1"]')
+            json_data_root = serialize(case[0])
+            json_data_query = serialize(case[1])
+            cache.set(cache_key(), json_data_root)
+            cache.set(cache_key('id=1'), json_data_query)
 
             request = APIRequestFactory()
             request = request.get(f'/the-beans-should-not-have-sugar/1')
 
             view = TestView.as_view()
             response = view(request, id=1).render()
-            self.assertEqual(cohort_cache.keys(), ['Cohort__', 'Cohort__id=1'])
             expected = case[1]
 
             self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(cohort_cache.keys(), ['Cohort__', 'Cohort__id=1'])
-            self.assertEqual(cache.get('Cohort__'), json_data_root)
-            self.assertEqual(cache.get('Cohort__id=1'), json_data_query)
+            self.assertEqual(cache.get(cache_key()), json_data_root)
+            self.assertEqual(cache.get(cache_key('id=1')), json_data_query)
@@ -0,0 +1,92 @@
+import json
+from datetime import datetime
+from django.utils import timezone
+from breathecode.utils import JsonCacheCodec, OrjsonCacheCodec
+from ..mixins import UtilsTestCase
+
+UTC_NOW = timezone.now()
+CODECS = [JsonCacheCodec, OrjsonCacheCodec]
+
+
+class CacheCodecsTestSuite(UtilsTestCase):
+    """
+    🔽🔽🔽 Round trip
+    """
+
+    def test_encode__round_trip(self):
+        cases = [[], [{'x': 1}], {'x': 1, 'y': [{'z': None}]}, {'count': 1, 'results': [{'x': True}]}]
+
+        for Codec in CODECS:
+            codec = Codec()
+            for case in cases:
+                value = codec.encode(case)
+
+                self.assertTrue(isinstance(value, bytes))
+                self.assertEqual(codec.decode(value), case)
+
+    """
+    🔽🔽🔽 Datetimes
+    """
+
+    def test_encode__datetimes_to_iso(self):
+        for Codec in CODECS:
+            codec = Codec()
+            cases = [
+                ({
+                    'x': UTC_NOW
+                }, {
+                    'x': self.bc.datetime.to_iso_string(UTC_NOW)
+                }),
+                ([{
+                    'x': [UTC_NOW]
+                }], [{
+                    'x': [self.bc.datetime.to_iso_string(UTC_NOW)]
+                }]),
+                ({
+                    'results': [{
+                        'x': UTC_NOW
+                    }]
+                }, {
+                    'results': [{
+                        'x': self.bc.datetime.to_iso_string(UTC_NOW)
+                    }]
+                }),
+            ]
+
+            for data, expected in cases:
+                value = codec.encode(data)
+                self.assertEqual(codec.decode(value), expected)
+
+    """
+    🔽🔽🔽 Compression
+    """
+
+    def test_encode__compression(self):
+        data = [{'slug': self.bc.fake.slug(), 'index': x} for x in range(0, 1000)]
+
+        for Codec in CODECS:
+            compressed = Codec(compress_min_size=0)
+            uncompressed = Codec(compress_min_size=None)
+
+            compressed_value = compressed.encode(data)
+            uncompressed_value = uncompressed.encode(data)
+
+            self.assertEqual(compressed_value[:1], b'z')
+            self.assertEqual(uncompressed_value[:1], b'r')
+            self.assertLess(len(compressed_value), len(uncompressed_value))
+
+            self.assertEqual(compressed.decode(compressed_value), data)
+            self.assertEqual(compressed.decode(uncompressed_value), data)
+            self.assertEqual(uncompressed.decode(compressed_value), data)
+
+    """
+    🔽🔽🔽 Payloads stored as plain JSON
+    """
+
+    def test_decode__plain_json(self):
+        cases = [[], [{'x': 1}], {'x': 1}]
+
+        for Codec in CODECS:
+            codec = Codec()
+            for case in cases:
+                self.assertEqual(codec.decode(json.dumps(case)), case)
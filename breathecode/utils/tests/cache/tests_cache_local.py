@@ -0,0 +1,106 @@
+from unittest.mock import MagicMock, patch
+from django.core.cache import cache
+from breathecode.admissions.caches import CohortCache
+from breathecode.utils.cache import clear_local_cache
+from ..mixins import UtilsTestCase
+
+
+@patch.object(CohortCache, 'local_max_entries', 2)
+@patch.object(CohortCache, 'local_timeout', 60)
+class CacheLocalTierTestSuite(UtilsTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.bc.cache.clear()
+
+    """
+    🔽🔽🔽 Hits
+    """
+
+    def test_get__served_without_the_network(self):
+        descriptor = CohortCache()
+        descriptor.set([{'x': 1}], x=1)
+
+        with patch('django.core.cache.cache.get', MagicMock()) as mock:
+            self.assertEqual(descriptor.get(x=1), [{'x': 1}])
+            self.assertEqual(mock.call_args_list, [])
+
+    def test_get_response__served_without_the_network(self):
+        descriptor = CohortCache()
+        value = descriptor.set_response(b'[]', {}, x=1)
+
+        with patch('django.core.cache.cache.get', MagicMock()) as mock:
+            self.assertEqual(descriptor.get_response(x=1), value)
+            self.assertEqual(mock.call_args_list, [])
+
+    def test_get__filled_by_a_remote_hit(self):
+        descriptor = CohortCache()
+        key = descriptor.__generate_key__(x=1)
+        cache.set(key, descriptor.codec.encode([{'x': 1}]))
+
+        self.assertEqual(descriptor.get(x=1), [{'x': 1}])
+
+        with patch('django.core.cache.cache.get', MagicMock()) as mock:
+            self.assertEqual(descriptor.get(x=1), [{'x': 1}])
+            self.assertEqual(mock.call_args_list, [])
+
+    def test_stats__local_hits(self):
+        descriptor = CohortCache()
+        descriptor.set([{'x': 1}], x=1)
+
+        descriptor.get(x=1)
+        descriptor.get(x=1)
+
+        self.assertEqual(descriptor.stats()['hits'], 2)
+
+    """
+    🔽🔽🔽 Invalidation
+    """
+
+    def test_get__invalidated_in_this_process(self):
+        descriptor = CohortCache()
+        descriptor.set([{'x': 1}], x=1)
+        descriptor.clear()
+
+        self.assertEqual(descriptor.get(x=1), None)
+
+    def test_get__invalidated_in_other_process(self):
+        descriptor = CohortCache()
+        descriptor.set([{'x': 1}], x=1)
+
+        # other process bumps the generation without touching the local tier of this one
+        cache.set('Cohort__generation', descriptor.generation() + 1, timeout=None)
+
+        self.assertEqual(descriptor.get(x=1), [{'x': 1}])
+
+        with patch.object(CohortCache, 'local_timeout', 0):
+            self.assertEqual(descriptor.get(x=1), None)
+
+    def test_get__generation_evicted(self):
+        descriptor = CohortCache()
+        descriptor.set([{'x': 1}], x=1)
+        descriptor.clear()
+        descriptor.set([{'x': 2}], x=1)
+
+        # the generation is seeded again with a greater value, it can't go back to the one of the old entries
+        cache.delete('Cohort__generation')
+        clear_local_cache()
+
+        self.assertEqual(descriptor.get(x=1), None)
+
+    """
+    🔽🔽🔽 Max entries
+    """
+
+    def test_local_max_entries__evict_the_least_recently_used(self):
+        descriptor = CohortCache()
+
+        descriptor.set([1], x=1)
+        descriptor.set([2], x=2)
+        descriptor.get(x=1)
+        descriptor.set([3], x=3)
+
+        with patch('django.core.cache.cache.get', MagicMock(return_value=None)):
+            self.assertEqual(descriptor.get(x=1), [1])
+            self.assertEqual(descriptor.get(x=2), None)
+            self.assertEqual(descriptor.get(x=3), [3])
@@ -0,0 +1,169 @@
+from unittest.mock import MagicMock, call, patch
+from django.core.cache import cache
+from breathecode.admissions.caches import CohortCache
+from breathecode.utils import get_cache_stats
+from breathecode.utils.cache import STATS_FLUSH_INTERVAL
+from ..mixins import UtilsTestCase
+
+EMPTY_STATS = {'hits': 0, 'misses': 0, 'sets': 0, 'invalidations': 0, 'evictions': 0, 'bytes': 0}
+
+
+class CacheStatsTestSuite(UtilsTestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    """
+    🔽🔽🔽 Counters
+    """
+
+    def test_stats__empty(self):
+        self.assertEqual(CohortCache().stats(), EMPTY_STATS)
+
+    def test_stats__get_and_set(self):
+        descriptor = CohortCache()
+
+        descriptor.get(x=1)
+        descriptor.set([{'x': 1}], x=1)
+        descriptor.get(x=1)
+        descriptor.get(x=1)
+
+        value = cache.get(descriptor.__generate_key__(x=1))
+        self.assertEqual(descriptor.stats(), {
+            **EMPTY_STATS,
+            'hits': 2,
+            'misses': 1,
+            'sets': 1,
+            'bytes': len(value),
+        })
+
+    def test_stats__get_response_and_set_response(self):
+        descriptor = CohortCache()
+
+        descriptor.get_response(x=1)
+        value = descriptor.set_response(b'[]', {}, x=1)
+        descriptor.get_response(x=1)
+
+        self.assertEqual(descriptor.stats(), {
+            **EMPTY_STATS,
+            'hits': 1,
+            'misses': 1,
+            'sets': 1,
+            'bytes': len(value['content']),
+        })
+
+    def test_stats__invalidations(self):
+        descriptor = CohortCache()
+
+        descriptor.clear()
+        descriptor.clear()
+
+        self.assertEqual(descriptor.stats(), {**EMPTY_STATS, 'invalidations': 2})
+
+    def test_stats__reset(self):
+        descriptor = CohortCache()
+
+        descriptor.get(x=1)
+        descriptor.clear()
+        descriptor.reset_stats()
+
+        self.assertEqual(descriptor.stats(), EMPTY_STATS)
+
+    def test_get_cache_stats(self):
+        CohortCache().get(x=1)
+
+        stats = get_cache_stats()
+        names = [x['name'] for x in stats]
+
+        self.assertTrue('CohortCache' in names)
+        self.assertEqual([x for x in stats if x['name'] == 'CohortCache'][0], {
+            'name': 'CohortCache',
+            **EMPTY_STATS,
+            'misses': 1,
+        })
+
+    """
+    🔽🔽🔽 Counters batched in the process
+    """
+
+    def test_stats__batched__not_flushed(self):
+        descriptor = CohortCache()
+
+        descriptor.get(x=1)
+        descriptor.get(x=1)
+
+        self.assertEqual(cache.get('Cohort__stats__misses'), None)
+        self.assertEqual(descriptor.stats(), {**EMPTY_STATS, 'misses': 2})
+        self.assertEqual(cache.get('Cohort__stats__misses'), 2)
+
+    def test_stats__batched__flushed_after_the_interval(self):
+        descriptor = CohortCache()
+
+        with patch('time.monotonic', MagicMock(return_value=1000)):
+            descriptor.get(x=1)
+
+        with patch('time.monotonic', MagicMock(return_value=1000 + STATS_FLUSH_INTERVAL)):
+            descriptor.get(x=1)
+
+        self.assertEqual(cache.get('Cohort__stats__misses'), 2)
+
+    """
+    🔽🔽🔽 Timeout
+    """
+
+    @patch('django.core.cache.cache.set', MagicMock())
+    def test_timeout(self):
+        descriptor = CohortCache()
+
+        with patch.object(CohortCache, 'timeout', 30):
+            descriptor.set([], x=1)
+
+        key = descriptor.__generate_key__(x=1)
+        self.assertEqual(cache.set.call_args_list, [call(key, descriptor.codec.encode([]), timeout=30)])
+
+    """
+    🔽🔽🔽 Max entries
+    """
+
+    @patch.object(CohortCache, 'max_entries', 2)
+    def test_max_entries__evict_the_least_recently_used(self):
+        descriptor = CohortCache()
+
+        descriptor.set([1], x=1)
+        descriptor.set([2], x=2)
+        descriptor.get(x=1)
+        descriptor.set([3], x=3)
+
+        self.assertEqual(descriptor.get(x=1), [1])
+        self.assertEqual(descriptor.get(x=2), None)
+        self.assertEqual(descriptor.get(x=3), [3])
+        self.assertEqual(descriptor.stats()['evictions'], 1)
+
+    @patch.object(CohortCache, 'max_entries', 2)
+    @patch.object(CohortCache, 'timeout', 30)
+    def test_max_entries__redis__evict_the_least_recently_used(self):
+        redis = MagicMock()
+        redis.pipeline.return_value.execute.return_value = [1, 3, True]
+        descriptor = CohortCache()
+        generation = descriptor.generation()
+
+        redis.zpopmin.return_value = [(f'Cohort__v{generation}__old'.encode('utf-8'), 1.0)]
+        cache.set(f'Cohort__v{generation}__old', 'old')
+
+        with patch('breathecode.utils.cache._get_redis', MagicMock(return_value=redis)):
+            descriptor.set([3], x=3)
+
+        index_key = cache.make_key(f'Cohort__v{generation}__entries')
+        key = descriptor.__generate_key__(x=3)
+        pipeline = redis.pipeline.return_value
+
+        # the score is the time of the last use
+        self.assertEqual([(x[0][0], list(x[0][1])) for x in pipeline.zadd.call_args_list],
+                         [(index_key, [key])])
+        self.assertEqual(pipeline.zcard.call_args_list, [call(index_key)])
+        self.assertEqual(pipeline.expire.call_args_list, [call(index_key, 30)])
+        self.assertEqual(redis.zpopmin.call_args_list, [call(index_key, 1)])
+        self.assertEqual(cache.get(f'Cohort__v{generation}__old'), None)
+        self.assertEqual(descriptor.get(x=3), [3])
+        self.assertEqual(descriptor.stats()['evictions'], 1)
@@ -314,3 +314,120 @@ class ViewTestSuite(UtilsTestCase):
 
         self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class CapabilitiesCacheTestSuite(UtilsTestCase):
+    """
+    🔽🔽🔽 Cache
+    """
+
+    def test_capable_of__cache__second_request_does_not_query_the_capabilities(self):
+        model = self.bc.database.create(user=1,
+                                        academy=1,
+                                        profile_academy=1,
+                                        role=1,
+                                        capability='can_kill_kenny')
+
+        view = TestView.as_view()
+
+        for _ in range(2):
+            request = APIRequestFactory()
+            request = request.get('/they-killed-kenny', HTTP_ACADEMY=1)
+            force_authenticate(request, user=model.user)
+
+            with self.assertNumQueries(1 if _ == 0 else 0):
+                response = view(request, id=1).render()
+
+            self.assertEqual(json.loads(response.content.decode('utf-8')), {'id': 1, 'academy_id': 1})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_capable_of__cache__capability_removed_from_the_role(self):
+        model = self.bc.database.create(user=1,
+                                        academy=1,
+                                        profile_academy=1,
+                                        role=1,
+                                        capability='can_kill_kenny')
+
+        view = TestView.as_view()
+
+        request = APIRequestFactory()
+        request = request.get('/they-killed-kenny', HTTP_ACADEMY=1)
+        force_authenticate(request, user=model.user)
+
+        response = view(request, id=1).render()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        model.role.capabilities.remove(model.capability)
+
+        request = APIRequestFactory()
+        request = request.get('/they-killed-kenny', HTTP_ACADEMY=1)
+        force_authenticate(request, user=model.user)
+
+        response = view(request, id=1).render()
+        expected = {
+            'detail': "You (user: 1) don't have this capability: can_kill_kenny for academy 1",
+            'status_code': 403
+        }
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_capable_of__cache__academy_deleted(self):
+        model = self.bc.database.create(user=1,
+                                        academy=1,
+                                        profile_academy=1,
+                                        role=1,
+                                        capability='can_kill_kenny')
+
+        view = TestView.as_view()
+
+        request = APIRequestFactory()
+        request = request.get('/they-killed-kenny', HTTP_ACADEMY=1)
+        force_authenticate(request, user=model.user)
+
+        response = view(request, id=1).render()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        model.academy.status = 'DELETED'
+        model.academy.save()
+
+        request = APIRequestFactory()
+        request = request.get('/they-killed-kenny', HTTP_ACADEMY=1)
+        force_authenticate(request, user=model.user)
+
+        response = view(request, id=1).render()
+        expected = {'detail': 'This academy is deleted', 'status_code': 403}
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_capable_of__cache__profile_academy_deleted(self):
+        model = self.bc.database.create(user=1,
+                                        academy=1,
+                                        profile_academy=1,
+                                        role=1,
+                                        capability='can_kill_kenny')
+
+        view = TestView.as_view()
+
+        request = APIRequestFactory()
+        request = request.get('/they-killed-kenny', HTTP_ACADEMY=1)
+        force_authenticate(request, user=model.user)
+
+        response = view(request, id=1).render()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        model.profile_academy.delete()
+
+        request = APIRequestFactory()
+        request = request.get('/they-killed-kenny', HTTP_ACADEMY=1)
+        force_authenticate(request, user=model.user)
+
+        response = view(request, id=1).render()
+        expected = {
+            'detail': "You (user: 1) don't have this capability: can_kill_kenny for academy 1",
+            'status_code': 403
+        }
+
+        self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -879,3 +879,52 @@ class ViewTestSuite(UtilsTestCase):
 
         self.assertEqual(json.loads(response.content.decode('utf-8')), expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class PermissionsCacheTestSuite(UtilsTestCase):
+    """
+    🔽🔽🔽 Cache
+    """
+
+    def test_get_user_permissions__second_call_does_not_query_the_database(self):
+        permission = {'codename': PERMISSION}
+        model = self.bc.database.create(user=1, permission=permission)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(decorators.get_user_permissions(model.user), {PERMISSION})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(decorators.get_user_permissions(model.user), {PERMISSION})
+
+    def test_get_user_permissions__permission_removed_from_the_user(self):
+        permission = {'codename': PERMISSION}
+        model = self.bc.database.create(user=1, permission=permission)
+
+        self.assertEqual(decorators.get_user_permissions(model.user), {PERMISSION})
+
+        model.user.user_permissions.remove(model.permission)
+
+        self.assertEqual(decorators.get_user_permissions(model.user), set())
+
+    def test_get_user_permissions__user_removed_from_the_group(self):
+        user = {'user_permissions': []}
+        permissions = [{}, {'codename': PERMISSION}]
+        group = {'permission_id': 2}
+        model = self.bc.database.create(user=user, permission=permissions, group=group)
+
+        # just through the group
+        model.user.user_permissions.clear()
+
+        self.assertIn(PERMISSION, decorators.get_user_permissions(model.user))
+
+        model.user.groups.remove(model.group)
+
+        self.assertEqual(decorators.get_user_permissions(model.user), set())
+
+    def test_user_has_permissions(self):
+        permissions = [{'codename': PERMISSION}, {'codename': 'can_revive_kenny'}]
+        model = self.bc.database.create(user=1, permission=permissions)
+
+        self.assertTrue(decorators.user_has_permissions(model.user, [PERMISSION, 'can_revive_kenny']))
+        self.assertFalse(decorators.user_has_permissions(model.user, [PERMISSION, 'can_kill_cartman']))
+        self.assertTrue(decorators.user_has_permissions(model.user, []))
@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock
+from django.contrib.auth.models import AnonymousUser
+from breathecode.admissions.models import Cohort
+from breathecode.utils import localize_query
+from ..mixins import UtilsTestCase
+
+
+class LocalizeQueryTestSuite(UtilsTestCase):
+    """
+    🔽🔽🔽 Anonymous user
+    """
+
+    def test_localize_query__anonymous_user(self):
+        request = MagicMock(user=AnonymousUser())
+
+        self.assertEqual(localize_query(Cohort.objects.all(), request), None)
+
+    """
+    🔽🔽🔽 With user
+    """
+
+    def test_localize_query__with_user__one_round_trip(self):
+        model = self.bc.database.create(user=1, cohort=2, profile_academy=1)
+        request = MagicMock(user=model.user)
+
+        # the academies are not fetched before the cohorts
+        with self.assertNumQueries(0):
+            items = localize_query(Cohort.objects.all(), request)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(list(items), model.cohort)
+
+    def test_localize_query__with_user__from_other_academy(self):
+        model = self.bc.database.create(user=1, cohort=2, academy=2, profile_academy={'academy_id': 2})
+        request = MagicMock(user=model.user)
+
+        items = localize_query(Cohort.objects.all(), request)
+
+        self.assertEqual(list(items), [])
+
+    def test_localize_query__with_matcher(self):
+        model = self.bc.database.create(user=1, cohort=1, profile_academy=1)
+        request = MagicMock(user=model.user)
+
+        items = localize_query(Cohort.objects.all(), request, matcher='academy__in')
+
+        self.assertEqual(list(items), [model.cohort])
@@ -0,0 +1,36 @@
+from unittest.mock import MagicMock, call, patch
+from breathecode.activity.models import Activity
+from breathecode.services.google_cloud import Datastore
+from breathecode.utils import NDB
+from google.cloud.ndb.query import OR
+from ..mixins import UtilsTestCase
+
+
+class NDBTestSuite(UtilsTestCase):
+    """
+    🔽🔽🔽 Count
+    """
+
+    @patch('breathecode.utils.ndb.get_ndb_client', MagicMock())
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'count', MagicMock(return_value=15))
+    def test_count__with_equality_filters(self):
+        client = NDB(Activity)
+
+        self.assertEqual(client.count([Activity.slug == 'breathecode_login', Activity.cohort == 'miami']), 15)
+        self.assertEqual(Datastore.count.call_args_list, [
+            call(kind='student_activity', slug='breathecode_login', cohort='miami'),
+        ])
+
+    @patch('breathecode.utils.ndb.get_ndb_client', MagicMock())
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'count', MagicMock(return_value=15))
+    def test_count__with_or(self):
+        client = NDB(Activity)
+
+        with patch.object(Activity, 'query') as query:
+            query.return_value.filter.return_value.count.return_value = 4
+            count = client.count([OR(Activity.slug == 'breathecode_login', Activity.slug == 'lesson_opened')])
+
+        self.assertEqual(count, 4)
+        self.assertEqual(Datastore.count.call_args_list, [])
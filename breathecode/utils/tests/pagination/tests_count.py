@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock, patch
+from breathecode.admissions.models import Cohort
+from breathecode.utils import count_queryset
+from ..mixins import UtilsTestCase
+
+
+class CountTestSuite(UtilsTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.bc.cache.clear()
+
+    """
+    🔽🔽🔽 Exact
+    """
+
+    def test_count_queryset__below_the_threshold(self):
+        self.bc.database.create(cohort=3)
+
+        self.assertEqual(count_queryset(Cohort.objects.all(), threshold=3), (3, False))
+        self.assertEqual(count_queryset(Cohort.objects.filter(id__in=[1, 2]), threshold=3), (2, False))
+
+    """
+    🔽🔽🔽 Estimated
+    """
+
+    def test_count_queryset__above_the_threshold__cached(self):
+        self.bc.database.create(cohort=3)
+
+        self.assertEqual(count_queryset(Cohort.objects.all(), threshold=2), (3, True))
+
+        self.bc.database.create(cohort=1)
+
+        # the count of the large querysets is reused for a short time
+        self.assertEqual(count_queryset(Cohort.objects.all(), threshold=2), (3, True))
+        self.assertEqual(count_queryset(Cohort.objects.all(), threshold=10), (4, False))
+
+    @patch('breathecode.utils.count._planner_estimate', MagicMock(return_value=1000))
+    def test_count_queryset__above_the_threshold__postgresql(self):
+        self.bc.database.create(cohort=3)
+
+        with patch('django.db.backends.sqlite3.base.DatabaseWrapper.vendor', 'postgresql'):
+            self.assertEqual(count_queryset(Cohort.objects.all(), threshold=2), (1000, True))
+
+    def test_count_queryset__above_the_threshold__postgresql__explain_fails(self):
+        self.bc.database.create(cohort=3)
+
+        # sqlite does not support this EXPLAIN, it falls back to the exact count
+        with patch('django.db.backends.sqlite3.base.DatabaseWrapper.vendor', 'postgresql'):
+            self.assertEqual(count_queryset(Cohort.objects.all(), threshold=2), (3, True))
+
+        # the transaction can be used after the error
+        self.assertEqual(Cohort.objects.count(), 3)
@@ -0,0 +1,66 @@
+from datetime import timedelta
+from django.utils import timezone
+from breathecode.admissions.models import Cohort
+from breathecode.utils import ValidationException, decode_cursor, encode_cursor, paginate_by_cursor
+from ..mixins import UtilsTestCase
+
+UTC_NOW = timezone.now()
+
+
+class CursorPaginationTestSuite(UtilsTestCase):
+    """
+    🔽🔽🔽 Cursors
+    """
+
+    def test_encode_cursor__round_trip(self):
+        cases = [(1, 1), ('a,b', 2), (None, 3)]
+
+        for value, pk in cases:
+            cursor = encode_cursor(value, pk)
+
+            self.assertTrue('=' not in cursor)
+            self.assertEqual(decode_cursor(cursor), (value, pk))
+
+    def test_encode_cursor__datetime_keep_the_microseconds(self):
+        cursor = encode_cursor(UTC_NOW, 1)
+        self.assertEqual(decode_cursor(cursor), (UTC_NOW.isoformat(), 1))
+
+    def test_decode_cursor__invalid(self):
+        with self.assertRaisesMessage(ValidationException, 'invalid-cursor'):
+            decode_cursor('the-beans')
+
+    """
+    🔽🔽🔽 Paginate
+    """
+
+    def test_paginate_by_cursor__descending_datetimes__with_ties(self):
+        # two cohorts share each datetime, the pk breaks the ties
+        cohorts = [{'kickoff_date': UTC_NOW - timedelta(days=n // 2)} for n in range(0, 7)]
+        model = self.bc.database.create(cohort=cohorts)
+
+        queryset = Cohort.objects.order_by('-kickoff_date')
+        expected = sorted(model.cohort, key=lambda x: (x.kickoff_date, x.id), reverse=True)
+
+        pages = []
+        cursor = None
+        while True:
+            items, cursor = paginate_by_cursor(queryset, cursor, 3)
+            pages.append([x.id for x in items])
+
+            if cursor is None:
+                break
+
+        self.assertEqual(pages, [[x.id for x in expected[n:n + 3]] for n in range(0, 7, 3)])
+
+    def test_paginate_by_cursor__ascending_with_nulls(self):
+        cohorts = [{'ending_date': None}, {'ending_date': UTC_NOW}, {'ending_date': None}]
+        model = self.bc.database.create(cohort=cohorts)
+
+        queryset = Cohort.objects.order_by('ending_date')
+
+        items1, cursor = paginate_by_cursor(queryset, None, 2)
+        items2, last_cursor = paginate_by_cursor(queryset, cursor, 2)
+
+        self.assertEqual([x.id for x in items1], [model.cohort[1].id, model.cohort[0].id])
+        self.assertEqual([x.id for x in items2], [model.cohort[2].id])
+        self.assertEqual(last_cursor, None)
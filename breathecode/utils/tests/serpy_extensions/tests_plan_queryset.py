@@ -0,0 +1,75 @@
+import serpy
+from breathecode.admissions.models import Cohort
+from breathecode.admissions.serializers import GetCohortSerializer
+from breathecode.utils import SerpyExtensions, get_related_lookups, plan_queryset
+from ..mixins import UtilsTestCase
+
+
+class TimeSlotSerializer(serpy.Serializer):
+    id = serpy.Field()
+
+
+class CohortSerializer(serpy.Serializer):
+    id = serpy.Field()
+    timeslots = TimeSlotSerializer(attr='cohorttimeslot_set.all', call=True, many=True)
+    syllabus = SerpyExtensions.MethodField(select_related=['syllabus_version__syllabus'])
+    upper_name = serpy.MethodField()
+
+    def get_syllabus(self, obj):
+        return obj.syllabus_version.syllabus.id if obj.syllabus_version else None
+
+    def get_upper_name(self, obj):
+        return obj.name.upper()
+
+
+class PlanQuerysetTestSuite(UtilsTestCase):
+    """
+    🔽🔽🔽 get_related_lookups
+    """
+
+    def test_get_related_lookups__nested_serializers_and_methods(self):
+        result = get_related_lookups(GetCohortSerializer, Cohort)
+        expected = (
+            [
+                'schedule',
+                'schedule__syllabus',
+                'syllabus_version',
+                'syllabus_version__syllabus',
+                'academy',
+                'academy__country',
+                'academy__city',
+            ],
+            ['cohorttimeslot_set'],
+        )
+
+        self.assertEqual(result, expected)
+
+    def test_get_related_lookups__many_relation(self):
+        result = get_related_lookups(CohortSerializer, Cohort)
+        expected = (['syllabus_version__syllabus'], ['cohorttimeslot_set'])
+
+        self.assertEqual(result, expected)
+
+    """
+    🔽🔽🔽 plan_queryset
+    """
+
+    def test_plan_queryset__the_queries_do_not_grow_with_the_rows(self):
+        model = self.bc.database.create(cohort=3,
+                                        cohort_time_slot=[{
+                                            'cohort_id': n
+                                        } for n in range(1, 4)],
+                                        syllabus_version=1,
+                                        syllabus_schedule=1,
+                                        country=1,
+                                        city=1)
+
+        queryset = plan_queryset(Cohort.objects.all(), GetCohortSerializer)
+
+        # the cohorts with its relations and the timeslots
+        data = self.bc.check.queries(2, lambda: GetCohortSerializer(queryset, many=True).data)
+
+        self.assertEqual(len(data), 3)
+        self.assertEqual([x['academy']['id'] for x in data], [model.academy.id] * 3)
+        self.assertEqual([len(x['timeslots']) for x in data], [1, 1, 1])
+        self.assertEqual([x['syllabus_version']['syllabus'] for x in data], [model.syllabus.id] * 3)
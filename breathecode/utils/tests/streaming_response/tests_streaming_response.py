@@ -0,0 +1,214 @@
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock, patch
+import serpy
+from asgiref.sync import async_to_sync
+from django.core.handlers.asgi import ASGIHandler as BaseASGIHandler
+from django.test import AsyncRequestFactory
+from rest_framework_csv.renderers import CSVRenderer
+from breathecode.admissions.models import Cohort
+from breathecode.utils import (ASYNC_STREAMING_SCOPE_KEY, ASGIHandler, AsyncStreamingHttpResponse,
+                               get_csv_header, streaming_response)
+from breathecode.utils.streaming_response import _aiter_content
+from ..mixins import UtilsTestCase
+
+
+class AcademySerializer(serpy.Serializer):
+    slug = serpy.Field()
+
+
+class CohortSerializer(serpy.Serializer):
+    id = serpy.Field()
+    slug = serpy.Field()
+    academy = AcademySerializer()
+
+
+class CohortWithMethodFieldSerializer(serpy.Serializer):
+    id = serpy.Field()
+    academy = serpy.MethodField()
+
+    # the first row does not have the nested columns
+    def get_academy(self, obj):
+        return {'slug': obj.academy.slug} if obj.id % 2 == 0 else None
+
+
+def read(response):
+    return b''.join(response.streaming_content)
+
+
+@async_to_sync
+async def aread(response):
+    return [x async for x in response.streaming_content]
+
+
+class StreamingResponseTestSuite(UtilsTestCase):
+    """
+    🔽🔽🔽 JSON
+    """
+
+    def test_streaming_response__json__without_rows(self):
+        request = MagicMock(accepted_renderer=None)
+
+        response = streaming_response(request, Cohort.objects.all(), CohortSerializer)
+
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(read(response), b'[]')
+
+    def test_streaming_response__json__in_chunks(self):
+        model = self.bc.database.create(cohort=3)
+        request = MagicMock(accepted_renderer=None)
+
+        response = streaming_response(request, Cohort.objects.order_by('id'), CohortSerializer, chunk_size=2)
+
+        # the queryset is not read until the response is sent, the academies are joined
+        with self.assertNumQueries(1):
+            chunks = list(response.streaming_content)
+
+        # the brackets and two chunks
+        self.assertEqual(len(chunks), 4)
+
+        expected = [{
+            'id': x.id,
+            'slug': x.slug,
+            'academy': {
+                'slug': model.academy.slug
+            },
+        } for x in model.cohort]
+        self.assertEqual(json.loads(b''.join(chunks)), expected)
+
+    def test_streaming_response__json__asgi(self):
+        model = self.bc.database.create(cohort=3)
+        # the scope of the requests sent by breathecode.asgi
+        request = AsyncRequestFactory(**{ASYNC_STREAMING_SCOPE_KEY: True}).get('/v1/admissions/cohort/all')
+        request.accepted_renderer = None
+
+        # the queryset is not read until the response is sent
+        with self.assertNumQueries(0):
+            response = streaming_response(request,
+                                          Cohort.objects.order_by('id'),
+                                          CohortSerializer,
+                                          chunk_size=2)
+
+        self.assertTrue(response.streaming)
+        self.assertIsInstance(response, AsyncStreamingHttpResponse)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+        # each chunk is fetched outside of the event loop
+        with self.assertNumQueries(1):
+            chunks = aread(response)
+
+        # the brackets and two chunks
+        self.assertEqual(len(chunks), 4)
+
+        expected = [{
+            'id': x.id,
+            'slug': x.slug,
+            'academy': {
+                'slug': model.academy.slug
+            },
+        } for x in model.cohort]
+        self.assertEqual(json.loads(b''.join(chunks)), expected)
+
+    def test_streaming_response__json__asgi__without_async_streaming(self):
+        model = self.bc.database.create(cohort=3)
+        request = AsyncRequestFactory().get('/v1/admissions/cohort/all')
+        request.accepted_renderer = None
+
+        # the handler can't send an async iterator, the queryset is read before returning
+        with self.assertNumQueries(1):
+            response = streaming_response(request,
+                                          Cohort.objects.order_by('id'),
+                                          CohortSerializer,
+                                          chunk_size=2)
+
+        expected = [{
+            'id': x.id,
+            'slug': x.slug,
+            'academy': {
+                'slug': model.academy.slug
+            },
+        } for x in model.cohort]
+
+        self.assertFalse(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content), expected)
+
+    """
+    🔽🔽🔽 ASGI handler
+    """
+
+    def test_asgi_handler__concurrent_requests__each_one_in_its_own_thread(self):
+        threads = {}
+        sent = []
+
+        def content(path):
+            for _ in range(3):
+                threads.setdefault(path, set()).add(threading.get_ident())
+                yield b'x'
+
+        # the body of the requests is streamed like the one of streaming_response
+        async def handle(self, scope, receive, send):
+            async for part in _aiter_content(content(scope['path'])):
+                await send({'path': scope['path'], 'body': part})
+
+        async def send(message):
+            sent.append(message)
+
+        async def main():
+            handler = ASGIHandler()
+            await asyncio.gather(*[handler({'type': 'http', 'path': f'/{n}'}, None, send) for n in range(2)])
+
+        with patch.object(BaseASGIHandler, '__call__', handle):
+            asyncio.run(main())
+
+        self.assertEqual(len(sent), 6)
+
+        # the chunks of a request are fetched in the same thread, it's not shared with the other request
+        self.assertEqual([len(threads['/0']), len(threads['/1'])], [1, 1])
+        self.assertNotEqual(threads['/0'], threads['/1'])
+
+    """
+    🔽🔽🔽 CSV
+    """
+
+    def test_streaming_response__csv(self):
+        model = self.bc.database.create(cohort=2)
+        request = MagicMock(accepted_renderer=CSVRenderer())
+
+        response = streaming_response(request, Cohort.objects.order_by('id'), CohortSerializer, chunk_size=1)
+
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+
+        expected = ''.join([
+            'academy.slug,id,slug\r\n',
+            *[f'{model.academy.slug},{x.id},{x.slug}\r\n' for x in model.cohort],
+        ])
+        self.assertEqual(read(response).decode('utf-8'), expected)
+
+    def test_streaming_response__csv__header_of_the_serializer(self):
+        model = self.bc.database.create(cohort=2)
+        request = MagicMock(accepted_renderer=CSVRenderer())
+        csv_header = get_csv_header(CohortWithMethodFieldSerializer, nested={'academy': AcademySerializer})
+
+        response = streaming_response(request,
+                                      Cohort.objects.order_by('id'),
+                                      CohortWithMethodFieldSerializer,
+                                      chunk_size=1,
+                                      csv_header=csv_header)
+
+        self.assertEqual(csv_header, ['academy.slug', 'id'])
+
+        expected = ''.join([
+            'academy.slug,id\r\n',
+            *[f'{model.academy.slug if x.id % 2 == 0 else ""},{x.id}\r\n' for x in model.cohort],
+        ])
+        self.assertEqual(read(response).decode('utf-8'), expected)
+
+    """
+    🔽🔽🔽 Header
+    """
+
+    def test_get_csv_header(self):
+        self.assertEqual(get_csv_header(CohortSerializer), ['academy.slug', 'id', 'slug'])
+        self.assertEqual(get_csv_header(CohortWithMethodFieldSerializer), ['academy', 'id'])
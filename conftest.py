@@ -28,6 +28,25 @@ def clean_environment(monkeypatch):
     test_environment()
 
 
+@pytest.fixture(autouse=True)
+def clean_cache():
+    from django.core.cache import cache
+    from breathecode.utils.cache import clear_local_cache
+
+    # the shared cache and the local tier survive between tests but the rollback of the database does not
+    # invalidate them
+    cache.clear()
+    clear_local_cache()
+
+
+@pytest.fixture(autouse=True)
+def clean_google_cloud_clients():
+    from breathecode.services.google_cloud.clients import clear_clients
+
+    # the clients are shared by the process, each test patches them on its own way
+    clear_clients()
+
+
 @pytest.fixture()
 def random_image(fake):
 
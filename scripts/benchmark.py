@@ -0,0 +1,26 @@
+#!/bin/env python
+
+from __future__ import absolute_import
+import os
+import sys
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+
+    # store the new baselines instead of comparing with them
+    if '--update' in args:
+        args.remove('--update')
+        os.environ['BENCHMARK_UPDATE'] = 'TRUE'
+
+    # compare the latency too, the baselines must be measured in this machine
+    if '--duration' in args:
+        args.remove('--duration')
+        os.environ['BENCHMARK_DURATION'] = 'TRUE'
+
+    args = ' '.join(args)
+    exit_code = os.system('pytest breathecode/benchmarks -o python_files=benchmarks_*.py '
+                          f'--disable-pytest-warnings --nomigrations {args}')
+
+    # python don't return 256
+    if exit_code:
+        sys.exit(1)